@@ -128,6 +128,9 @@ python3 ../scripts/time_required_calculation.py \
 	-qhltenv="QHL_TIME" \
 	-fqhltenv="FQHL_TIME" \
 	-num_proc_env="NUM_PROCESSES" \
+	-rqtenv="RQ_TIMEOUT" \
+	-dir=$this_run_directory \
+	-hist=$running_dir/results \
 	-mintime=$min_time_to_request
 
 source $time_required_script
@@ -135,6 +138,7 @@ qmla_time=$QMLA_TIME
 qhl_time=$QHL_TIME
 fqhl_time=$FQHL_TIME
 num_processes=$NUM_PROCESSES
+rq_timeout=$RQ_TIMEOUT
 
 # Change requested time. e.g. if running QHL , don't need as many nodes. 
 if (( "$run_qhl" == 1 )) 
@@ -180,7 +184,7 @@ do
 	this_error_file="$output_dir/error_$qmla_id.txt"
 	this_output_file="$output_dir/output_$qmla_id.txt"
 
-	qsub -v RUNNING_DIR=$running_dir,LIBRARY_DIR=$lib_dir,SCRIPT_DIR=$script_dir,ROOT_DIR=$qmla_dir,QMLA_ID=$qmla_id,RUN_QHL=$run_qhl,RUN_QHL_MULTI_MODEL=$run_qhl_multi_model,FIGURE_FORMAT=$figure_format,FURTHER_QHL=0,RESULTS_DIR=$this_run_directory,DATETIME=$day_time,NUM_PARTICLES=$particles,NUM_EXPERIMENTS=$experiments,PICKLE_INSTANCE=$pickle_instances,BAYES_CSV=$bayes_csv,EXPLORATION_STRATEGY=$exploration_strategy,MULTIPLE_EXPLORATION_STRATEGIES=$multiple_exploration_strategies,ALT_ES="$exploration_strategies_command",LATEX_MAP_FILE=$latex_mapping_file,RUN_INFO_FILE=$run_info_file,SYS_MEAS_FILE=$system_measurements_file,PLOT_PROBES_FILE=$plot_probe_file,PLOT_LEVEL=$plot_level,DEBUG=$debug_mode -N $this_qmla_name -l $node_req,$time -o $this_output_file -e $this_error_file run_single_qmla_instance.sh
+	qsub -v RUNNING_DIR=$running_dir,LIBRARY_DIR=$lib_dir,SCRIPT_DIR=$script_dir,ROOT_DIR=$qmla_dir,QMLA_ID=$qmla_id,RUN_QHL=$run_qhl,RUN_QHL_MULTI_MODEL=$run_qhl_multi_model,FIGURE_FORMAT=$figure_format,FURTHER_QHL=0,RESULTS_DIR=$this_run_directory,DATETIME=$day_time,NUM_PARTICLES=$particles,NUM_EXPERIMENTS=$experiments,PICKLE_INSTANCE=$pickle_instances,BAYES_CSV=$bayes_csv,EXPLORATION_STRATEGY=$exploration_strategy,MULTIPLE_EXPLORATION_STRATEGIES=$multiple_exploration_strategies,ALT_ES="$exploration_strategies_command",LATEX_MAP_FILE=$latex_mapping_file,RUN_INFO_FILE=$run_info_file,SYS_MEAS_FILE=$system_measurements_file,PLOT_PROBES_FILE=$plot_probe_file,PLOT_LEVEL=$plot_level,DEBUG=$debug_mode,RQ_TIMEOUT=$rq_timeout -N $this_qmla_name -l $node_req,$time -o $this_output_file -e $this_error_file run_single_qmla_instance.sh
 
 done
 echo "Launched $num_instances instances."
@@ -81,6 +81,7 @@ mpirun --display-map --tag-output \
 	-pl=$PLOT_LEVEL \
 	-ff=$FIGURE_FORMAT \
 	-debug=$DEBUG \
+	-rqt=${RQ_TIMEOUT:--1} \
 	-es=$EXPLORATION_STRATEGY \
 	$ALT_ES \
 	> $RESULTS_DIR/output_and_error_logs/profile_$QMLA_ID.txt \
@@ -1,27 +1,89 @@
 from __future__ import absolute_import
 
-# QuantumModelLearningAgent
-from qmla.quantum_model_learning_agent import *
+import qmla.lazy_loading
 
-# Logistics
-from qmla.get_exploration_strategy import *
-from qmla.model_building_utilities import *  # TODO fix __all__
-from qmla.controls_qmla import *
-from qmla.logging import *
-from qmla.redis_settings import *
-from qmla.exploration_tree import *
-from qmla.parameter_definition import *
-from qmla.process_string_to_matrix import *
+r"""
+Submodules, and the names they export, are imported on first use
+(see :mod:`qmla.lazy_loading`), e.g. ``qmla.QuantumModelLearningAgent``
+imports ``qmla.quantum_model_learning_agent`` when first accessed,
+and ``qmla.analysis`` imports the analysis (plotting) functions.
+Importing ``qmla`` itself is therefore cheap for RQ workers and scripts
+which only need a few modules; see ``scripts/benchmark_import_time.py``.
+"""
 
-# Models
-from qmla.model_for_comparison import *
-from qmla.model_for_learning import *
-from qmla.model_for_storage import *
-from qmla.model_building_utilities import *
+_submodule_exports = {
+    # QuantumModelLearningAgent
+    "quantum_model_learning_agent": ["QuantumModelLearningAgent"],
+    # Logistics
+    "get_exploration_strategy": ["exploration_classes", "get_exploration_class"],
+    "controls_qmla": ["ControlsQMLA", "parse_cmd_line_args"],
+    "logging": ["print_to_log", "flush_logs", "flushes_logs", "configure_logging"],
+    "tracing": [
+        "span",
+        "traced",
+        "traced_job",
+        "configure_tracing",
+        "start_job_tracing",
+        "tracing_enabled",
+        "write_trace",
+        "merge_traces",
+    ],
+    "cost_model": [
+        "CostModel",
+        "record_job_timing",
+        "load_job_timings",
+        "expectation_value_function_name",
+    ],
+    "redis_settings": [
+        "databases_required",
+        "get_redis_databases_by_qmla_id",
+        "get_seed",
+        "clear_redis_databases",
+        "set_redis_databases_by_qmla_id",
+    ],
+    "exploration_tree": ["ExplorationTree", "BranchQMLA"],
+    "parameter_definition": ["set_shared_parameters"],
+    "process_string_to_matrix": [
+        # not string_processing_functions: qmla.string_processing_functions is a module
+        "sparse_string_processing_functions",
+        "process_basic_operator",
+    ],
+    "operator_cache": [
+        "OperatorCache",
+        "shared_operator_cache",
+        "configure_operator_cache",
+    ],
+    "completion_events": [
+        "CompletionChannel",
+        "RedisCompletionChannel",
+        "LocalCompletionChannel",
+        "learning_event",
+        "comparison_event",
+    ],
+    # Models
+    "model_for_comparison": ["ModelInstanceForComparison"],
+    "model_for_learning": ["ModelInstanceForLearning"],
+    "model_for_storage": ["ModelInstanceForStorage"],
+    "epoch_recorder": ["EpochRecorder"],
+    "model_building_utilities": [
+        "core_operator_dict",
+        "get_num_qubits",
+        "get_constituent_names_from_name",
+        "alph",
+        "unique_model_pair_identifier",
+    ],
+    # Learning/comparisons
+    "remote_bayes_factor": [
+        "remote_bayes_factor_calculation",
+        "plot_dynamics_from_models",
+    ],
+    "remote_model_learning": ["remote_learn_model_parameters"],
+}
 
-# Learning/comparisons
-from qmla.remote_bayes_factor import *
-from qmla.remote_model_learning import *
+__getattr__, __dir__, __all__ = qmla.lazy_loading.attach(__name__, _submodule_exports)
 
-# Results loader
+# Results loader: bound now, since importing qmla.load_results later
+# would set the module, rather than the function, as qmla.load_results
 from qmla.load_results import load_results
+
+__all__.append("load_results")
@@ -229,7 +229,7 @@ def plot_parameter_estimates(qmd, model_id, save_to_file=None):
     cm_subsection = np.linspace(0, 0.8, num_terms)
     colours = [cm.magma(x) for x in cm_subsection]
     # TODO use color map as list
-    num_epochs = mod.num_experiments
+    num_epochs = mod.num_experiments_run
     ncols = int(np.ceil(np.sqrt(num_terms)))
     nrows = int(np.ceil(num_terms / ncols))
     fig, axes = plt.subplots(figsize=(10, 7), nrows=nrows, ncols=ncols, squeeze=False)
@@ -544,7 +544,7 @@ def plot_learned_models_dynamics(
             cm_subsection = np.linspace(0, 0.8, num_terms)
             colours = [cm.magma(x) for x in cm_subsection]
             # TODO use color map as list
-            num_epochs = reduced.num_experiments
+            num_epochs = reduced.num_experiments_run
 
             i = 0
             #    for term in list(param_estimate_by_term.keys()):
@@ -853,7 +853,7 @@ def r_squared_from_epoch_list(
                 mod_num_qubits
             )
         )
-        epochs.extend([0, qmd.num_experiments - 1])
+        epochs.extend([0, len(mod.track_param_means) - 1])
         if len(mod.epochs_after_resampling) > 0:
             epochs.extend(mod.epochs_after_resampling)
 
@@ -939,7 +939,7 @@ def plot_volume_after_qhl(
         print("Model not considered.")
         raise
 
-    x = range(qmd.num_experiments)
+    x = range(len(y))
 
     plt.clf()
     plt.xlabel("Epoch")
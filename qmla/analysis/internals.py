@@ -265,9 +265,10 @@ def average_quadratic_losses(
     ax = plt.subplot(111)
 
     for mod in winning_models:
-        winning_models_quadratic_losses[mod] = results.loc[
-            results["NameAlphabetical"] == mod
-        ]["QuadraticLosses"].values
+        this_models_results = results.loc[results["NameAlphabetical"] == mod]
+        winning_models_quadratic_losses[mod] = this_models_results[
+            "QuadraticLosses"
+        ].values
 
         list_this_models_q_losses = []
         for i in range(len(winning_models_quadratic_losses[mod])):
@@ -275,27 +276,33 @@ def average_quadratic_losses(
                 eval(winning_models_quadratic_losses[mod][i])
             )
 
-        list_this_models_q_losses = np.array(list_this_models_q_losses)
-
-        num_experiments = np.shape(list_this_models_q_losses)[1]
-        avg_q_losses = np.empty(num_experiments)
-
-        for i in range(num_experiments):
-            avg_q_losses[i] = np.average(list_this_models_q_losses[:, i])
+        # instances may stop learning early (see early_stopping_criteria):
+        # pad with NaN, so each epoch is summarised over the instances which reached it
+        # (losses are recorded for the initial distribution and each experiment run)
+        num_experiments = int(this_models_results["NumExperimentsRun"].max()) + 1
+        list_this_models_q_losses = np.array(
+            [
+                np.pad(
+                    np.array(q, dtype=float),
+                    (0, num_experiments - len(q)),
+                    constant_values=np.nan,
+                )
+                for q in list_this_models_q_losses
+            ]
+        )
+        avg_q_losses = np.nanmean(list_this_models_q_losses, axis=0)
 
         latex_name = exploration_classes[exploration_rule].latex_name(name=mod)
         epochs = range(1, num_experiments + 1)
 
         ax.semilogy(epochs, avg_q_losses, label=latex_name, color=plot_colours[mod])
 
-        upper_one_sigma = [
-            np.percentile(np.array(list_this_models_q_losses[:, t]), 50 + sigmas[1])
-            for t in range(num_experiments)
-        ]
-        lower_one_sigma = [
-            np.percentile(np.array(list_this_models_q_losses[:, t]), 50 - sigmas[1])
-            for t in range(num_experiments)
-        ]
+        upper_one_sigma = np.nanpercentile(
+            list_this_models_q_losses, 50 + sigmas[1], axis=0
+        )
+        lower_one_sigma = np.nanpercentile(
+            list_this_models_q_losses, 50 - sigmas[1], axis=0
+        )
 
         ax.fill_between(
             epochs,
@@ -159,7 +159,7 @@ def average_parameter_estimates(
             pickled_files.append(file)
 
     parameter_estimates_from_qmd = {}
-    num_experiments_by_name = {}
+    num_experiments_run_by_name = {}
 
     latex_terms = {}
     exploration_strategies = {}
@@ -172,9 +172,10 @@ def average_parameter_estimates(
         alph = result["NameAlphabetical"]
         if alph in parameter_estimates_from_qmd.keys():
             parameter_estimates_from_qmd[alph].append(track_parameter_estimates)
+            num_experiments_run_by_name[alph].append(result["NumExperimentsRun"])
         else:
             parameter_estimates_from_qmd[alph] = [track_parameter_estimates]
-            num_experiments_by_name[alph] = result["NumExperiments"]
+            num_experiments_run_by_name[alph] = [result["NumExperimentsRun"]]
 
         if alph not in list(exploration_strategies.keys()):
             try:
@@ -193,14 +194,15 @@ def average_parameter_estimates(
             exploration_classes[g] = None
 
     for name in winning_models:
-        num_experiments = num_experiments_by_name[name]
-        epochs = range(num_experiments_by_name[name] + 1)
-
         parameters_for_this_name = parameter_estimates_from_qmd[name]
         num_wins_for_name = len(parameters_for_this_name)
         terms = sorted(
             qmla.model_building_utilities.get_constituent_names_from_name(name)
         )
+        # instances may stop learning early (see early_stopping_criteria):
+        # each epoch is summarised over the instances which reached it
+        num_experiments_run = num_experiments_run_by_name[name]
+        epochs = range(max(num_experiments_run) + 1)
         num_terms = len(terms)
         lf = lfig.LatexFigure(auto_label=False, auto_gridspec=num_terms)
 
@@ -217,11 +219,8 @@ def average_parameter_estimates(
         for i in range(len(parameters_for_this_name)):
             track_params = parameters_for_this_name[i]
             for t in terms:
-                for e in epochs:
-                    try:
-                        parameters[t][e].append(track_params[t][e])
-                    except:
-                        parameters[t][e] = [track_params[t][e]]
+                for e in range(num_experiments_run[i] + 1):
+                    parameters[t][e].append(track_params[t][e])
 
         avg_parameters = {}
         std_devs = {}
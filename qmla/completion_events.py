@@ -0,0 +1,134 @@
+import queue
+
+r"""
+Notifications of completed model learning and comparison jobs.
+
+Workers (:func:`~qmla.remote_learn_model_parameters` and
+:func:`~qmla.remote_bayes_factor_calculation`) record their progress by
+incrementing a per-branch counter on the redis databases.
+Rather than the :class:`~qmla.QuantumModelLearningAgent` repeatedly polling
+every counter, workers additionally publish an event naming the branch
+they have contributed to, and the agent blocks until an event arrives.
+The counters remain the record of how many jobs have finished; events only
+tell the agent which branches are worth inspecting.
+
+Events are passed through a channel:
+    - :class:`RedisCompletionChannel` pushes events onto a list on the redis
+      database, which the agent pops with a blocking call;
+      this works across processes, e.g. with RQ workers.
+    - :class:`LocalCompletionChannel` holds events on an in-process queue,
+      for running without a redis server.
+"""
+
+__all__ = [
+    "CompletionChannel",
+    "RedisCompletionChannel",
+    "LocalCompletionChannel",
+    "learning_event",
+    "comparison_event",
+]
+
+learning_event = "learning"
+comparison_event = "comparison"
+
+
+class CompletionChannel:
+    r"""
+    Interface for publishing and waiting on job completion events.
+
+    Events are pairs ``(event_type, branch_id)``,
+    where ``event_type`` is either :attr:`learning_event` or
+    :attr:`comparison_event`.
+    """
+
+    def publish(self, event_type, branch_id):
+        r"""
+        Announce that a job of ``event_type`` has finished on ``branch_id``.
+
+        :param str event_type: type of job which finished
+        :param int branch_id: branch whose counter the job updated
+        """
+        raise NotImplementedError
+
+    def wait(self, timeout):
+        r"""
+        Wait for events, returning as soon as at least one is available.
+
+        :param float timeout: maximum time (seconds) to wait
+        :return list events: all events received, in the order they were
+            published; empty if none arrived within ``timeout``.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        r"""Discard any events not yet received, e.g. from earlier runs."""
+        raise NotImplementedError
+
+
+class RedisCompletionChannel(CompletionChannel):
+    r"""
+    Completion events on a redis list, popped with a blocking call.
+
+    :param redis.StrictRedis redis_database: database on which to store
+        events, usually ``redis_databases["completion_events"]``.
+    :param str key: name of the list holding events.
+    """
+
+    def __init__(self, redis_database, key="events"):
+        self.redis_database = redis_database
+        self.key = key
+
+    def publish(self, event_type, branch_id):
+        self.redis_database.rpush(self.key, "{}:{}".format(event_type, int(branch_id)))
+
+    def wait(self, timeout):
+        # BLPOP takes an integer timeout, where 0 blocks indefinitely
+        first_event = self.redis_database.blpop(
+            [self.key], timeout=max(1, int(round(timeout)))
+        )
+        if first_event is None:
+            return []
+        events = [first_event[1]]
+        # collect all other events which have arrived, without blocking
+        pipeline = self.redis_database.pipeline()
+        pipeline.lrange(self.key, 0, -1)
+        pipeline.delete(self.key)
+        events.extend(pipeline.execute()[0])
+        return [self._decode(e) for e in events]
+
+    def clear(self):
+        self.redis_database.delete(self.key)
+
+    @staticmethod
+    def _decode(event):
+        event_type, branch_id = event.decode().split(":")
+        return event_type, int(branch_id)
+
+
+class LocalCompletionChannel(CompletionChannel):
+    r"""
+    Completion events held on an in-process queue.
+
+    Used when all jobs run in the same process as the agent,
+    or to test code waiting on events without a redis server.
+    """
+
+    def __init__(self):
+        self._events = queue.Queue()
+
+    def publish(self, event_type, branch_id):
+        self._events.put((event_type, int(branch_id)))
+
+    def wait(self, timeout):
+        try:
+            events = [self._events.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def clear(self):
+        self.wait(timeout=0)
@@ -113,10 +113,19 @@ class ControlsQMLA:
         # Store parameters which were passed as arguments to implement_qmla.py
         self.qmla_id = arguments.qmla_id
         self.use_rq = bool(arguments.use_rq)
+        self.parallel_backend = arguments.parallel_backend
+        if arguments.num_local_workers > 0:
+            self.num_local_workers = arguments.num_local_workers
+        else:
+            self.num_local_workers = None  # all CPUs
         self.num_experiments = arguments.num_experiments
         self.num_particles = arguments.num_particles
         self.save_plots = bool(arguments.save_plots)
         self.debug_mode = bool(arguments.debug_mode)
+        if self.debug_mode:
+            # entries from log_print_debug are at DEBUG level
+            qmla.logging.configure_logging(level=qmla.logging.DEBUG)
+        self.trace = bool(arguments.trace)
         self.pickle_qmla_instance = bool(arguments.pickle_qmla_instance)
         self.rq_timeout = arguments.rq_timeout
         self.plot_level = arguments.plot_level
@@ -279,6 +288,21 @@ def parse_cmd_line_args(args):
         type=int,
         default=1,
     )
+    parser.add_argument(
+        "-backend",
+        "--parallel_backend",
+        help="Where to hold databases and run jobs. rq: redis server and RQ workers; local: in memory, with jobs on a process pool on this machine (or in this process if use_rq=0).",
+        type=str,
+        choices=["rq", "local"],
+        default="rq",
+    )
+    parser.add_argument(
+        "-nw",
+        "--num_local_workers",
+        help="Number of processes to run jobs on with parallel_backend=local; 0 to use all CPUs.",
+        type=int,
+        default=0,
+    )
 
     # Include optional plots
     parser.add_argument(
@@ -302,6 +326,13 @@ def parse_cmd_line_args(args):
         type=int,
         default=0,
     )
+    parser.add_argument(
+        "-trace",
+        "--trace",
+        help="Record spans of time spent by the QMLA instance and its jobs, as Chrome traces.",
+        type=int,
+        default=0,
+    )
 
     # Redis configuration
     parser.add_argument(
@@ -0,0 +1,348 @@
+import glob
+import json
+import os
+import socket
+import time
+
+import numpy as np
+import scipy.stats
+
+r"""
+Empirical model of the time taken by QMLA's jobs.
+
+Each job run by workers (learning a model, or comparing two models)
+records its duration, with the features which determine its cost,
+to ``job_timings/`` within the run's results directory
+(see :func:`record_job_timing`).
+:class:`CostModel` is fitted to the timings recorded by any number of runs,
+and predicts the time of a job, or of a QMLA instance, with confidence bounds.
+
+For each job type, the logarithm of the duration is modelled as linear in
+the number of qubits, and the logarithms of the numbers of terms, particles
+and experiments, with an offset for each expectation value function.
+The coefficients are regularised towards those of the analytic estimate
+previously used to request time from the job scheduler (the cost of
+exponentiating a Hamiltonian, for each particle and experiment),
+so the model is usable before many timings have been recorded,
+and is refined as runs accumulate.
+Bounds follow from the spread of the residuals, which are approximately
+normal in log space, so bounds are multiplicative.
+
+The cost model of a run is stored alongside its results (``cost_model.json``,
+written by ``scripts/time_required_calculation.py``); if present,
+:class:`~qmla.QuantumModelLearningAgent` sets the timeout of each RQ job
+from the upper bound of its prediction (see :meth:`CostModel.job_timeout`).
+"""
+
+__all__ = [
+    "CostModel",
+    "record_job_timing",
+    "load_job_timings",
+    "expectation_value_function_name",
+]
+
+job_timings_directory_name = "job_timings"
+cost_model_file_name = "cost_model.json"
+job_types = ["learning", "comparison"]
+
+# log(time) coefficients, by job type, of the analytic estimate:
+# 1ms to exponentiate a one-qubit Hamiltonian, growing by ~1.5 per qubit,
+# for every particle and experiment (twice, for comparisons)
+_prior_coefficients = {
+    "learning": {
+        "intercept": np.log(1e-3) - np.log(1.5),
+        "num_qubits": np.log(1.5),
+        "log_num_terms": 0.0,
+        "log_num_particles": 1.0,
+        "log_num_experiments": 1.0,
+    },
+    "comparison": {
+        "intercept": np.log(2e-3) - np.log(1.5),
+        "num_qubits": np.log(1.5),
+        "log_num_terms": 0.0,
+        "log_num_particles": 1.0,
+        "log_num_experiments": 1.0,
+    },
+}
+_numeric_features = [
+    "intercept",
+    "num_qubits",
+    "log_num_terms",
+    "log_num_particles",
+    "log_num_experiments",
+]
+
+
+def expectation_value_function_name(exploration_class):
+    r"""Name of the expectation value function used by an exploration strategy."""
+    function = exploration_class.expectation_value_subroutine
+    return getattr(function, "__name__", str(function))
+
+
+def record_job_timing(results_directory, job_type, duration, **features):
+    r"""
+    Record the duration of a job, for fitting the cost model.
+
+    Timings are appended to a file unique to this host and process,
+    so workers on different hosts do not write to the same file.
+
+    :param str results_directory: results directory of the run.
+    :param str job_type: one of ``job_types``.
+    :param float duration: time taken by the job (seconds).
+    :param features: the job's ``num_qubits``, ``num_terms``, ``num_particles``,
+        ``num_experiments`` and ``expectation_value_function``;
+        other details identify the job, e.g. ``qmla_id`` and ``branch_id``.
+    """
+
+    directory = os.path.join(results_directory, job_timings_directory_name)
+    os.makedirs(directory, exist_ok=True)
+    record = dict(features, job_type=job_type, duration=duration, time=time.time())
+    timings_file = os.path.join(
+        directory, "{}_{}.jsonl".format(socket.gethostname(), os.getpid())
+    )
+    with open(timings_file, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def load_job_timings(directories):
+    r"""
+    Timings recorded within ``directories``, e.g. the results directories of
+    previous runs, or a directory containing them.
+
+    :param list directories: searched recursively for ``job_timings`` directories.
+    :return list records: dictionaries written by :func:`record_job_timing`.
+    """
+
+    # directories may contain each other
+    timings_files = set()
+    for directory in directories:
+        timings_files.update(
+            os.path.realpath(timings_file)
+            for timings_file in glob.glob(
+                os.path.join(directory, "**", job_timings_directory_name, "*.jsonl"),
+                recursive=True,
+            )
+        )
+
+    records = []
+    for timings_file in sorted(timings_files):
+        with open(timings_file) as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # e.g. line cut short by a job being killed
+                    pass
+    return records
+
+
+class CostModel:
+    r"""
+    Predicts the duration of jobs from recorded timings.
+
+    :param float regularisation: weight, as a number of records,
+        of the analytic estimate's coefficients in the fit.
+    :param float prior_log_std: standard deviation (in log space)
+        of predictions from fewer records than coefficients, e.g.
+        1 gives bounds of roughly a factor of 7 at 95% confidence.
+    """
+
+    def __init__(self, regularisation=1.0, prior_log_std=1.0):
+        self.regularisation = regularisation
+        self.prior_log_std = prior_log_std
+        self.models = {
+            job_type: {
+                "coefficients": dict(_prior_coefficients[job_type]),
+                "log_std": prior_log_std,
+                "num_records": 0,
+            }
+            for job_type in job_types
+        }
+
+    @staticmethod
+    def _numeric_row(num_qubits, num_terms, num_particles, num_experiments):
+        return [
+            1.0,
+            num_qubits,
+            np.log(max(num_terms, 1)),
+            np.log(max(num_particles, 1)),
+            np.log(max(num_experiments, 1)),
+        ]
+
+    def fit(self, records):
+        r"""
+        Fit the model of each job type to ``records`` (see :func:`load_job_timings`).
+
+        :return CostModel self: for chaining.
+        """
+
+        for job_type in job_types:
+            job_records = [
+                r
+                for r in records
+                if r.get("job_type") == job_type and r.get("duration", 0) > 0
+            ]
+            model = {
+                "coefficients": dict(_prior_coefficients[job_type]),
+                "log_std": self.prior_log_std,
+                "num_records": len(job_records),
+            }
+            if not job_records:
+                self.models[job_type] = model
+                continue
+
+            functions = sorted(
+                set([str(r.get("expectation_value_function")) for r in job_records])
+            )
+            features = _numeric_features + ["function:{}".format(f) for f in functions]
+            x = np.array(
+                [
+                    self._numeric_row(
+                        r["num_qubits"],
+                        r["num_terms"],
+                        r["num_particles"],
+                        r["num_experiments"],
+                    )
+                    + [
+                        float(str(r.get("expectation_value_function")) == f)
+                        for f in functions
+                    ]
+                    for r in job_records
+                ]
+            )
+            y = np.log([r["duration"] for r in job_records])
+
+            # ridge regression towards the prior coefficients
+            # (function offsets towards 0)
+            prior = np.array(
+                [_prior_coefficients[job_type][f] for f in _numeric_features]
+                + [0.0] * len(functions)
+            )
+            penalty = self.regularisation * np.eye(len(features))
+            coefficients = np.linalg.solve(x.T @ x + penalty, x.T @ y + penalty @ prior)
+            residuals = y - x @ coefficients
+            degrees_of_freedom = len(y) - len(_numeric_features)
+            if degrees_of_freedom > 0:
+                # shrink towards the prior spread when there are few records
+                log_std = np.sqrt(
+                    (np.sum(residuals ** 2) + self.prior_log_std ** 2)
+                    / (degrees_of_freedom + 1)
+                )
+            else:
+                log_std = self.prior_log_std
+
+            model["coefficients"] = dict(zip(features, coefficients.tolist()))
+            model["log_std"] = float(log_std)
+            self.models[job_type] = model
+        return self
+
+    def predict(
+        self,
+        job_type,
+        num_qubits,
+        num_terms,
+        num_particles,
+        num_experiments,
+        expectation_value_function=None,
+        confidence=0.95,
+    ):
+        r"""
+        Predict the duration of a job.
+
+        :param str job_type: one of ``job_types``.
+        :param str expectation_value_function: name of the expectation value
+            function; functions absent from the recorded timings have no offset.
+        :param float confidence: probability that the duration lies within the bounds.
+        :return dict prediction: ``median``, ``lower`` and ``upper`` (seconds).
+        """
+
+        model = self.models[job_type]
+        coefficients = model["coefficients"]
+        log_time = np.dot(
+            [coefficients[f] for f in _numeric_features],
+            self._numeric_row(num_qubits, num_terms, num_particles, num_experiments),
+        ) + coefficients.get("function:{}".format(expectation_value_function), 0.0)
+        z = scipy.stats.norm.ppf(0.5 + confidence / 2)
+        return {
+            "median": float(np.exp(log_time)),
+            "lower": float(np.exp(log_time - z * model["log_std"])),
+            "upper": float(np.exp(log_time + z * model["log_std"])),
+        }
+
+    def predict_total(self, jobs, confidence=0.95):
+        r"""
+        Predict the time to run ``jobs`` one after another, e.g. all the jobs
+        of a QMLA instance.
+
+        Bounds are the sums of the jobs' bounds, which is conservative
+        (errors of different jobs partially cancel).
+
+        :param list jobs: dictionaries of the arguments of :meth:`predict`,
+            and optionally ``count``, the number of such jobs.
+        :return dict prediction: ``median``, ``lower`` and ``upper`` (seconds).
+        """
+
+        total = {"median": 0.0, "lower": 0.0, "upper": 0.0}
+        for job in jobs:
+            job = dict(job)
+            count = job.pop("count", 1)
+            prediction = self.predict(confidence=confidence, **job)
+            for k in total:
+                total[k] += count * prediction[k]
+        return total
+
+    def job_timeout(
+        self,
+        confidence=0.999,
+        insurance_factor=2.5,
+        minimum_timeout=60,
+        maximum_timeout=None,
+        **job
+    ):
+        r"""
+        Time after which a job can be assumed to have failed.
+
+        A job which times out fails its QMLA instance, so the timeout must be
+        well clear of the times of good jobs: the upper bound of the prediction
+        at a high ``confidence`` is multiplied by ``insurance_factor``,
+        to allow for jobs unlike those recorded, or slower hosts.
+
+        :param float confidence: probability that the time lies within the bound.
+        :param float insurance_factor: multiplies the upper bound.
+        :param int minimum_timeout: shortest timeout (seconds).
+        :param int maximum_timeout: longest timeout (seconds), e.g. the time
+            available to the instance; no limit if None or not positive.
+        :param job: arguments of :meth:`predict`.
+        :return int timeout: seconds.
+        """
+
+        upper = self.predict(confidence=confidence, **job)["upper"]
+        timeout = max(minimum_timeout, int(np.ceil(insurance_factor * upper)))
+        if maximum_timeout is not None and maximum_timeout > 0:
+            timeout = min(timeout, maximum_timeout)
+        return timeout
+
+    def to_dict(self):
+        return {
+            "regularisation": self.regularisation,
+            "prior_log_std": self.prior_log_std,
+            "models": self.models,
+        }
+
+    @classmethod
+    def from_dict(cls, cost_model_dict):
+        cost_model = cls(
+            regularisation=cost_model_dict["regularisation"],
+            prior_log_std=cost_model_dict["prior_log_std"],
+        )
+        cost_model.models.update(cost_model_dict["models"])
+        return cost_model
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
@@ -0,0 +1,209 @@
+import numpy as np
+import pandas as pd
+
+r"""
+Record of a model's progress through each epoch of parameter learning.
+
+:class:`~qmla.ModelInstanceForLearning` records the state of its parameter
+distribution, and details of the experiment which updated it, once before
+learning and once after each experiment.
+Records are written into arrays preallocated for the expected number of epochs,
+rather than appended to lists (or data frames), so that recording is cheap
+for any number of experiments; derived quantities, like the quadratic loss
+of each epoch, are computed from the stored arrays only when requested,
+and the :class:`pandas.DataFrame` summary only when it is needed
+(e.g. for :meth:`~qmla.ModelInstanceForLearning.learned_info_dict`).
+"""
+
+__all__ = ["EpochRecorder"]
+
+# scalar fields recorded at each epoch, with the values used when
+# a field is not available, e.g. the experiment time before the first experiment
+epoch_fields = [
+    ("experiment_id", np.int64, -1),
+    ("volume", np.float64, np.nan),
+    ("norm_covariance_mtx", np.float64, np.nan),
+    ("experiment_time", np.float64, np.nan),
+    ("probe_id", np.int64, -1),
+    ("residual_median", np.float64, np.nan),
+    ("residual_std_dev", np.float64, np.nan),
+    ("just_resampled", np.bool_, False),
+    ("effective_sample_size", np.float64, np.nan),
+    ("datum", np.float64, np.nan),
+    ("total_likelihood", np.float64, np.nan),
+    ("update_time", np.float64, 0),
+    ("storage_time", np.float64, 0),
+    ("likelihood_time", np.float64, 0),
+]
+epoch_dtype = np.dtype([(name, dtype) for name, dtype, _ in epoch_fields])
+_defaults = tuple(default for _, _, default in epoch_fields)
+
+
+class EpochRecorder:
+    r"""
+    Preallocated, per-epoch record of a model's learning.
+
+    Scalar fields (listed in ``epoch_fields``) are stored in a structured array,
+    and the parameter estimates, uncertainties and (optionally) covariance
+    matrices in arrays with one row per epoch.
+    Properties return views of the epochs recorded so far,
+    so they must be copied if they are to be modified.
+    If more epochs are recorded than were allocated (e.g. by learning which
+    runs additional experiments), the arrays are enlarged.
+
+    :param int num_epochs: number of epochs to allocate, i.e.
+        the number of experiments plus one for the initial distribution.
+    :param list model_terms_names: names of the model's terms, in the order of
+        its parameters.
+    :param dict true_param_dict: parameters of the true model by term name,
+        against which the quadratic loss is computed; terms in only one of
+        the true model and this model are taken to have parameter 0 in the other.
+    :param bool track_covariance_matrices: whether to store the full covariance
+        matrix at each epoch.
+    """
+
+    def __init__(
+        self,
+        num_epochs,
+        model_terms_names,
+        true_param_dict,
+        track_covariance_matrices=False,
+    ):
+        self.num_parameters = len(model_terms_names)
+        self.track_covariance_matrices = track_covariance_matrices
+        self.num_recorded = 0
+
+        # quadratic loss is sum((estimates - true)**2) over the union of terms;
+        # terms only in the true model contribute a constant
+        self._true_params = np.array(
+            [true_param_dict.get(term, 0) for term in model_terms_names], dtype=float
+        )
+        self._loss_offset = sum(
+            [
+                param ** 2
+                for term, param in true_param_dict.items()
+                if term not in model_terms_names
+            ]
+        )
+
+        self._allocate(max(int(num_epochs), 1))
+
+    def _allocate(self, num_epochs):
+        records = np.empty(num_epochs, dtype=epoch_dtype)
+        param_means = np.empty((num_epochs, self.num_parameters))
+        param_uncertainties = np.empty((num_epochs, self.num_parameters))
+        if self.track_covariance_matrices:
+            covariance_matrices = np.empty(
+                (num_epochs, self.num_parameters, self.num_parameters)
+            )
+        else:
+            covariance_matrices = np.empty(
+                (0, self.num_parameters, self.num_parameters)
+            )
+
+        n = self.num_recorded
+        if n > 0:
+            records[:n] = self._records[:n]
+            param_means[:n] = self._param_means[:n]
+            param_uncertainties[:n] = self._param_uncertainties[:n]
+            if self.track_covariance_matrices:
+                covariance_matrices[:n] = self._covariance_matrices[:n]
+
+        self._records = records
+        self._param_means = param_means
+        self._param_uncertainties = param_uncertainties
+        self._covariance_matrices = covariance_matrices
+
+    def record(self, param_means, covariance_mtx, **fields):
+        r"""
+        Record an epoch.
+
+        :param np.ndarray param_means: mean of the parameter distribution.
+        :param np.ndarray covariance_mtx: covariance matrix of the parameter
+            distribution; the parameters' uncertainties, and the norm of the
+            covariance matrix, are computed from it.
+        :param fields: values of the scalar fields in ``epoch_fields``;
+            fields not given take their default value.
+        """
+
+        n = self.num_recorded
+        if n == len(self._records):
+            self._allocate(2 * n)
+
+        self._records[n] = _defaults
+        row = self._records[n]
+        for field, value in fields.items():
+            row[field] = value
+        row["norm_covariance_mtx"] = np.linalg.norm(covariance_mtx)
+
+        self._param_means[n] = param_means
+        self._param_uncertainties[n] = np.sqrt(np.diag(covariance_mtx))
+        if self.track_covariance_matrices:
+            self._covariance_matrices[n] = covariance_mtx
+        self.num_recorded = n + 1
+
+    def __len__(self):
+        return self.num_recorded
+
+    @property
+    def records(self):
+        r"""Structured array of the scalar fields of each epoch recorded."""
+        return self._records[: self.num_recorded]
+
+    @property
+    def param_means(self):
+        r"""Parameter estimates at each epoch, shape ``(epochs, num_parameters)``."""
+        return self._param_means[: self.num_recorded]
+
+    @property
+    def param_uncertainties(self):
+        r"""Parameter uncertainties at each epoch, shape ``(epochs, num_parameters)``."""
+        return self._param_uncertainties[: self.num_recorded]
+
+    @property
+    def covariance_matrices(self):
+        r"""Covariance matrix at each epoch; empty unless ``track_covariance_matrices``."""
+        return self._covariance_matrices[: self.num_recorded]
+
+    @property
+    def volumes(self):
+        r"""Volume of the parameter distribution at each epoch."""
+        return self.records["volume"]
+
+    @property
+    def norm_covariance_matrices(self):
+        r"""Norm of the covariance matrix at each epoch."""
+        return self.records["norm_covariance_mtx"]
+
+    @property
+    def quadratic_losses(self):
+        r"""Quadratic loss of the parameter estimates against the true parameters at each epoch."""
+        return (
+            np.sum((self.param_means - self._true_params) ** 2, axis=1)
+            + self._loss_offset
+        )
+
+    def to_dataframe(self, **constant_fields):
+        r"""
+        Summary of the epochs recorded, one row per epoch.
+
+        :param constant_fields: columns with the same value in every row
+            (e.g. the model's ID), placed before the recorded fields.
+        :return pd.DataFrame progress: constant fields, followed by
+            ``experiment_id``, ``parameters_estimates``,
+            ``parameters_uncertainties``, ``quadratic_loss`` and
+            the recorded scalar fields.
+        """
+
+        n = self.num_recorded
+        records = self.records
+        progress = {field: [value] * n for field, value in constant_fields.items()}
+        progress["experiment_id"] = records["experiment_id"]
+        progress["parameters_estimates"] = list(self.param_means.copy())
+        progress["parameters_uncertainties"] = list(self.param_uncertainties.copy())
+        progress["volume"] = records["volume"]
+        progress["quadratic_loss"] = self.quadratic_losses
+        for field, _, _ in epoch_fields:
+            if field not in progress:
+                progress[field] = records[field]
+        return pd.DataFrame(progress)
@@ -14,6 +14,7 @@ from lfig import LatexFigure
 
 import qmla.shared_functionality.prior_distributions
 import qmla.shared_functionality.experiment_design_heuristics
+import qmla.shared_functionality.early_stopping
 import qmla.shared_functionality.probe_set_generation as probe_set_generation
 import qmla.shared_functionality.expectation_value_functions
 import qmla.utilities
@@ -119,6 +120,8 @@ class ExplorationStrategy:
         """
 
         # Measurement
+        # for large systems (7 or more qubits) use size_dependent_expectation_value,
+        # which propagates the probe directly instead of forming the full unitary
         self.expectation_value_subroutine = (
             qmla.shared_functionality.expectation_value_functions.default_expectation_value
         )
@@ -234,6 +237,22 @@ class ExplorationStrategy:
             Whether to stop learning when a model reaches a given threshold in volume
         volume_convergence_threshold
             The volume at which to terminate learning if ``terminate_learning_at_volume_convergence==True``
+        early_stopping_criteria
+            list of criteria from :mod:`qmla.shared_functionality.early_stopping`, e.g.
+            :class:`~qmla.shared_functionality.early_stopping.VolumePlateau`,
+            :class:`~qmla.shared_functionality.early_stopping.ParameterUncertaintyRatio` and
+            :class:`~qmla.shared_functionality.early_stopping.EffectiveSampleSizeStability`,
+            under which models stop learning before performing all of their experiments.
+            Empty by default, i.e. models always perform ``num_experiments`` experiments;
+            ``terminate_learning_at_volume_convergence`` adds
+            :class:`~qmla.shared_functionality.early_stopping.VolumeThreshold`.
+            Experiments saved are reported in ``experiments_saved.csv``.
+        early_stopping_minimum_fraction
+            fraction of ``num_experiments`` which models perform before
+            ``early_stopping_criteria`` are considered.
+        early_stopping_require_all_criteria
+            whether learning stops only when all ``early_stopping_criteria`` are met,
+            rather than any of them.
         iqle_mode
             True for interactive quantum likelihood estimation;
             False for quantum likelihood estimation.
@@ -241,6 +260,42 @@ class ExplorationStrategy:
             Note IQLE is far stronger for learning, but is not available for physical systems in general,
             since it assumes access to a coherent quantum channel which maps the target system
             to a simulator.
+        batched_likelihood_engine
+            Whether the default QInfer interface computes the simulator's likelihoods
+            for all particles together, by diagonalising the stack of particle Hamiltonians
+            in a single call (see
+            :func:`~qmla.shared_functionality.expectation_value_functions.batched_expectation_values`).
+            Only used when ``expectation_value_subroutine`` is
+            :func:`~qmla.shared_functionality.expectation_value_functions.default_expectation_value`,
+            or one of the Hahn echo subroutines in
+            ``qmla.shared_functionality.expectation_value_functions.spectral_hahn_subroutines``
+            (see :func:`~qmla.shared_functionality.expectation_value_functions.spectral_hahn_evolution`),
+            or :func:`~qmla.shared_functionality.expectation_value_functions.liouvillian_evolve_expectation`
+            (see :func:`~qmla.shared_functionality.expectation_value_functions.liouvillian_evolve_fidelities`);
+            custom subroutines are always called per particle,
+            as are models with non-Hermitian terms.
+        batched_likelihood_max_bytes
+            Memory (in bytes) for the matrices which the batched likelihood engine
+            stacks and diagonalises together: about :math:`3 d^2` complex numbers per particle.
+            Particles whose matrices would exceed this are processed in batches,
+            e.g. 8 qubits and 1000 particles would need ~3 GB in a single batch,
+            so are processed in batches of ~85 particles with the default of 256 MB.
+        particle_spectrum_cache_max_bytes
+            Memory (in bytes) available to the batched likelihood engine to keep
+            the eigendecompositions of the particles' Hamiltonians between experiments
+            (see :class:`~qmla.shared_functionality.qinfer_model_interface.ParticleSpectrumCache`).
+            Particles only move when the updater resamples, so until then each experiment
+            reuses the decompositions. The cache needs
+            :math:`N_p (d^2 + d)` complex numbers; if that exceeds this limit,
+            particle Hamiltonians are diagonalised for every experiment.
+            Set to 0 to disable the cache.
+        likelihood_instrumentation
+            What the QInfer interface records at each likelihood call, besides
+            computing likelihoods: ``"off"``, ``"summary"`` (timings and
+            streaming summaries of the likelihoods over all calls) or ``"full"``
+            (additionally, likelihood statistics for every call, used by some plots,
+            and by the residuals recorded in models' ``progress_tracker``); see
+            :class:`~qmla.shared_functionality.qinfer_model_interface.QInferModelQMLA`.
         qinfer_resampler_threshold
             :math:`k_r`, fraction of particles below which to trigger a resampling event.
             i.e. when the effective sample size is less than this fraction of the initial number of particles,
@@ -262,6 +317,19 @@ class ExplorationStrategy:
             e.g. if 10 000 particles are used for parameter learning for each model,
             the Bayes factor from 1 000 particles is expected to be in favour of the same
             model as the Bayes factor using 10 000 particles, using far less time, but with weaker evidence.
+        parallel_bayes_factor_sides
+            whether to compute the two sides of a Bayes factor
+            (each model updated on its opponent's experiments)
+            concurrently, in separate processes of the worker performing the comparison.
+            This roughly halves the time of a comparison only if cores are otherwise idle:
+            each comparison occupies a second process, while the launch scripts
+            start an RQ worker for every allocated core, so the comparison stage
+            runs about twice oversubscribed. Off by default; enable it only when
+            there are fewer comparisons than workers, or with fewer RQ workers than cores.
+        batch_bayes_factor_replay
+            whether models replay their opponent's experiments in batch
+            during comparisons, with likelihoods precomputed for the whole
+            list of experiments, rather than one experiment at a time.
         fraction_experiments_for_bf
             # TODO out of date
             fraction of experiments to use during pairwise comparison between models.
@@ -293,7 +361,14 @@ class ExplorationStrategy:
         self.max_time_to_consider = 15  # arbitrary time units
         self.terminate_learning_at_volume_convergence = False
         self.volume_convergence_threshold = 1e-8
+        self.early_stopping_criteria = []
+        self.early_stopping_minimum_fraction = 0.2
+        self.early_stopping_require_all_criteria = False
         self.iqle_mode = False
+        self.batched_likelihood_engine = True
+        self.batched_likelihood_max_bytes = 2 ** 28
+        self.particle_spectrum_cache_max_bytes = 2 ** 30
+        self.likelihood_instrumentation = "full"
         self.reallocate_resources = False
         self.max_num_parameter_estimate = 2
         self.qinfer_resampler_a = 0.98
@@ -305,6 +380,8 @@ class ExplorationStrategy:
         self.fraction_particles_for_bf = (
             1.0  # testing whether reduced num particles for BF can work
         )
+        self.parallel_bayes_factor_sides = False
+        self.batch_bayes_factor_replay = True
         self.force_evaluation = False
         self.exclude_evaluation = False
 
@@ -446,7 +523,9 @@ class ExplorationStrategy:
         On a compute cluster, we run QMLA by submitting jobs.
         Those jobs need to specify the number of cores to request,
         and the time required. These are computed in the
-        ``time_reuqired_calculation`` script, using the details specified here.
+        ``time_reuqired_calculation`` script, using the details specified here,
+        from the time each job is predicted to take by the
+        :class:`~qmla.CostModel` fitted to previous runs.
 
         max_num_models_by_shape
             How many models to allow per number of qubits
@@ -468,12 +547,32 @@ class ExplorationStrategy:
             Should be set :math:`\neq 1` when you find the jobs are requesting
             far too little time and are not finishing, or requesting too much
             which places them on slower queues.
+        rq_timeout_insurance_factor
+            Multiplies the upper bound of each RQ job's time predicted by the
+            run's cost model, to give the job's timeout
+            (see :meth:`~qmla.CostModel.job_timeout`).
+            A job which times out fails the QMLA instance, so this should
+            leave a wide margin; unlike ``timing_insurance_factor``,
+            it should not be below 1.
+
+        *Operator cache*
+
+        operator_cache_size
+            Maximum number of term matrices held by each process's
+            :attr:`~qmla.operator_cache.shared_operator_cache`.
+        persist_operator_cache
+            Whether to also store term matrices on disk within the run's results directory,
+            so that workers on the same node load operators built by other jobs.
+            Worthwhile for large models, whose terms are expensive to construct.
 
         """
 
         self.max_num_models_by_shape = {1: 0, 2: 1, "other": 0}
         self.num_processes_to_parallelise_over = 6
         self.timing_insurance_factor = 1
+        self.rq_timeout_insurance_factor = 2.5
+        self.operator_cache_size = 2048
+        self.persist_operator_cache = False
         # self.f_score_cmap = matplotlib.cm.Spectral
         self.f_score_cmap = matplotlib.cm.RdBu
         self.bf_cmap = matplotlib.cm.PRGn
@@ -871,6 +970,31 @@ class ExplorationStrategy:
 
         return self.model_heuristic_subroutine(**kwargs)
 
+    # Early stopping of learning
+    def get_early_stopping(self, num_experiments):
+        r"""
+        Build the :class:`~qmla.shared_functionality.early_stopping.EarlyStopping`
+        which decides when a model stops learning, from ``early_stopping_criteria``.
+
+        :param int num_experiments: number of experiments available to the model.
+        :return EarlyStopping early_stopping: checked after every experiment.
+        """
+
+        criteria = list(self.early_stopping_criteria)
+        if self.terminate_learning_at_volume_convergence:
+            criteria.append(
+                qmla.shared_functionality.early_stopping.VolumeThreshold(
+                    threshold=self.volume_convergence_threshold
+                )
+            )
+        return qmla.shared_functionality.early_stopping.EarlyStopping(
+            criteria=criteria,
+            minimum_experiments=int(
+                self.early_stopping_minimum_fraction * num_experiments
+            ),
+            require_all=self.early_stopping_require_all_criteria,
+        )
+
     # QInfer interface
     def get_qinfer_model(self, **kwargs):
         r"""
@@ -14,7 +14,6 @@ import sklearn as skl
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.gridspec import GridSpec
-import seaborn as sns
 
 try:
     from lfig import LatexFigure
@@ -715,6 +714,7 @@ class Genetic(exploration_strategy.ExplorationStrategy):
         r"""
         Show how the fitness of models at each generation progress in terms of F score.
         """
+        import seaborn as sns
 
         plt.clf()
         correlations = pd.DataFrame(columns=["Generation", "Method", "Correlation"])
@@ -823,6 +823,7 @@ class Genetic(exploration_strategy.ExplorationStrategy):
         r"""
         Plot fitness vs f score throughout generations of the genetic algorithm.
         """
+        import seaborn as sns
 
         plt.clf()
         sanity_check_df = self.fitness_df[
@@ -859,6 +860,7 @@ class Genetic(exploration_strategy.ExplorationStrategy):
         r"""
         Plot ratings of models on all generations, as determined by the RatingSystem
         """
+        import seaborn as sns
 
         plt.clf()
         ratings = self.ratings_class.all_ratings
@@ -902,6 +904,7 @@ class Genetic(exploration_strategy.ExplorationStrategy):
         r"""
         Plot fitness against f score
         """
+        import seaborn as sns
 
         plt.clf()
         fig, ax = plt.subplots()
@@ -1039,6 +1042,8 @@ class Genetic(exploration_strategy.ExplorationStrategy):
         r"""
         Show various metrics across all generations
         """
+        import seaborn as sns
+
         fig, axes = plt.subplots(figsize=(15, 10), constrained_layout=True)
         gs = GridSpec(
             nrows=2,
@@ -1095,6 +1100,8 @@ class Genetic(exploration_strategy.ExplorationStrategy):
         r"""
         Method for plotting succinct summary of progression of gene pool with respect to F score.
         """
+        import seaborn as sns
+
         if f_score_cmap is None:
             f_score_cmap = matplotlib.cm.RdBu
         num_models_per_generation = len(gene_pool[gene_pool.generation == 1])
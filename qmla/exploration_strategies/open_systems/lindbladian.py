@@ -8,6 +8,9 @@ import math
 
 from qmla.exploration_strategies import exploration_strategy
 import qmla.shared_functionality.probe_set_generation
+from qmla.shared_functionality.expectation_value_functions import (
+    liouvillian_evolve_expectation,
+)
 from qmla import model_building_utilities
 
 
@@ -46,57 +49,6 @@ def tensor_expansion(binary_matrix, operator):
     return fullmatrix
 
 
-def liouvillian_evolve_expectation(
-    ham, t, state, log_file="QMDLog.log", log_identifier="Expecation Value", **kwargs
-):
-    experimental_t_tolerance = 10
-    try:
-        unitary = linalg.expm(ham * t)
-        u_psi = np.dot(unitary, state)
-    except:
-        print(
-            # [
-            "Failed to build unitary for ham:\n {}".format(ham)
-            # ],
-            # log_file=log_file, log_identifier=log_identifier
-        )
-        raise
-
-    N = int(np.sqrt(len(state)))
-
-    rho1 = np.zeros((N, N), complex)
-    rho2 = np.zeros((N, N), complex)
-
-    for c, val in enumerate(state):
-        rho1[math.floor(c / N), c % N] = val
-
-    for c, val in enumerate(u_psi):
-        rho2[math.floor(c / N), c % N] = val
-
-    ex_val_tol = 1e-9
-
-    if np.trace(rho1) > 1 + ex_val_tol or np.trace(rho1) < 0 - ex_val_tol:
-        print("rho1 has a trace: ", np.trace(rho1))
-
-    if np.trace(rho2) > 1 + ex_val_tol or np.trace(rho2) < 0 - ex_val_tol:
-        print("rho2 is bad rho2,rho2,ham,t: ", rho2, rho1, ham, t)
-
-    # Population -- Operator
-    # op = tensor_expansion(np.identity(int(np.log2(len(rho2)))), np.array([[1,0],[0,-1]]))
-    # expectation_value_op = 0.5*(1+np.trace(np.dot(rho2,op)))
-    # Fidelity -- Between p(0) and p(t)
-    expectation_value_fid = np.square(
-        np.trace(
-            linalg.sqrtm(np.dot(linalg.sqrtm(rho2), np.dot(rho1, linalg.sqrtm(rho2))))
-        )
-    )
-    # Trace Distance -- Between p(0) and p(t)
-    # expectation_value_dist = 0.5*(np.trace(linalg.sqrtm(np.square(rho1-rho2))))
-    # Expectation Value Choice
-    expectation_value = expectation_value_fid
-    return expectation_value
-
-
 def plot_probe(max_num_qubits, **kwargs):
     probe_dict = {}
     num_probes = kwargs["num_probes"]
@@ -205,7 +157,7 @@ class Lindbladian(exploration_strategy.ExplorationStrategy):
         #    'DissLiouvillian_1B_ls_1': (0.7,1),
         #    'DissLiouvillian_2A_lx_1': (0.7,1)
         # }
-        self.get_expectation_value = liouvillian_evolve_expectation
+        self.expectation_value_subroutine = liouvillian_evolve_expectation
         self.plot_probes_generation_subroutine = plot_probe
         self.system_probes_generation_subroutine = liouv_separable_probe_dict
 
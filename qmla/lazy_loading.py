@@ -0,0 +1,75 @@
+import importlib
+
+r"""
+Import a package's submodules, and the names they export, on first use.
+
+Packages call :func:`attach` from their ``__init__``, in place of
+star-importing every submodule, so that importing the package
+does not import all of its dependencies (e.g. plotting libraries)
+until they are needed.
+"""
+
+__all__ = ["attach"]
+
+
+def attach(package_name, submodule_exports):
+    r"""
+    Module-level ``__getattr__``, ``__dir__`` and ``__all__`` for a lazily loaded package.
+
+    Usage, within the package's ``__init__.py``::
+
+        __getattr__, __dir__, __all__ = qmla.lazy_loading.attach(
+            __name__, submodule_exports
+        )
+
+    Accessing a name listed in ``submodule_exports`` imports the
+    submodule which defines it; accessing any other attribute imports
+    the submodule of that name, if there is one.
+    Either way the result is set on the package, so ``__getattr__``
+    is only called on the first access.
+
+    :param str package_name: ``__name__`` of the package.
+    :param dict submodule_exports: names to export from each submodule,
+        in the order their star imports were listed; where several
+        submodules export a name, the last listed takes precedence.
+    :return tuple lazy_attributes: ``(__getattr__, __dir__, __all__)``
+        for the package.
+    """
+
+    lazy_attributes = {
+        name: submodule
+        for submodule, names in submodule_exports.items()
+        for name in names
+    }
+
+    def __getattr__(name):
+        if name.startswith("__"):
+            # e.g. probes by inspect or pickle; never a submodule
+            raise AttributeError(
+                "module '{}' has no attribute '{}'".format(package_name, name)
+            )
+        package = importlib.import_module(package_name)
+        if name in lazy_attributes:
+            submodule = importlib.import_module(
+                "{}.{}".format(package_name, lazy_attributes[name])
+            )
+            value = getattr(submodule, name)
+        else:
+            submodule_name = "{}.{}".format(package_name, name)
+            try:
+                value = importlib.import_module(submodule_name)
+            except ModuleNotFoundError as e:
+                if e.name != submodule_name:
+                    # the submodule exists, but one of its dependencies doesn't
+                    raise
+                raise AttributeError(
+                    "module '{}' has no attribute '{}'".format(package_name, name)
+                ) from None
+        setattr(package, name, value)
+        return value
+
+    def __dir__():
+        package = importlib.import_module(package_name)
+        return sorted(set(vars(package)) | set(lazy_attributes))
+
+    return __getattr__, __dir__, list(lazy_attributes)
@@ -0,0 +1,232 @@
+import json
+import pickle
+import struct
+import time
+import zlib
+
+import numpy as np
+import redis
+
+import qmla.tracing
+
+r"""
+Storage of models' learned info on the redis database.
+
+After learning, a model's :meth:`~qmla.ModelInstanceForLearning.learned_info_dict`
+is stored so it can be retrieved by comparisons
+(:class:`~qmla.ModelInstanceForComparison`) and by the QMLA instance
+(:class:`~qmla.ModelInstanceForStorage`).
+Rather than pickling the entire dictionary into a single blob,
+each field is stored as a separate entry of a redis hash, so that consumers
+can fetch only the fields they need.
+Numeric arrays are stored as their raw contiguous buffer, along with a short
+header giving their dtype and shape; all other objects are pickled.
+Large fields are compressed with zlib if doing so reduces their size.
+
+Stored hashes carry a format version; data stored by earlier versions of QMLA
+as a single pickle are still loaded.
+"""
+
+__all__ = [
+    "serialization_version",
+    "comparison_fields",
+    "encode_learned_info",
+    "decode_learned_info",
+    "store_learned_info",
+    "load_learned_info",
+]
+
+serialization_version = 1
+
+# fields of learned_info_dict read by ModelInstanceForComparison
+comparison_fields = [
+    "name",
+    "times_learned_over",
+    "final_learned_params",
+    "exploration_strategy_of_this_model",
+    "posterior_marginal",
+    "model_normalization_record",
+    "log_total_likelihood",
+    "estimated_mean_params",
+    "qhl_final_param_estimates",
+    "qhl_final_param_uncertainties",
+    "covariance_mtx_final",
+    "expectation_values",
+    "learned_hamiltonian",
+    "track_experiment_parameters",
+]
+
+_version_field = "__version__"
+_size_field = "__num_bytes__"
+
+# flags prefixing each encoded field
+_array_flag = b"a"
+_pickle_flag = b"p"
+_uncompressed_flag = b"0"
+_compressed_flag = b"1"
+
+
+def _encode_field(value, compression_threshold):
+    if isinstance(value, np.ndarray) and value.dtype.kind in "biufc":
+        header = json.dumps(
+            {"dtype": value.dtype.str, "shape": list(value.shape)}
+        ).encode()
+        payload = (
+            struct.pack("<H", len(header))
+            + header
+            + np.ascontiguousarray(value).tobytes()
+        )
+        kind = _array_flag
+    else:
+        payload = pickle.dumps(value, protocol=4)
+        kind = _pickle_flag
+
+    if compression_threshold is not None and len(payload) > compression_threshold:
+        compressed_payload = zlib.compress(payload, 1)
+        if len(compressed_payload) < len(payload):
+            return kind + _compressed_flag + compressed_payload
+    return kind + _uncompressed_flag + payload
+
+
+def _decode_field(encoded):
+    kind = encoded[:1]
+    payload = encoded[2:]
+    if encoded[1:2] == _compressed_flag:
+        payload = zlib.decompress(payload)
+
+    if kind == _array_flag:
+        (header_length,) = struct.unpack("<H", payload[:2])
+        header = json.loads(payload[2 : 2 + header_length].decode())
+        # copy so the array is writeable and owns its memory
+        return (
+            np.frombuffer(payload[2 + header_length :], dtype=header["dtype"])
+            .reshape(header["shape"])
+            .copy()
+        )
+    return pickle.loads(payload)
+
+
+def encode_learned_info(learned_info, compression_threshold=1024):
+    r"""
+    Encode each field of a learned info dictionary to bytes.
+
+    :param dict learned_info: learned info of a model, usually from
+        :meth:`~qmla.ModelInstanceForLearning.learned_info_dict`.
+    :param int compression_threshold: fields larger than this (in bytes) are
+        compressed; if None, no fields are compressed.
+    :return dict encoded: bytes for each field, as well as the format
+        version and total size.
+    """
+
+    encoded = {
+        str(k): _encode_field(v, compression_threshold) for k, v in learned_info.items()
+    }
+    encoded[_version_field] = str(serialization_version).encode()
+    encoded[_size_field] = str(sum([len(v) for v in encoded.values()])).encode()
+    return encoded
+
+
+def decode_learned_info(encoded, fields=None):
+    r"""
+    Decode fields encoded by :func:`encode_learned_info`.
+
+    :param dict encoded: bytes for each field, keyed by field name
+        (as str or bytes, as returned by redis).
+    :param list fields: names of fields to decode; if None, all are decoded.
+    :return dict learned_info: decoded fields.
+    """
+
+    encoded = {
+        (k.decode() if isinstance(k, bytes) else k): v for k, v in encoded.items()
+    }
+    version = int(encoded[_version_field])
+    if version != serialization_version:
+        raise ValueError(
+            "Learned info stored with format version {}; can only load version {}".format(
+                version, serialization_version
+            )
+        )
+    if fields is None:
+        fields = [k for k in encoded if k not in (_version_field, _size_field)]
+    return {f: _decode_field(encoded[f]) for f in fields}
+
+
+@qmla.tracing.traced(category="redis")
+def store_learned_info(database, key, learned_info, compression_threshold=1024):
+    r"""
+    Store a model's learned info on a redis database.
+
+    :param redis.StrictRedis database: database to store on,
+        usually ``learned_models_info_db``.
+    :param str key: key for this model, usually ``str(model_id)``.
+    :param dict learned_info: learned info of the model.
+    :param int compression_threshold: see :func:`encode_learned_info`.
+    :return dict storage_summary: number of bytes stored and time taken
+        to encode.
+    """
+
+    t_init = time.time()
+    encoded = encode_learned_info(
+        learned_info, compression_threshold=compression_threshold
+    )
+    encode_time = time.time() - t_init
+
+    pipeline = database.pipeline()
+    # remove fields of any previous entry for this key
+    pipeline.delete(key)
+    pipeline.hset(key, mapping=encoded)
+    pipeline.execute()
+    return {
+        "num_bytes": int(encoded[_size_field]),
+        "encode_time": encode_time,
+    }
+
+
+@qmla.tracing.traced(category="redis")
+def load_learned_info(database, key, fields=None, storage_summary=None):
+    r"""
+    Retrieve a model's learned info from a redis database.
+
+    :param redis.StrictRedis database: database on which the info is stored,
+        usually ``learned_models_info_db``.
+    :param str key: key for this model.
+    :param list fields: names of fields to retrieve, e.g. :attr:`comparison_fields`;
+        if None, all fields are retrieved.
+    :param dict storage_summary: if a dict is passed, it is updated with
+        the number of bytes fetched, the number stored for this model in total,
+        and the time taken to decode.
+    :return dict learned_info: requested fields of the model's learned info.
+    """
+
+    try:
+        if fields is None:
+            encoded = database.hgetall(key)
+        else:
+            meta_fields = [_version_field, _size_field]
+            values = database.hmget(key, meta_fields + list(fields))
+            encoded = dict(zip(meta_fields + list(fields), values))
+    except redis.exceptions.ResponseError:
+        # stored as a single pickle by an earlier version
+        learned_info = pickle.loads(database.get(key), encoding="latin1")
+        if fields is not None:
+            learned_info = {f: learned_info[f] for f in fields}
+        return learned_info
+
+    encoded = {
+        (k.decode() if isinstance(k, bytes) else k): v for k, v in encoded.items()
+    }
+    if len(encoded) == 0 or encoded.get(_version_field) is None:
+        raise KeyError("No learned info stored for key {}".format(key))
+    missing_fields = [f for f, v in encoded.items() if v is None]
+    if len(missing_fields) > 0:
+        raise KeyError(
+            "Learned info for key {} has no fields {}".format(key, missing_fields)
+        )
+
+    t_init = time.time()
+    learned_info = decode_learned_info(encoded, fields=fields)
+    if storage_summary is not None:
+        storage_summary["num_bytes_fetched"] = sum([len(v) for v in encoded.values()])
+        storage_summary["num_bytes_stored"] = int(encoded[_size_field])
+        storage_summary["decode_time"] = time.time() - t_init
+    return learned_info
@@ -2,7 +2,6 @@ import os
 import sys
 
 import pickle
-import pandas as pd
 
 import qmla
 
@@ -23,6 +22,8 @@ def load_results(
     :param str results_time: time at which the run was started
     :param str results_folder: elements of path to results storage
     """
+    import pandas as pd
+
     result_data = {}
 
     if results_folder is None:
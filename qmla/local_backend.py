@@ -0,0 +1,464 @@
+import collections
+import concurrent.futures
+import fnmatch
+import functools
+import heapq
+import itertools
+import os
+import threading
+import time
+from multiprocessing.managers import BaseManager, BaseProxy
+
+import redis
+
+import qmla.redis_settings
+
+r"""
+Run a QMLA instance in parallel on a single machine, without Redis or RQ.
+
+By default, parallel QMLA requires a redis server, which holds the databases
+listed in ``qmla.redis_settings.databases_required``, and RQ workers
+(``rq_worker_qmla.py``) which run jobs from the redis queue.
+Instead, :class:`LocalParallelBackend` holds those databases in memory,
+in a server process started through :mod:`multiprocessing.managers`,
+and runs jobs on a ``concurrent.futures.ProcessPoolExecutor``.
+Jobs wait in a priority queue until a process is free,
+as RQ workers take jobs from their highest priority queue first.
+
+Jobs are the same functions enqueued on RQ
+(:func:`~qmla.remote_learn_model_parameters` and
+:func:`~qmla.remote_bayes_factor_calculation`), and they follow the same
+protocol: they find the databases through
+:func:`~qmla.redis_settings.get_redis_databases_by_qmla_id`,
+store their results and increment the branch counters on them,
+and announce completion through a
+:class:`~qmla.completion_events.RedisCompletionChannel`.
+:class:`LocalDatabase` implements the subset of the redis API which QMLA uses,
+with the same semantics (e.g. values are returned as bytes),
+so none of that code depends on which backend is used.
+
+Select this backend with ``--parallel_backend local``
+(see :func:`~qmla.controls_qmla.parse_cmd_line_args`).
+"""
+
+__all__ = [
+    "LocalDatabase",
+    "LocalDatabaseManager",
+    "LocalParallelBackend",
+]
+
+_wrong_type_error = "WRONGTYPE Operation against a key holding the wrong kind of value"
+
+
+def _encode(value):
+    r"""Bytes representation of a key or value, as stored by redis-py."""
+    if isinstance(value, bytes):
+        return value
+    elif isinstance(value, str):
+        return value.encode()
+    elif isinstance(value, bool):
+        raise redis.exceptions.DataError(
+            "Invalid input of type: 'bool'. Convert to a bytes, string, int or float first."
+        )
+    elif isinstance(value, int):
+        return str(value).encode()
+    elif isinstance(value, float):
+        return repr(value).encode()
+    raise redis.exceptions.DataError(
+        "Invalid input of type: '{}'. Convert to a bytes, string, int or float first.".format(
+            type(value).__name__
+        )
+    )
+
+
+class LocalDatabase:
+    r"""
+    In-memory equivalent of a single ``redis.StrictRedis`` database.
+
+    Supports the string, hash and list commands used by QMLA.
+    All commands hold a lock, so concurrent jobs see each command
+    (and each pipeline) as atomic, as on a redis server.
+    Held in a :class:`LocalDatabaseManager` server process and used
+    through :class:`LocalDatabaseProxy` by all other processes.
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._condition = threading.Condition(threading.RLock())
+
+    def _get_typed(self, name, data_type):
+        value = self._data.get(_encode(name))
+        if value is not None and not isinstance(value, data_type):
+            raise redis.exceptions.ResponseError(_wrong_type_error)
+        return value
+
+    # Strings
+    def get(self, name):
+        with self._condition:
+            return self._get_typed(name, bytes)
+
+    def set(self, name, value):
+        with self._condition:
+            self._data[_encode(name)] = _encode(value)
+            return True
+
+    def mget(self, keys, *args):
+        if isinstance(keys, (str, bytes)):
+            keys = [keys]
+        with self._condition:
+            values = [self._data.get(_encode(k)) for k in list(keys) + list(args)]
+        # as redis, None for keys which do not hold strings
+        return [v if isinstance(v, bytes) else None for v in values]
+
+    def incr(self, name, amount=1):
+        with self._condition:
+            value = self._get_typed(name, bytes)
+            value = int(value if value is not None else 0) + amount
+            self._data[_encode(name)] = _encode(value)
+            return value
+
+    def __getitem__(self, name):
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    # Keys
+    def keys(self, pattern="*"):
+        with self._condition:
+            pattern = _encode(pattern).decode()
+            return [k for k in self._data if fnmatch.fnmatchcase(k.decode(), pattern)]
+
+    def exists(self, *names):
+        with self._condition:
+            return sum([_encode(n) in self._data for n in names])
+
+    def __contains__(self, name):
+        return self.exists(name) == 1
+
+    def delete(self, *names):
+        with self._condition:
+            return sum([self._data.pop(_encode(n), None) is not None for n in names])
+
+    def flushdb(self):
+        with self._condition:
+            self._data.clear()
+            return True
+
+    # Hashes
+    def hset(self, name, key=None, value=None, mapping=None):
+        items = {}
+        if key is not None:
+            items[key] = value
+        if mapping is not None:
+            items.update(mapping)
+        with self._condition:
+            stored = self._get_typed(name, dict)
+            if stored is None:
+                stored = self._data[_encode(name)] = {}
+            num_new_fields = len([k for k in items if _encode(k) not in stored])
+            stored.update({_encode(k): _encode(v) for k, v in items.items()})
+            return num_new_fields
+
+    def hget(self, name, key):
+        with self._condition:
+            stored = self._get_typed(name, dict)
+            return None if stored is None else stored.get(_encode(key))
+
+    def hgetall(self, name):
+        with self._condition:
+            return dict(self._get_typed(name, dict) or {})
+
+    def hmget(self, name, keys, *args):
+        if isinstance(keys, (str, bytes)):
+            keys = [keys]
+        with self._condition:
+            stored = self._get_typed(name, dict) or {}
+            return [stored.get(_encode(k)) for k in list(keys) + list(args)]
+
+    # Lists
+    def rpush(self, name, *values):
+        with self._condition:
+            stored = self._get_typed(name, list)
+            if stored is None:
+                stored = self._data[_encode(name)] = []
+            stored.extend([_encode(v) for v in values])
+            self._condition.notify_all()
+            return len(stored)
+
+    def lrange(self, name, start, end):
+        with self._condition:
+            stored = self._get_typed(name, list) or []
+            # redis ranges include the end index
+            end = len(stored) if end == -1 else end + 1
+            return stored[start:end]
+
+    def blpop(self, keys, timeout=0):
+        r"""Pop the first element of the first non-empty list, waiting up to ``timeout`` seconds (0 waits indefinitely)."""
+        if isinstance(keys, (str, bytes)):
+            keys = [keys]
+        deadline = None if timeout == 0 else time.time() + timeout
+        with self._condition:
+            while True:
+                for name in keys:
+                    stored = self._get_typed(name, list)
+                    if stored:
+                        value = stored.pop(0)
+                        if len(stored) == 0:
+                            del self._data[_encode(name)]
+                        return (_encode(name), value)
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+
+    def execute_pipeline(self, commands):
+        r"""Run a list of ``(method name, args, kwargs)`` atomically, returning their results."""
+        with self._condition:
+            return [
+                getattr(self, name)(*args, **kwargs) for name, args, kwargs in commands
+            ]
+
+
+class LocalPipeline:
+    r"""
+    Buffers commands for a :class:`LocalDatabase`, to execute together,
+    in the manner of a ``redis.client.Pipeline``.
+    """
+
+    def __init__(self, database):
+        self._database = database
+        self._commands = []
+
+    def __getattr__(self, name):
+        def buffer_command(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return buffer_command
+
+    def execute(self):
+        commands, self._commands = self._commands, []
+        return self._database.execute_pipeline(commands)
+
+
+class LocalDatabaseProxy(BaseProxy):
+    r"""
+    Access to a :class:`LocalDatabase` held by a :class:`LocalDatabaseManager`,
+    from any process. Picklable, so can be passed to pool processes.
+    """
+
+    _exposed_ = (
+        "get",
+        "set",
+        "mget",
+        "incr",
+        "__getitem__",
+        "keys",
+        "exists",
+        "__contains__",
+        "delete",
+        "flushdb",
+        "hset",
+        "hget",
+        "hgetall",
+        "hmget",
+        "rpush",
+        "lrange",
+        "blpop",
+        "execute_pipeline",
+    )
+
+    def get(self, name):
+        return self._callmethod("get", (name,))
+
+    def set(self, name, value):
+        return self._callmethod("set", (name, value))
+
+    def mget(self, keys, *args):
+        return self._callmethod("mget", (keys,) + args)
+
+    def incr(self, name, amount=1):
+        return self._callmethod("incr", (name, amount))
+
+    def __getitem__(self, name):
+        return self._callmethod("__getitem__", (name,))
+
+    def keys(self, pattern="*"):
+        return self._callmethod("keys", (pattern,))
+
+    def exists(self, *names):
+        return self._callmethod("exists", names)
+
+    def __contains__(self, name):
+        return self._callmethod("__contains__", (name,))
+
+    def delete(self, *names):
+        return self._callmethod("delete", names)
+
+    def flushdb(self):
+        return self._callmethod("flushdb")
+
+    def hset(self, name, key=None, value=None, mapping=None):
+        return self._callmethod("hset", (name, key, value, mapping))
+
+    def hget(self, name, key):
+        return self._callmethod("hget", (name, key))
+
+    def hgetall(self, name):
+        return self._callmethod("hgetall", (name,))
+
+    def hmget(self, name, keys, *args):
+        return self._callmethod("hmget", (name, keys) + args)
+
+    def rpush(self, name, *values):
+        return self._callmethod("rpush", (name,) + values)
+
+    def lrange(self, name, start, end):
+        return self._callmethod("lrange", (name, start, end))
+
+    def blpop(self, keys, timeout=0):
+        return self._callmethod("blpop", (keys, timeout))
+
+    def execute_pipeline(self, commands):
+        return self._callmethod("execute_pipeline", (commands,))
+
+    def pipeline(self):
+        return LocalPipeline(self)
+
+
+class LocalDatabaseManager(BaseManager):
+    r"""Server process holding :class:`LocalDatabase` instances."""
+
+
+LocalDatabaseManager.register(
+    "LocalDatabase", LocalDatabase, proxytype=LocalDatabaseProxy
+)
+
+
+def _initialise_worker(host_name, port_number, qmla_id, databases):
+    # jobs retrieve databases by QMLA ID: point them to the local databases
+    qmla.redis_settings.set_redis_databases_by_qmla_id(
+        host_name, port_number, qmla_id, databases
+    )
+
+
+class LocalParallelBackend:
+    r"""
+    Local databases and a process pool, standing in for a redis server and RQ workers.
+
+    On construction, a :class:`LocalDatabaseManager` is started, holding
+    one :class:`LocalDatabase` for each of ``qmla.redis_settings.databases_required``.
+    These are registered (in this process and in each pool process) as the databases
+    of this QMLA instance, so calls to
+    :func:`~qmla.redis_settings.get_redis_databases_by_qmla_id`
+    return them instead of connecting to a redis server.
+
+    :param str host_name: host name of the QMLA instance, used only to
+        identify its databases.
+    :param int port_number: port number of the QMLA instance, used only to
+        identify its databases.
+    :param int qmla_id: ID of the QMLA instance.
+    :param int num_workers: number of processes to run jobs on;
+        if None, the number of CPUs on this machine.
+    """
+
+    def __init__(self, host_name, port_number, qmla_id, num_workers=None):
+        self.host_name = host_name
+        self.port_number = port_number
+        self.qmla_id = qmla_id
+        if num_workers is None:
+            num_workers = os.cpu_count()
+        self.num_workers = num_workers
+
+        self.manager = LocalDatabaseManager()
+        self.manager.start()
+        self.databases = {
+            name: self.manager.LocalDatabase()
+            for name in qmla.redis_settings.databases_required
+        }
+        qmla.redis_settings.set_redis_databases_by_qmla_id(
+            host_name, port_number, qmla_id, self.databases
+        )
+
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            initializer=_initialise_worker,
+            initargs=(host_name, port_number, qmla_id, self.databases),
+        )
+        self.jobs = collections.OrderedDict()
+
+        # jobs are handed to the pool only when a process is free,
+        # so that jobs submitted later with higher priority start first
+        self._queued_jobs = []
+        self._num_running_jobs = 0
+        self._job_counter = itertools.count()
+        self._condition = threading.Condition(threading.RLock())
+
+    def submit(self, job_name, function, priority=0, **kwargs):
+        r"""
+        Run ``function(**kwargs)`` on the process pool.
+
+        :param str job_name: name to identify the job, e.g. in
+            :meth:`raise_failed_jobs`.
+        :param callable function: job to run; must be importable by the pool processes,
+            e.g. :func:`~qmla.remote_learn_model_parameters`.
+        :param int priority: queued jobs of higher priority start first;
+            jobs of equal priority start in the order they were submitted.
+        :return concurrent.futures.Future job: the submitted job.
+        """
+
+        job = concurrent.futures.Future()
+        with self._condition:
+            heapq.heappush(
+                self._queued_jobs,
+                (-priority, next(self._job_counter), job, function, kwargs),
+            )
+            self.jobs[job_name] = job
+        self._start_queued_jobs()
+        return job
+
+    def _start_queued_jobs(self):
+        with self._condition:
+            while self._queued_jobs and self._num_running_jobs < self.num_workers:
+                _, _, job, function, kwargs = heapq.heappop(self._queued_jobs)
+                if not job.set_running_or_notify_cancel():
+                    continue
+                self._num_running_jobs += 1
+                try:
+                    pool_job = self.executor.submit(function, **kwargs)
+                except Exception as e:
+                    self._num_running_jobs -= 1
+                    job.set_exception(e)
+                    continue
+                pool_job.add_done_callback(functools.partial(self._job_finished, job))
+
+    def _job_finished(self, job, pool_job):
+        with self._condition:
+            self._num_running_jobs -= 1
+            self._condition.notify_all()
+        if pool_job.exception() is not None:
+            job.set_exception(pool_job.exception())
+        else:
+            job.set_result(pool_job.result())
+        self._start_queued_jobs()
+
+    def raise_failed_jobs(self):
+        r"""Raise the exception of any job which has failed."""
+        for job_name, job in self.jobs.items():
+            if job.done() and job.exception() is not None:
+                raise RuntimeError(
+                    "Local job {} failed: {}".format(job_name, repr(job.exception()))
+                ) from job.exception()
+
+    def shutdown(self):
+        r"""Wait for queued and running jobs, then stop the process pool and the database server."""
+        with self._condition:
+            self._condition.wait_for(
+                lambda: not self._queued_jobs and self._num_running_jobs == 0
+            )
+        self.executor.shutdown(wait=True)
+        qmla.redis_settings.set_redis_databases_by_qmla_id(
+            self.host_name, self.port_number, self.qmla_id, None
+        )
+        self.manager.shutdown()
@@ -1,44 +1,214 @@
-import datetime
+import atexit
+import functools
+import logging
+import multiprocessing.util
+import os
+import queue
+import threading
+import time
 
-__all__ = ["print_to_log"]
+r"""
+Logging to the log files of QMLA instances.
 
+All logging goes through :func:`print_to_log`, which is called by the
+``log_print`` methods of most QMLA classes, often within per-epoch loops.
+Rather than opening the log file for every line, entries are queued,
+and written in batches (one ``open`` per log file per batch)
+by a background thread, every ``flush_interval`` seconds
+or when ``max_buffered`` entries are waiting.
+Entries are flushed when the process exits, when a job decorated with
+:func:`flushes_logs` finishes (workers may exit without running ``atexit``
+handlers), and on request by :func:`flush_logs`.
 
-def _time_seconds():
-    r"""return current time in h:m:s format for logging."""
-    now = datetime.date.today()
-    time = str(
-        "{}_{}/{}:{}:{}".format(
-            now.strftime("%b"),
-            now.day,
-            datetime.datetime.now().hour,
-            datetime.datetime.now().minute,
-            datetime.datetime.now().second,
-        )
+Entries have a level (those of the standard :mod:`logging` module);
+entries below the level set by :func:`configure_logging`
+(by default ``INFO``, or the environment variable ``QMLA_LOG_LEVEL``)
+are discarded before their message is formatted.
+``log_print`` methods write at ``INFO``, and ``log_print_debug`` methods
+at ``DEBUG``; running with ``debug_mode`` sets the level to ``DEBUG``.
+"""
+
+__all__ = ["print_to_log", "flush_logs", "flushes_logs", "configure_logging"]
+
+# levels, as qmla.logging.DEBUG etc.
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+
+def _time_seconds(timestamp=None):
+    r"""return (current) time in h:m:s format for logging."""
+    now = time.localtime(timestamp)
+    return "{}_{}/{}:{}:{}".format(
+        time.strftime("%b", now), now.tm_mday, now.tm_hour, now.tm_min, now.tm_sec
     )
-    return time
 
 
-def print_to_log(to_print_list, log_file, log_identifier=""):
+class _LogWriter:
+    r"""
+    Queue of log entries, written to their log files by a background thread.
+
+    The queue and thread belong to the process which created them;
+    a forked child process starts its own, discarding entries queued by its parent
+    (which the parent still writes).
+
+    :param float flush_interval: seconds between writes by the background thread.
+    :param int max_buffered: number of queued entries which triggers an early write.
+    """
+
+    def __init__(self, flush_interval=0.5, max_buffered=10000):
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self._pid = None
+
+    def _start(self):
+        self._pid = os.getpid()
+        self._queue = queue.Queue()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="qmla-log-writer", daemon=True
+        )
+        self._thread.start()
+        # processes started by multiprocessing exit without calling atexit handlers
+        multiprocessing.util.Finalize(None, self.flush, exitpriority=100)
+
+    def put(self, log_file, timestamp, identifier, message):
+        if self._pid != os.getpid():
+            self._start()
+        self._queue.put((log_file, timestamp, identifier, message))
+        if self._queue.qsize() >= self.max_buffered:
+            self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                # e.g. log directory removed; never kill the writer
+                pass
+
+    def flush(self):
+        r"""Write all queued entries, in the order they were queued."""
+
+        if self._pid != os.getpid():
+            # nothing queued by this process
+            return
+        with self._write_lock:
+            entries_by_file = {}
+            while True:
+                try:
+                    log_file, timestamp, identifier, message = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                entries_by_file.setdefault(log_file, []).append(
+                    "{} [{}] {}\n".format(_time_seconds(timestamp), identifier, message)
+                )
+            for log_file, lines in entries_by_file.items():
+                with open(log_file, "a") as write_log_file:
+                    write_log_file.writelines(lines)
+
+
+def _level_number(level):
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            raise ValueError("Unknown log level {}".format(level))
+    return level
+
+
+_writer = _LogWriter()
+_settings = {
+    "level": _level_number(os.environ.get("QMLA_LOG_LEVEL", "INFO")),
+    "buffered": True,
+}
+atexit.register(_writer.flush)
+
+
+def configure_logging(level=None, buffered=None, flush_interval=None):
+    r"""
+    Configure logging for this process.
+
+    :param level: lowest level of entries written, e.g. ``qmla.logging.DEBUG``
+        or ``"DEBUG"``; unchanged if None.
+    :param bool buffered: whether entries are queued and written by the
+        background thread; if False, each entry is written immediately,
+        e.g. when debugging a process which crashes without exiting cleanly.
+        Unchanged if None.
+    :param float flush_interval: seconds between writes of queued entries;
+        unchanged if None.
+    """
+
+    if level is not None:
+        _settings["level"] = _level_number(level)
+    if buffered is not None:
+        if not buffered:
+            _writer.flush()
+        _settings["buffered"] = buffered
+    if flush_interval is not None:
+        _writer.flush_interval = flush_interval
+
+
+def flush_logs():
+    r"""Write all log entries queued by this process."""
+    _writer.flush()
+
+
+def flushes_logs(function):
+    r"""Decorator: flush log entries when ``function`` returns or raises, e.g. for jobs run by workers."""
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _writer.flush()
+
+    return wrapper
+
+
+def print_to_log(to_print_list, log_file, log_identifier="", level=INFO):
     """
     Writes to the log file, registering the time and identifier.
 
     Adds the content of `to_print_list` to the `log_file`,
     using the `log_identifier` to indicate where a given
     log entry originated.
+    The entry is written by a background thread, shortly afterwards,
+    unless buffering is disabled by :func:`configure_logging`.
 
-    :param to_print_list: string you want to print
-    :type to_print_list: str() or list()
+    :param to_print_list: string you want to print; or a function
+        which returns it, only called if the entry is logged
+        (so expensive messages are only formatted when needed).
+    :type to_print_list: str() or list() or callable
     :param log_file: path of the log file you want to update
     :type log_file: str()
     :param log_identifier: identifier for the log
     :type log_identifier: str()
+    :param level: level of the entry; discarded if below the configured level.
+    :type level: int()
 
     """
+    if level < _settings["level"]:
+        return
+    timestamp = time.time()
+    if callable(to_print_list):
+        to_print_list = to_print_list()
     if not isinstance(to_print_list, list):
         to_print_list = list(to_print_list)
-    identifier = str(str(_time_seconds()) + " [" + log_identifier + "]")
+    # format now: objects in the list may change before the entry is written
+    to_print = " ".join([str(s) for s in to_print_list])
 
-    print_strings = [str(s) for s in to_print_list]
-    to_print = " ".join(print_strings)
-    with open(log_file, "a") as write_log_file:
-        print(identifier, str(to_print), file=write_log_file, flush=True)
+    if _settings["buffered"]:
+        _writer.put(log_file, timestamp, log_identifier, to_print)
+    else:
+        with open(log_file, "a") as write_log_file:
+            print(
+                "{} [{}]".format(_time_seconds(timestamp), log_identifier),
+                to_print,
+                file=write_log_file,
+                flush=True,
+            )
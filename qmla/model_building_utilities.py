@@ -3,6 +3,7 @@ from __future__ import print_function
 import numpy as np
 import copy
 import pandas as pd
+from scipy import sparse
 
 import qmla.logging
 
@@ -29,6 +30,43 @@ core_operator_dict = {
     "d": np.array([[0 + 0.0j, 0 + 0.0j], [0 + 0.0j, 1 + 0.0j]]),  # Subtract
 }
 
+
+def core_operator(pauli_symbol, sparse_representation=False):
+    r"""
+    Matrix of a core operator, as a dense array or a sparse CSR matrix.
+
+    :param str pauli_symbol: key of :attr:`~qmla.core_operator_dict`
+    :param bool sparse_representation: whether to return a CSR matrix
+    """
+    if sparse_representation:
+        return sparse.csr_matrix(core_operator_dict[pauli_symbol])
+    return core_operator_dict[pauli_symbol]
+
+
+def sparse_tensor_product(core_symbols):
+    r"""
+    Sparse (CSR) tensor product of a sequence of core operators.
+
+    Builds the nonzero elements of e.g. ``X (x) I (x) Z`` directly from those of the
+    single-qubit operators, so cost scales with the number of nonzeros
+    of the result rather than with the full matrix dimension.
+
+    :param list core_symbols: keys of :attr:`~qmla.core_operator_dict`,
+        ordered by qubit, e.g. ``['x', 'i', 'z']``
+    :return sparse.csr_matrix: operator acting on ``len(core_symbols)`` qubits
+    """
+    rows = np.zeros(1, dtype=np.int64)
+    cols = np.zeros(1, dtype=np.int64)
+    values = np.ones(1, dtype=np.complex128)
+    for symbol in core_symbols:
+        operator = core_operator_dict[symbol]
+        op_rows, op_cols = np.nonzero(operator)
+        rows = (2 * rows[:, np.newaxis] + op_rows).ravel()
+        cols = (2 * cols[:, np.newaxis] + op_cols).ravel()
+        values = (values[:, np.newaxis] * operator[op_rows, op_cols]).ravel()
+    dim = 2 ** len(core_symbols)
+    return sparse.csr_matrix((values, (rows, cols)), shape=(dim, dim))
+
 ##########
 # Section: functions for constructing models.
 # compte methods are called recursively on names to
@@ -36,7 +74,7 @@ core_operator_dict = {
 ##########
 
 
-def compute_t(inp):
+def compute_t(inp, sparse_representation=False):
     """
     Assuming largest instance of action on inp is tensor product, T.
     Parse string.
@@ -49,22 +87,25 @@ def compute_t(inp):
 
     if max_p == 0 and max_t == 0:
         pauli_symbol = inp
-        return core_operator_dict[pauli_symbol]
+        return core_operator(pauli_symbol, sparse_representation)
 
     elif max_t == 0:
-        return compute(inp)
+        return compute(inp, sparse_representation)
     else:
         to_tens = inp.split(t_str)
-        running_tens_prod = compute(to_tens[0])
+        running_tens_prod = compute(to_tens[0], sparse_representation)
         for i in range(1, len(to_tens)):
             max_p, p_str = find_max_letter(to_tens[i], "P")
             max_t, t_str = find_max_letter(to_tens[i], "T")
-            rhs = compute(to_tens[i])
-            running_tens_prod = np.kron(running_tens_prod, rhs)
+            rhs = compute(to_tens[i], sparse_representation)
+            if sparse_representation:
+                running_tens_prod = sparse.kron(running_tens_prod, rhs, format="csr")
+            else:
+                running_tens_prod = np.kron(running_tens_prod, rhs)
         return running_tens_prod
 
 
-def compute_p(inp):
+def compute_p(inp, sparse_representation=False):
     """
     Assuming largest instance of action on inp is addition, P.
     Parse string.
@@ -79,21 +120,21 @@ def compute_p(inp):
         p_str = "+"
     elif max_p == 0 and max_t == 0:
         pauli_symbol = inp
-        return core_operator_dict[pauli_symbol]
+        return core_operator(pauli_symbol, sparse_representation)
     elif max_p == 0:
-        return compute(inp)
+        return compute(inp, sparse_representation)
     to_add = inp.split(p_str)
-    running_sum = empty_array_of_same_dim(to_add[0])
+    running_sum = empty_array_of_same_dim(to_add[0], sparse_representation)
     for i in range(len(to_add)):
         max_p, p_str = find_max_letter(to_add[i], "P")
         max_t, t_str = find_max_letter(to_add[i], "T")
-        rhs = compute(to_add[i])
-        running_sum += rhs
+        rhs = compute(to_add[i], sparse_representation)
+        running_sum = running_sum + rhs
 
     return running_sum
 
 
-def compute_m(inp):
+def compute_m(inp, sparse_representation=False):
     """
     Assuming largest instance of action on inp is multiplication, M.
     Parse string.
@@ -108,10 +149,10 @@ def compute_m(inp):
 
     if max_m == 0 and max_t == 0 and max_p == 0:
         pauli_symbol = inp
-        return core_operator_dict[pauli_symbol]
+        return core_operator(pauli_symbol, sparse_representation)
 
     elif max_m == 0:
-        return compute(inp)
+        return compute(inp, sparse_representation)
 
     else:
         to_mult = inp.split(m_str)
@@ -123,20 +164,26 @@ def compute_m(inp):
         num_qubits = len(t_str) + 1
         dim = 2 ** num_qubits
 
-        running_product = np.eye(dim)
+        if sparse_representation:
+            running_product = sparse.identity(dim, dtype=np.complex128, format="csr")
+        else:
+            running_product = np.eye(dim)
 
         for i in range(len(to_mult)):
-            running_product = np.dot(running_product, compute(to_mult[i]))
+            running_product = running_product @ compute(
+                to_mult[i], sparse_representation
+            )
 
         return running_product
 
 
-def compute(inp):
+def compute(inp, sparse_representation=False):
     """
     Parse string.
     Recursively call compute() functions (compute_t, compute_p, compute_m).
     Tensor product, multiply or sum resulting lists.
-    Return operator which is specified by inp.
+    Return operator which is specified by inp,
+    as a sparse CSR matrix if sparse_representation, otherwise a dense array.
     """
     from qmla.process_string_to_matrix import process_basic_operator
 
@@ -145,19 +192,21 @@ def compute(inp):
     max_m, m_str = find_max_letter(inp, "M")
 
     if "+" in inp:
-        return compute_p(inp)
+        return compute_p(inp, sparse_representation)
     if max_m == 0 and max_t == 0 and max_p == 0:
         basic_operator = inp
         # call subroutine which can interpret a "basic operator"
         # basic operators are defined with the function
         # they are terms which can not be separated further by P,M,T or +
-        return process_basic_operator(basic_operator)
+        return process_basic_operator(
+            basic_operator, sparse_representation=sparse_representation
+        )
     elif max_m > max_t:
-        return compute_m(inp)
+        return compute_m(inp, sparse_representation)
     elif max_t >= max_p:
-        return compute_t(inp)
+        return compute_t(inp, sparse_representation)
     else:
-        return compute_p(inp)
+        return compute_p(inp, sparse_representation)
 
 
 ##########
@@ -289,13 +338,15 @@ def get_constituent_names_from_name(name):
     return name.split("+")
 
 
-def empty_array_of_same_dim(name):
+def empty_array_of_same_dim(name, sparse_representation=False):
     """
     Parse name to find size of system it acts on.
     Produce an empty matrix of that dimension and return it.
     """
     num_qubits = get_num_qubits(name)
     dim = 2 ** num_qubits
+    if sparse_representation:
+        return sparse.csr_matrix((dim, dim), dtype=np.complex128)
     empty_mtx = np.zeros([dim, dim], dtype=np.complex128)
     return empty_mtx
 
@@ -13,6 +13,10 @@ import qmla.redis_settings
 import qmla.logging
 import qmla.get_exploration_strategy
 import qmla.model_building_utilities
+import qmla.operator_cache
+import qmla.learned_info_storage
+import qmla.worker_cache
+import qmla.tracing
 
 pickle.HIGHEST_PROTOCOL = 4
 
@@ -48,6 +52,7 @@ class ModelInstanceForComparison:
 
     """
 
+    @qmla.tracing.traced("load_model_for_comparison", category="comparison")
     def __init__(
         self,
         model_id,
@@ -66,28 +71,21 @@ class ModelInstanceForComparison:
 
         # Get essential data
         if qmla_core_info_database is None:
-            redis_databases = qmla.redis_settings.get_redis_databases_by_qmla_id(
+            qmla_core_info_database = qmla.worker_cache.get_qmla_core_info(
                 host_name, port_number, qid
             )
-            qmla_core_info_database = redis_databases["qmla_core_info_database"]
-            qmla_core_info_dict = pickle.loads(
-                qmla_core_info_database.get("qmla_settings")
-            )
-            self.probes_system = pickle.loads(qmla_core_info_database["probes_system"])
-            self.probes_simulator = pickle.loads(
-                qmla_core_info_database["probes_simulator"]
-            )
-        else:
+        qmla_core_info_dict = qmla_core_info_database.get("qmla_settings")
+        self.probes_system = qmla_core_info_database["probes_system"]
+        self.probes_simulator = qmla_core_info_database["probes_simulator"]
 
-            qmla_core_info_dict = qmla_core_info_database.get("qmla_settings")
-            self.probes_system = qmla_core_info_database["probes_system"]
-            self.probes_simulator = qmla_core_info_database["probes_simulator"]
-
-        self.plot_probes = pickle.load(
-            open(qmla_core_info_dict["probes_plot_file"], "rb")
+        self.plot_probes = qmla.worker_cache.get_plot_probes(
+            qmla_core_info_dict["probes_plot_file"]
         )
         self.plots_directory = qmla_core_info_dict["plots_directory"]
         self.debug_mode = qmla_core_info_dict["debug_mode"]
+        if self.debug_mode:
+            # entries from log_print_debug are at DEBUG level
+            qmla.logging.configure_logging(level=qmla.logging.DEBUG)
         self.plot_level = qmla_core_info_dict["plot_level"]
         self.figure_format = qmla_core_info_dict["figure_format"]
 
@@ -100,13 +98,23 @@ class ModelInstanceForComparison:
         self.true_model_name = qmla_core_info_dict["true_name"]
         self.true_param_dict = qmla_core_info_dict["true_param_dict"]
         self.true_model_constructor = qmla_core_info_dict["true_model_constructor"]
+        self.true_hamiltonian_spectrum = qmla_core_info_dict[
+            "true_hamiltonian_spectrum"
+        ]
         self.experimental_measurements = qmla_core_info_dict[
             "experimental_measurements"
         ]
         self.experimental_measurement_times = qmla_core_info_dict[
             "experimental_measurement_times"
         ]
+        self.experimental_data_index = qmla.worker_cache.get_experimental_data_index(
+            qmla_core_info_dict["experimental_data_index_file"]
+        )
         self.results_directory = qmla_core_info_dict["results_directory"]
+        qmla.operator_cache.configure_operator_cache(
+            max_size=qmla_core_info_dict["operator_cache_size"],
+            persistence_directory=qmla_core_info_dict["operator_cache_directory"],
+        )
 
         if learned_model_info is None:
             # Get data specific to this model, learned elsewhere and stored on
@@ -121,17 +129,28 @@ class ModelInstanceForComparison:
                 raise
 
             model_id_str = str(float(model_id))
+            storage_summary = {}
             try:
-                learned_model_info = pickle.loads(
-                    learned_models_info_db.get(model_id_str), encoding="latin1"
+                # only fetch the fields needed for comparisons
+                learned_model_info = qmla.learned_info_storage.load_learned_info(
+                    database=learned_models_info_db,
+                    key=model_id_str,
+                    fields=qmla.learned_info_storage.comparison_fields,
+                    storage_summary=storage_summary,
+                )
+            except:
+                self.log_print(["Failed to unload model data for comparison"])
+                raise
+            if storage_summary:
+                self.log_print(
+                    [
+                        "Fetched {} of {} stored bytes; decoded in {:.3f}s".format(
+                            storage_summary["num_bytes_fetched"],
+                            storage_summary["num_bytes_stored"],
+                            storage_summary["decode_time"],
+                        )
+                    ]
                 )
-            except BaseException:
-                try:
-                    learned_model_info = pickle.loads(
-                        learned_models_info_db.get(model_id_str)
-                    )
-                except:
-                    self.log_print(["Failed to unload model data for comparison"])
 
         # Assign parameters from model learned info, retrieved from database
         self.model_name = learned_model_info["name"]
@@ -190,9 +209,11 @@ class ModelInstanceForComparison:
             exploration_rules=self.exploration_strategy_of_this_model,
             experimental_measurements=self.experimental_measurements,
             experimental_measurement_times=self.experimental_measurement_times,
+            experimental_data_index=self.experimental_data_index,
             qmla_id=self.qmla_id,
             log_file=self.log_file,
             debug_mode=self.debug_mode,
+            true_hamiltonian_spectrum=self.true_hamiltonian_spectrum,
         )
 
         # Reconstruct the updater from results of learning
@@ -257,12 +278,29 @@ class ModelInstanceForComparison:
     # Section: update for Bayes factor
     ##########
 
+    @qmla.tracing.traced(category="comparison")
     def update_log_likelihood(
         self,
         new_times,
         new_experimental_params,
+        batch_replay=None,
     ):
-        r""" """
+        r"""
+        Update this model's distribution using the experiments of its opponent.
+
+        The log total likelihood of the updater after these experiments is used
+        to compute the Bayes factor between the two models.
+
+        :param list new_times: times learned over by the opponent
+        :param np.ndarray new_experimental_params: experiments (time, probe ID)
+            on which the opponent was trained
+        :param bool batch_replay: whether to precompute the likelihoods of all
+            experiments through
+            :meth:`~qmla.shared_functionality.qinfer_model_interface.QInferModelQMLA.set_replay_experiments`,
+            rather than one experiment at a time. The result is identical.
+            Default None: use the exploration strategy's ``batch_bayes_factor_replay``.
+        :return float log_total_likelihood: of the updater after all experiments
+        """
 
         # Reduced normalization record using only experiments to consider
         experiment_id_to_keep = int(
@@ -290,9 +328,25 @@ class ModelInstanceForComparison:
         experiments_to_update_with = new_experimental_params[experiment_id_to_keep:]
         self.log_print(["Times to update length:", len(experiments_to_update_with)])
 
+        if batch_replay is None:
+            batch_replay = self.exploration_class.batch_bayes_factor_replay
+        if batch_replay:
+            batch_replay = self.qinfer_model.set_replay_experiments(
+                [(e["probe_id"][0], e["t"][0]) for e in experiments_to_update_with]
+            )
+        self.log_print(["Batch replay of experiments:", batch_replay])
+
         for experiment in experiments_to_update_with:
-            # sample from own updater/heuristic so particle is correct shape
-            experiment_for_update = self.experiment_design_heuristic(epoch_id=epoch_id)
+            if self.qinfer_model.iqle_mode:
+                # sample from own updater/heuristic so particle is correct shape
+                experiment_for_update = self.experiment_design_heuristic(
+                    epoch_id=epoch_id
+                )
+            else:
+                # only time and probe are used to compute likelihoods
+                experiment_for_update = np.zeros(
+                    1, dtype=self.qinfer_model.expparams_dtype
+                )
 
             # retrieve probe and time used by opponent
             experiment_for_update["probe_id"] = experiment["probe_id"][0]
@@ -309,9 +363,15 @@ class ModelInstanceForComparison:
 
             # update qinfer
             self.qinfer_updater.update(datum, experiment_for_update)
+            if self.qinfer_updater.just_resampled:
+                self.qinfer_model.particle_spectra.invalidate()
 
             epoch_id += 1
 
+        self.qinfer_model.clear_replay_experiments()
+        self.log_print(
+            ["Particle spectrum cache:", self.qinfer_model.particle_spectra.info()]
+        )
         self.log_print(["BF times:", self.bf_times])
         self.bf_times = qmla.utilities.flatten(self.bf_times)
         return self.qinfer_updater.log_total_likelihood
@@ -352,6 +412,7 @@ class ModelInstanceForComparison:
         self,
         to_print_list,
         log_identifier=None,
+        level=qmla.logging.INFO,
     ):
         r"""Wrapper for :func:`~qmla.print_to_log`"""
         if log_identifier is None:
@@ -363,13 +424,15 @@ class ModelInstanceForComparison:
             to_print_list=to_print_list,
             log_file=self.log_file,
             log_identifier=log_identifier,
+            level=level,
         )
 
     def log_print_debug(self, to_print_list):
-        r"""Log print if global debug_log_print set to True."""
+        r"""Log print at DEBUG level, if debug_mode set to True."""
 
         if self.debug_mode:
             self.log_print(
                 to_print_list=to_print_list,
                 log_identifier="Debug Comparison Model {}".format(self.model_id),
+                level=qmla.logging.DEBUG,
             )
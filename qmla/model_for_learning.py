@@ -11,7 +11,6 @@ import pandas as pd
 import qinfer as qi
 import matplotlib.pyplot as plt
 from matplotlib.gridspec import GridSpec
-import seaborn as sns
 import redis
 import pickle
 
@@ -25,8 +24,11 @@ import qmla.logging
 import qmla.get_exploration_strategy
 import qmla.shared_functionality.prior_distributions
 import qmla.model_building_utilities
-import qmla.analysis
 import qmla.utilities
+import qmla.operator_cache
+import qmla.worker_cache
+import qmla.epoch_recorder
+import qmla.tracing
 
 pickle.HIGHEST_PROTOCOL = 4
 
@@ -125,23 +127,14 @@ class ModelInstanceForLearning:
             If None, this is retrieved instead from the redis database.
         """
 
-        # Retrieve data held on redis databases.
-        redis_databases = qmla.redis_settings.get_redis_databases_by_qmla_id(
-            self.redis_host, self.redis_port_number, self.qmla_id
-        )
+        # Retrieve data held on redis databases (cached by this worker).
         if qmla_core_info_database is None:
-            qmla_core_info_database = redis_databases["qmla_core_info_database"]
-            qmla_core_info_dict = pickle.loads(
-                qmla_core_info_database.get("qmla_settings")
-            )
-            self.probes_system = pickle.loads(qmla_core_info_database["probes_system"])
-            self.probes_simulator = pickle.loads(
-                qmla_core_info_database["probes_simulator"]
+            qmla_core_info_database = qmla.worker_cache.get_qmla_core_info(
+                self.redis_host, self.redis_port_number, self.qmla_id
             )
-        else:
-            qmla_core_info_dict = qmla_core_info_database.get("qmla_settings")
-            self.probes_system = qmla_core_info_database["probes_system"]
-            self.probes_simulator = qmla_core_info_database["probes_simulator"]
+        qmla_core_info_dict = qmla_core_info_database.get("qmla_settings")
+        self.probes_system = qmla_core_info_database["probes_system"]
+        self.probes_simulator = qmla_core_info_database["probes_simulator"]
 
         # Extract data from core database
         self.num_particles = qmla_core_info_dict["num_particles"]
@@ -158,6 +151,9 @@ class ModelInstanceForLearning:
             self.is_true_model = False
         self.true_param_dict = qmla_core_info_dict["true_param_dict"]
         self.true_model_constructor = qmla_core_info_dict["true_model_constructor"]
+        self.true_hamiltonian_spectrum = qmla_core_info_dict[
+            "true_hamiltonian_spectrum"
+        ]
         self.times_to_plot = qmla_core_info_dict["plot_times"]
         self.experimental_measurements = qmla_core_info_dict[
             "experimental_measurements"
@@ -165,14 +161,24 @@ class ModelInstanceForLearning:
         self.experimental_measurement_times = qmla_core_info_dict[
             "experimental_measurement_times"
         ]
+        self.experimental_data_index = qmla.worker_cache.get_experimental_data_index(
+            qmla_core_info_dict["experimental_data_index_file"]
+        )
         self.true_params_path = qmla_core_info_dict["run_info_file"]
-        self.plot_probes = pickle.load(
-            open(qmla_core_info_dict["probes_plot_file"], "rb")
+        self.plot_probes = qmla.worker_cache.get_plot_probes(
+            qmla_core_info_dict["probes_plot_file"]
         )
         self.plots_directory = qmla_core_info_dict["plots_directory"]
         self.debug_mode = qmla_core_info_dict["debug_mode"]
+        if self.debug_mode:
+            # entries from log_print_debug are at DEBUG level
+            qmla.logging.configure_logging(level=qmla.logging.DEBUG)
         self.plot_level = qmla_core_info_dict["plot_level"]
         self.figure_format = qmla_core_info_dict["figure_format"]
+        qmla.operator_cache.configure_operator_cache(
+            max_size=qmla_core_info_dict["operator_cache_size"],
+            persistence_directory=qmla_core_info_dict["operator_cache_directory"],
+        )
 
         # Instantiate exploration strategy
         self.exploration_class = qmla.get_exploration_strategy.get_exploration_class(
@@ -231,9 +237,11 @@ class ModelInstanceForLearning:
             exploration_rules=self.exploration_strategy_of_this_model,
             experimental_measurements=self.experimental_measurements,
             experimental_measurement_times=self.experimental_measurement_times,
+            experimental_data_index=self.experimental_data_index,
             qmla_id=self.qmla_id,
             log_file=self.log_file,
             debug_mode=self.debug_mode,
+            true_hamiltonian_spectrum=self.true_hamiltonian_spectrum,
         )
 
         # Updater to perform Bayesian inference with
@@ -274,6 +282,11 @@ class ModelInstanceForLearning:
         self.log_print(["Heuristic built"])
         self.model_heuristic_class = self.model_heuristic.__class__.__name__
 
+        # Criteria to stop learning before all experiments are performed
+        self.early_stopping = self.exploration_class.get_early_stopping(
+            num_experiments=self.num_experiments
+        )
+
         self.prior_marginal = [
             self.qinfer_updater.posterior_marginal(idx_param=i)
             for i in range(self.model_constructor.num_terms)
@@ -302,10 +315,6 @@ class ModelInstanceForLearning:
         self.qhl_final_param_uncertainties = {}
 
         # Miscellaneous
-        self.progress_tracker = pd.DataFrame()
-        self.all_params_for_q_loss = list(
-            set(list(self.true_param_dict.keys())).union(self.model_terms_names)
-        )
         self.param_indices = {
             op_name: self.model_terms_names.index(op_name)
             for op_name in self.model_terms_names
@@ -314,12 +323,14 @@ class ModelInstanceForLearning:
         # To track at every epoch
         self.track_experimental_times = []
         self.track_experiment_parameters = []
-        self.volume_by_epoch = np.array([])
-        self.track_param_means = []
-        self.track_param_uncertainties = []
-        self.track_norm_cov_matrices = []
-        self.track_covariance_matrices = []
-        self.quadratic_losses_record = []
+        self.early_stopping_reason = None
+        # Distribution/experiment details: initial distribution, then each experiment
+        self.epoch_recorder = qmla.epoch_recorder.EpochRecorder(
+            num_epochs=self.num_experiments + 1,
+            model_terms_names=self.model_terms_names,
+            true_param_dict=self.true_param_dict,
+            track_covariance_matrices=self.exploration_class.track_cov_mtx,
+        )
         # Initialise all
         self._record_experiment_updates(update_step=0)
 
@@ -327,6 +338,7 @@ class ModelInstanceForLearning:
     # Section: Model learning
     ##########
 
+    @qmla.tracing.traced(category="learning")
     def update_model(
         self,
     ):
@@ -342,7 +354,9 @@ class ModelInstanceForLearning:
         This is done by calling the `update` method on the `qinfer_updater
         <http://docs.qinfer.org/en/latest/apiref/smc.html?highlight=smcupdater#smcupdater-smc-based-particle-updater>`_.
         Effects of the update are then recorded by :meth:`~qmla.ModelInstanceForLearning._record_experiment_updates`,
-        and terminate either upon convergence or after a fixed `num_experiments`.
+        and terminate either after a fixed `num_experiments`, or earlier if the exploration strategy's
+        ``early_stopping_criteria`` are met
+        (see :meth:`~qmla.exploration_strategies.ExplorationStrategy.get_early_stopping`).
         Final details are recorded by :meth:`~qmla.ModelInstanceForLearning._finalise_learning`.
 
         """
@@ -355,12 +369,13 @@ class ModelInstanceForLearning:
                 self.log_print(["Epoch", update_step])
 
             # Design exeriment
-            new_experiment = self.model_heuristic(
-                num_params=self.model_constructor.num_parameters,
-                epoch_id=update_step,
-                current_params=self.track_param_means[-1],
-                current_volume=self.volume_by_epoch[-1],
-            )
+            with qmla.tracing.span("design_experiment", category="learning"):
+                new_experiment = self.model_heuristic(
+                    num_params=self.model_constructor.num_parameters,
+                    epoch_id=update_step,
+                    current_params=self.track_param_means[-1],
+                    current_volume=self.volume_by_epoch[-1],
+                )
             self.track_experimental_times.append(new_experiment["t"])
             self.track_experiment_parameters.append(new_experiment)
             self.log_print_debug(["New experiment:", new_experiment])
@@ -378,7 +393,8 @@ class ModelInstanceForLearning:
             # Call updater to update distribution based on datum
             try:
                 update_start = time.time()
-                self.qinfer_updater.update(datum_from_experiment, new_experiment)
+                with qmla.tracing.span("qinfer_update", category="learning"):
+                    self.qinfer_updater.update(datum_from_experiment, new_experiment)
                 update_time = time.time() - update_start
             except RuntimeError as e:
                 import sys
@@ -415,12 +431,17 @@ class ModelInstanceForLearning:
             )
 
             # Terminate
-            if (
-                self.exploration_class.terminate_learning_at_volume_convergence
-                and volume_by_epoch[-1]
-                < self.exploration_class.volume_convergence_threshold
-            ):  # can be reinstated to stop learning when volume converges
-                self._finalise_learning()
+            self.early_stopping_reason = self.early_stopping.check(self.epoch_recorder)
+            if self.early_stopping_reason is not None:
+                self.log_print(
+                    [
+                        "Stopping after {} of {} experiments; met {}".format(
+                            update_step + 1,
+                            self.num_experiments,
+                            self.early_stopping_reason,
+                        )
+                    ]
+                )
                 break
 
         self._finalise_learning()
@@ -447,103 +468,91 @@ class ModelInstanceForLearning:
 
         cov_mt = self.qinfer_updater.est_covariance_mtx()
         param_estimates = self.qinfer_updater.est_mean()
-
-        # Data used in plots
         volume = np.abs(qi.utils.ellipsoid_volume(invA=cov_mt))
-        self.volume_by_epoch = np.append(self.volume_by_epoch, volume)
-        self.track_param_means.append(param_estimates)
-        self.track_param_uncertainties.append(np.sqrt(np.diag(cov_mt)))
-        self.track_norm_cov_matrices.append(np.linalg.norm(cov_mt))
         if self.qinfer_updater.just_resampled:
             self.epochs_after_resampling.append(update_step)
+            # particles have moved: their Hamiltonians' decompositions are stale
+            self.qinfer_model.particle_spectra.invalidate()
+
+        experiment_details = {}
+        if new_experiment is not None:
+            experiment_details["experiment_time"] = new_experiment["t"][0]
+            experiment_details["probe_id"] = new_experiment["probe_id"]
+            experiment_details["datum"] = np.asarray(datum).item()
+            experiment_details[
+                "total_likelihood"
+            ] = self.qinfer_updater.normalization_record[-1][0]
+
+        if len(self.qinfer_model.store_p0_diffs) > 0:
+            residuals = self.qinfer_model.store_p0_diffs[-1]
+            experiment_details["residual_median"] = residuals[0]
+            experiment_details["residual_std_dev"] = residuals[1]
+
+        simulator_timings = self.qinfer_model.single_experiment_timings["simulator"]
+        if update_time != 0 and simulator_timings:
+            # not recorded if likelihood_instrumentation is off
+            experiment_details["storage_time"] = simulator_timings["storage"]
+            experiment_details["likelihood_time"] = simulator_timings["likelihood"]
+
+        self.epoch_recorder.record(
+            param_means=param_estimates,
+            covariance_mtx=cov_mt,
+            experiment_id=update_step + 1,  # update_step counts from 0
+            volume=volume,
+            just_resampled=self.qinfer_updater.just_resampled,
+            effective_sample_size=self.qinfer_updater.n_ess,
+            update_time=update_time,
+            **experiment_details
+        )
 
-        # Some optional tracking
-        if self.exploration_class.track_cov_mtx:
-            self.track_covariance_matrices.append(
-                self.qinfer_updater.est_covariance_mtx()
-            )
+    # Views of the epoch recorder, by the names used in learned_info_dict/plots
+    @property
+    def num_experiments_run(self):
+        r"""Number of experiments performed, fewer than ``num_experiments`` if stopped early."""
+        return len(self.epoch_recorder) - 1
 
-        # compute quadratic loss
-        quadratic_loss = 0
-        for param in self.all_params_for_q_loss:
-            if param in self.model_terms_names:
-                learned_param = param_estimates[self.param_indices[param]]
-            else:
-                learned_param = 0
+    @property
+    def volume_by_epoch(self):
+        return self.epoch_recorder.volumes
 
-            if param in list(self.true_param_dict.keys()):
-                true_param = self.true_param_dict[param]
-            else:
-                true_param = 0
+    @property
+    def track_param_means(self):
+        return self.epoch_recorder.param_means
 
-            quadratic_loss += (learned_param - true_param) ** 2
-        self.quadratic_losses_record.append(quadratic_loss)
+    @property
+    def track_param_uncertainties(self):
+        return self.epoch_recorder.param_uncertainties
 
-        if new_experiment is None:
-            exp_time = None
-            probe_id = None
-            total_likelihood = None
-        else:
-            exp_time = new_experiment["t"][0]
-            probe_id = new_experiment["probe_id"]
-            total_likelihood = self.qinfer_updater.normalization_record[-1][0]
+    @property
+    def track_norm_cov_matrices(self):
+        return self.epoch_recorder.norm_covariance_matrices
 
-        try:
-            residual_median = self.qinfer_model.store_p0_diffs[-1][0]
-            residual_std = self.qinfer_model.store_p0_diffs[-1][1]
-        except:
-            residual_median = None
-            residual_std = None
+    @property
+    def track_covariance_matrices(self):
+        return self.epoch_recorder.covariance_matrices
 
-        if update_time == 0:
-            storage_time = 0
-            likelihood_time = 0
-        else:
-            try:
-                storage_time = self.qinfer_model.single_experiment_timings["simulator"][
-                    "storage"
-                ]
-                likelihood_time = self.qinfer_model.single_experiment_timings[
-                    "simulator"
-                ]["likelihood"]
-            except Exception as e:
-                raise
-                self.log_print(["Can't find storage/likelihood time. Exception : ", e])
-
-        experiment_summary = pd.Series(
-            {
-                "model_id": self.model_id,
-                "model_name": self.model_name_latex,
-                "num_qubits": self.model_num_qubits,
-                "experiment_id": update_step + 1,  # update_step counts from 0
-                "parameters_true": self.true_model_params,
-                "parameters_estimates": param_estimates,
-                "parameters_uncertainties": self.track_param_uncertainties[-1],
-                "volume": volume,
-                "quadratic_loss": quadratic_loss,
-                "experiment_time": exp_time,
-                "probe_id": probe_id,
-                "residual_median": residual_median,
-                "residual_std_dev": residual_std,
-                "just_resampled": self.qinfer_updater.just_resampled,
-                "effective_sample_size": self.qinfer_updater.n_ess,
-                "datum": datum,
-                "total_likelihood": total_likelihood,
-                "update_time": update_time,
-                "storage_time": storage_time,
-                "likelihood_time": likelihood_time,
-            }
-        )
-        self.progress_tracker = self.progress_tracker.append(
-            experiment_summary, ignore_index=True
+    @property
+    def quadratic_losses_record(self):
+        return self.epoch_recorder.quadratic_losses
+
+    @property
+    def progress_tracker(self):
+        r"""DataFrame summarising each epoch; built from the epoch recorder on access."""
+
+        return self.epoch_recorder.to_dataframe(
+            model_id=self.model_id,
+            model_name=self.model_name_latex,
+            num_qubits=self.model_num_qubits,
+            parameters_true=self.true_model_params,
         )
 
+    @qmla.tracing.traced(category="learning")
     def _finalise_learning(self):
         r"""Record and log final result."""
 
         self.log_print(
             [
-                "Epoch {}".format(self.num_experiments),
+                "Epoch {}".format(self.num_experiments_run),
                 "\n QHL finished for ",
                 self.model_name,
                 "\n Final experiment time:",
@@ -554,6 +563,14 @@ class ModelInstanceForLearning:
                 "\nTimings:\n",
                 self.timings,
                 "\nEffective sample size: {}".format(self.qinfer_updater.n_ess),
+                "\nOperator cache:",
+                qmla.operator_cache.shared_operator_cache.info(),
+                "\nParticle spectrum cache:",
+                self.qinfer_model.particle_spectra.info(),
+                "\nLikelihoods ({}):".format(
+                    self.qinfer_model.likelihood_instrumentation
+                ),
+                self.qinfer_model.likelihood_summary(),
             ]
         )
 
@@ -563,8 +580,6 @@ class ModelInstanceForLearning:
             self.qinfer_updater.posterior_marginal(idx_param=i)
             for i in range(self.model_constructor.num_terms)
         ]
-        self.track_param_means = np.array(self.track_param_means)
-        self.track_param_uncertainties = np.array(self.track_param_uncertainties)
         self.track_param_estimate_v_epoch = {}
         self.track_param_uncertainty_v_epoch = {}
 
@@ -620,6 +635,7 @@ class ModelInstanceForLearning:
         # Compute dynamics
         self._compute_expectation_values()
 
+    @qmla.tracing.traced(category="plotting")
     def _model_plots(
         self,
     ):
@@ -718,6 +734,7 @@ class ModelInstanceForLearning:
             except BaseException:
                 self.log_print(["failed to _plot_poster_mesh_pairwise"])
 
+    @qmla.tracing.traced(category="learning")
     def learned_info_dict(self):
         """
         Place essential information after learning has occured into a dict.
@@ -733,6 +750,9 @@ class ModelInstanceForLearning:
         # needed by storage class
         learned_info["num_particles"] = self.num_particles
         learned_info["num_experiments"] = self.num_experiments
+        # experiments performed, i.e. the length of the records by epoch
+        learned_info["num_experiments_run"] = self.num_experiments_run
+        learned_info["early_stopping_reason"] = self.early_stopping_reason
         learned_info["times_learned_over"] = self.track_experimental_times
         learned_info["track_experiment_parameters"] = self.track_experiment_parameters
         learned_info["final_learned_params"] = self.final_learned_params
@@ -777,6 +797,10 @@ class ModelInstanceForLearning:
         )
         learned_info["num_evaluation_points"] = self.num_evaluation_points
         learned_info["qinfer_model_likelihoods"] = self.qinfer_model.store_likelihoods
+        learned_info["particle_spectrum_cache"] = (
+            self.qinfer_model.particle_spectra.info()
+        )
+        learned_info["likelihood_summary"] = self.qinfer_model.likelihood_summary()
         learned_info["evaluation_likelihoods"] = self.evaluation_likelihoods
         learned_info["evaluation_residual_squares"] = self.evaluation_residual_squares
         learned_info[
@@ -819,6 +843,7 @@ class ModelInstanceForLearning:
     # Section: Evaluation
     ##########
 
+    @qmla.tracing.traced(category="learning")
     def compute_likelihood_after_parameter_learning(
         self,
     ):
@@ -881,10 +906,12 @@ class ModelInstanceForLearning:
             exploration_rules=self.exploration_strategy_of_this_model,
             experimental_measurements=self.experimental_measurements,
             experimental_measurement_times=self.experimental_measurement_times,
+            experimental_data_index=self.experimental_data_index,
             log_file=self.log_file,
             debug_mode=self.debug_mode,
             qmla_id=self.qmla_id,
             evaluation_model=True,
+            true_hamiltonian_spectrum=self.true_hamiltonian_spectrum,
         )
 
         evaluation_updater = qi.SMCUpdater(
@@ -1071,6 +1098,8 @@ class ModelInstanceForLearning:
 
         # TODO add plotting levels: run, instance, model
         """
+        # seaborn is only imported by processes which plot
+        import seaborn as sns
 
         bf_posterior = qi.MultivariateNormalDistribution(
             self.qinfer_updater.est_mean(), self.qinfer_updater.est_covariance_mtx()
@@ -1613,7 +1642,7 @@ class ModelInstanceForLearning:
     # Section: Utilities
     ##########
 
-    def log_print(self, to_print_list, log_identifier=None):
+    def log_print(self, to_print_list, log_identifier=None, level=qmla.logging.INFO):
         r"""Wrapper for :func:`~qmla.print_to_log`"""
 
         if log_identifier is None:
@@ -1622,15 +1651,17 @@ class ModelInstanceForLearning:
             to_print_list=to_print_list,
             log_file=self.log_file,
             log_identifier=log_identifier,
+            level=level,
         )
 
     def log_print_debug(self, to_print_list):
-        r"""Log print if global debug_log_print set to True."""
+        r"""Log print at DEBUG level, if debug_mode set to True."""
 
         if self.debug_mode:
             self.log_print(
                 to_print_list=to_print_list,
                 log_identifier="Debug Model {}".format(self.model_id),
+                level=qmla.logging.DEBUG,
             )
 
     def _consider_reallocate_resources(self):
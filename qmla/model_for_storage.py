@@ -16,6 +16,9 @@ import qmla.shared_functionality.experimental_data_processing
 import qmla.model_building_utilities
 import qmla.analysis
 import qmla.process_string_to_matrix
+import qmla.operator_cache
+import qmla.learned_info_storage
+import qmla.worker_cache
 
 pickle.HIGHEST_PROTOCOL = 4
 
@@ -69,17 +72,12 @@ class ModelInstanceForStorage:
 
         # Get data from redis database
         if qmla_core_info_database is None:
-            redis_databases = qmla.redis_settings.get_redis_databases_by_qmla_id(
+            qmla_core_info_database = qmla.worker_cache.get_qmla_core_info(
                 self.redis_host_name, self.redis_port_number, self.qmla_id
             )
-            qmla_core_info_database = redis_databases["qmla_core_info_database"]
-            self.probes_system = pickle.loads(qmla_core_info_database["probes_system"])
-            self.probes_simulator = pickle.loads(
-                qmla_core_info_database["probes_simulator"]
-            )
-            qmla_core_info_dict = pickle.loads(
-                qmla_core_info_database.get("qmla_settings")
-            )
+            self.probes_system = qmla_core_info_database["probes_system"]
+            self.probes_simulator = qmla_core_info_database["probes_simulator"]
+            qmla_core_info_dict = qmla_core_info_database.get("qmla_settings")
 
         else:
             self.log_print(
@@ -93,6 +91,10 @@ class ModelInstanceForStorage:
             qmla_core_info_dict = qmla_core_info_database.get("qmla_settings")
 
         # Extract data from core QMLA database
+        qmla.operator_cache.configure_operator_cache(
+            max_size=qmla_core_info_dict["operator_cache_size"],
+            persistence_directory=qmla_core_info_dict["operator_cache_directory"],
+        )
         self.experimental_measurements = qmla_core_info_dict[
             "experimental_measurements"
         ]
@@ -108,9 +110,12 @@ class ModelInstanceForStorage:
         self.experimental_measurement_times = qmla_core_info_dict[
             "experimental_measurement_times"
         ]
+        self.experimental_data_index = qmla.worker_cache.get_experimental_data_index(
+            qmla_core_info_dict["experimental_data_index_file"]
+        )
         if plot_probes is None:
-            self.probes_for_plots = pickle.load(
-                open(qmla_core_info_dict["probes_plot_file"], "rb")
+            self.probes_for_plots = qmla.worker_cache.get_plot_probes(
+                qmla_core_info_dict["probes_plot_file"]
             )
         else:
             self.probes_for_plots = plot_probes
@@ -172,8 +177,9 @@ class ModelInstanceForStorage:
             model_id_str = str(model_id_float)
             for k in range(num_redis_retries):
                 try:
-                    learned_info = pickle.loads(
-                        learned_models_info_db.get(model_id_str), encoding="latin1"
+                    learned_info = qmla.learned_info_storage.load_learned_info(
+                        database=learned_models_info_db,
+                        key=model_id_str,
                     )
                     break
                 except Exception as e:
@@ -288,27 +294,10 @@ class ModelInstanceForStorage:
 
         self.log_print(["R squared function for", self.model_name])
 
-        # Choose times to get r squared for
-        if times is None:
-            exp_times = sorted(list(self.experimental_measurements.keys()))
-        else:
-            exp_times = times
-
-        if max_time is None:
-            max_time = max(exp_times)
-
-        min_time = qmla.shared_functionality.experimental_data_processing.nearest_experimental_time_available(
-            exp_times, min_time
+        # Choose times to get r squared for, and system's expectation values
+        exp_times, exp_data, max_data_idx = self._experimental_data_in_range(
+            times=times, min_time=min_time, max_time=max_time
         )
-        max_time = qmla.shared_functionality.experimental_data_processing.nearest_experimental_time_available(
-            exp_times, max_time
-        )
-        min_data_idx = exp_times.index(min_time)
-        max_data_idx = exp_times.index(max_time)
-        exp_times = exp_times[min_data_idx:max_data_idx]
-
-        # Get expectation values for system
-        exp_data = [self.experimental_measurements[t] for t in exp_times]
 
         # Compute r squared
         probe = self.probes_for_plots[self.probe_num_qubits]
@@ -325,7 +314,7 @@ class ModelInstanceForStorage:
 
         chi_squared = 0
         self.r_squared_of_t = {}
-        for t in exp_times:
+        for t, true in zip(exp_times, exp_data):
             if t in available_expectation_values:
                 sim = self.expectation_values[t]
             else:
@@ -334,7 +323,6 @@ class ModelInstanceForStorage:
                 )
                 self.expectation_values[t] = sim
 
-            true = self.experimental_measurements[t]
             diff_squared = (true - sim) ** 2
             sum_of_residuals += diff_squared
             self.r_squared_of_t[t] = 1 - (sum_of_residuals / total_sum_of_squares)
@@ -381,26 +369,10 @@ class ModelInstanceForStorage:
             ["R squared by epoch function for", self.model_name, "Times passed:", times]
         )
 
-        # Choose times to get R-squared for
-        if times is None:
-            exp_times = sorted(list(self.experimental_measurements.keys()))
-        else:
-            exp_times = times
-
-        if max_time is None:
-            max_time = max(exp_times)
-        min_time = qmla.shared_functionality.experimental_data_processing.nearest_experimental_time_available(
-            exp_times, min_time
-        )
-        max_time = qmla.shared_functionality.experimental_data_processing.nearest_experimental_time_available(
-            exp_times, max_time
+        # Choose times to get R-squared for, and system's expectation values
+        exp_times, exp_data, max_data_idx = self._experimental_data_in_range(
+            times=times, min_time=min_time, max_time=max_time
         )
-        min_data_idx = exp_times.index(min_time)
-        max_data_idx = exp_times.index(max_time)
-        exp_times = exp_times[min_data_idx:max_data_idx]
-
-        # Get expectation values for system
-        exp_data = [self.experimental_measurements[t] for t in exp_times]
 
         # Compute r squared
         probe = self.probes_for_plots[self.probe_num_qubits]
@@ -412,18 +384,19 @@ class ModelInstanceForStorage:
         # num experiments due to heavy computational overhead
         spaced_epochs = np.round(
             np.linspace(
-                0, self.num_experiments - 1, min(self.num_experiments, num_points)
+                0,
+                self.num_experiments_run - 1,
+                min(self.num_experiments_run, num_points),
             )
         )
 
         for e in spaced_epochs:
             sum_of_residuals = 0
             available_expectation_values = sorted(list(self.expectation_values.keys()))
-            for t in exp_times:
+            for t, true in zip(exp_times, exp_data):
                 sim = self.exploration_class.get_expectation_value(
                     ham=self.learned_hamiltonian, t=t, state=probe
                 )
-                true = self.experimental_measurements[t]
                 diff_squared = (sim - true) ** 2
                 sum_of_residuals += diff_squared
 
@@ -434,6 +407,33 @@ class ModelInstanceForStorage:
 
         return r_squared_by_epoch
 
+    def _experimental_data_in_range(self, times, min_time, max_time):
+        r"""
+        Experimental times and measurements between those nearest to ``min_time``
+        (inclusive) and ``max_time`` (exclusive).
+
+        :param list times: times to choose from; all experimental times if None.
+        :param float min_time: minimum time to use.
+        :param float max_time: maximum time to use; the latest of ``times`` if None.
+        :return tuple data: list of times, array of measurements at those times,
+            and the position of the time nearest to ``max_time`` within ``times``.
+        """
+
+        if times is None:
+            data_index = self.experimental_data_index
+        else:
+            data_index = qmla.shared_functionality.experimental_data_processing.ExperimentalDataIndex(
+                times=times,
+                expectation_values=[self.experimental_measurements[t] for t in times],
+            )
+
+        if max_time is None:
+            max_time = data_index.times[-1]
+        min_data_idx, max_data_idx = data_index.nearest_indices([min_time, max_time])
+        exp_times = data_index.times[min_data_idx:max_data_idx].tolist()
+        exp_data = data_index.expectation_values[min_data_idx:max_data_idx]
+        return exp_times, exp_data, max_data_idx
+
     ##########
     # Section: Utilities
     ##########
@@ -0,0 +1,168 @@
+import os
+import hashlib
+import threading
+import collections
+
+import numpy as np
+from scipy import sparse
+
+r"""
+Process-wide cache of the matrices of model terms.
+
+Constructing a term's matrix from its name (e.g. ``pauliSet_1J2_xJx_d3``)
+requires parsing the string and computing tensor products, which is repeated
+every time a model's terms_matrices are accessed.
+Matrices are instead stored here, keyed by the term string and the
+function which processes it, and retrieved on subsequent calls.
+The cache is bounded in size, discarding the least recently used operators.
+Optionally, operators are also saved to a directory (usually within the
+run's results directory), so that workers on the same node can load
+operators built by other processes rather than recomputing them.
+"""
+
+__all__ = ["OperatorCache", "shared_operator_cache", "configure_operator_cache"]
+
+
+class OperatorCache:
+    r"""
+    Size-bounded LRU cache of operators, with hit/miss counters.
+
+    :param int max_size: maximum number of operators to hold in memory
+    :param str persistence_directory: directory in which to store operators
+        on disk, shared between processes; if None, operators are only held
+        in memory.
+    """
+
+    def __init__(self, max_size=2048, persistence_directory=None):
+        self.max_size = max_size
+        self.persistence_directory = None
+        self._operators = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.set_persistence_directory(persistence_directory)
+
+    def set_persistence_directory(self, persistence_directory):
+        r"""Set (or unset, with None) the directory operators are saved to."""
+        if persistence_directory is not None:
+            try:
+                os.makedirs(persistence_directory)
+            except FileExistsError:
+                pass
+        self.persistence_directory = persistence_directory
+
+    def get(self, key, constructor):
+        r"""
+        Retrieve the operator for ``key``, constructing it if not cached.
+
+        :param tuple key: hashable key uniquely identifying the operator,
+            e.g. (processing function name, term name, sparse representation)
+        :param callable constructor: function of no arguments which returns
+            the operator, called on cache misses
+        :return: operator; dense operators are returned read-only
+            since they are shared between all callers.
+        """
+        with self._lock:
+            if key in self._operators:
+                self._operators.move_to_end(key)
+                self.hits += 1
+                return self._operators[key]
+
+        operator = self._load_from_disk(key)
+        if operator is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            operator = constructor()
+            self._save_to_disk(key, operator)
+
+        if isinstance(operator, np.ndarray):
+            operator.flags.writeable = False
+        with self._lock:
+            self._operators[key] = operator
+            self._operators.move_to_end(key)
+            while len(self._operators) > self.max_size:
+                self._operators.popitem(last=False)
+        return operator
+
+    def clear(self):
+        r"""Empty the in-memory cache and reset counters."""
+        with self._lock:
+            self._operators.clear()
+            self.hits = self.disk_hits = self.misses = 0
+
+    @property
+    def hit_rate(self):
+        r"""Fraction of requests served without constructing the operator."""
+        num_requests = self.hits + self.disk_hits + self.misses
+        if num_requests == 0:
+            return 0
+        return (self.hits + self.disk_hits) / num_requests
+
+    def info(self):
+        r"""Summary of cache usage, e.g. for logging."""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "size": len(self._operators),
+            "max_size": self.max_size,
+            "persistence_directory": self.persistence_directory,
+        }
+
+    def _path(self, key):
+        key_hash = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(self.persistence_directory, key_hash)
+
+    def _load_from_disk(self, key):
+        if self.persistence_directory is None:
+            return None
+        path = self._path(key)
+        try:
+            if os.path.exists(path + ".npz"):
+                return sparse.load_npz(path + ".npz").tocsr()
+            elif os.path.exists(path + ".npy"):
+                return np.load(path + ".npy")
+        except Exception:
+            # partially written or corrupt file: rebuild the operator instead
+            return None
+        return None
+
+    def _save_to_disk(self, key, operator):
+        if self.persistence_directory is None:
+            return
+        path = self._path(key)
+        # write to a process-specific file then rename,
+        # so other processes never load a partially written operator
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            if sparse.issparse(operator):
+                with open(tmp_path, "wb") as f:
+                    sparse.save_npz(f, operator.tocsr())
+                os.replace(tmp_path, path + ".npz")
+            else:
+                with open(tmp_path, "wb") as f:
+                    np.save(f, operator)
+                os.replace(tmp_path, path + ".npy")
+        except OSError:
+            pass
+
+
+shared_operator_cache = OperatorCache()
+
+
+def configure_operator_cache(max_size=None, persistence_directory=None):
+    r"""
+    Configure the process-wide :attr:`shared_operator_cache`.
+
+    :param int max_size: maximum number of operators held in memory;
+        unchanged if None.
+    :param str persistence_directory: directory in which to share operators
+        between processes; if None, operators are only held in memory.
+    """
+    if max_size is not None:
+        shared_operator_cache.max_size = max_size
+    shared_operator_cache.set_persistence_directory(persistence_directory)
+    return shared_operator_cache
@@ -1,13 +1,19 @@
 import numpy as np
+from scipy import sparse
 
 from qmla import model_building_utilities
 import qmla.string_processing_functions
 import qmla.logging
+from qmla.operator_cache import shared_operator_cache
 
 # TODO significant refactoring so process_basic_operator is not a bottleneck
 # construct matrices through BaseModel.model_specific_basic_operator()
 
-__all__ = ["string_processing_functions", "process_basic_operator"]
+__all__ = [
+    "string_processing_functions",
+    "sparse_string_processing_functions",
+    "process_basic_operator",
+]
 
 string_processing_functions = {
     "nv": qmla.string_processing_functions.process_n_qubit_NV_centre_spin,
@@ -20,8 +26,16 @@ string_processing_functions = {
     "FH-onsite-sum": qmla.string_processing_functions.process_fermi_hubbard_term,
 }
 
+# processing functions which can construct sparse (CSR) matrices directly;
+# other terms are built densely then converted.
+sparse_string_processing_functions = {
+    "nv": qmla.string_processing_functions.process_n_qubit_NV_centre_spin,
+    "pauliSet": qmla.string_processing_functions.process_multipauli_term,
+    "pauliLikewise": qmla.string_processing_functions.process_likewise_pauli_sum,
+}
 
-def process_basic_operator(basic_operator):
+
+def process_basic_operator(basic_operator, sparse_representation=False):
     r"""
     Transform a string, representing a term in the model, into a matrix.
 
@@ -48,15 +62,35 @@ def process_basic_operator(basic_operator):
         * In this case, the result is the matrix ( XXI + ZIZ) .
 
     :param str basic_operator: term to generate matrix from.
-    :return np.ndarray mtx: matrix corresponding to the input term.
+    :param bool sparse_representation: whether to return a sparse CSR matrix.
+        Terms whose indicator is in ``sparse_string_processing_functions``
+        are constructed sparsely throughout.
+    :return np.ndarray mtx: matrix corresponding to the input term;
+        shared via :attr:`~qmla.operator_cache.shared_operator_cache`, so must not be modified.
     """
 
     # print("CALLING process_basic_operator on ", basic_operator)
 
+    return shared_operator_cache.get(
+        key=("process_basic_operator", basic_operator, sparse_representation),
+        constructor=lambda: _process_basic_operator(
+            basic_operator, sparse_representation
+        ),
+    )
+
+
+def _process_basic_operator(basic_operator, sparse_representation=False):
+    # construct the matrix for process_basic_operator, bypassing the operator cache
     indicator = basic_operator.split("_")[0]
-    if indicator in string_processing_functions:
+    if sparse_representation and indicator in sparse_string_processing_functions:
+        return sparse_string_processing_functions[indicator](
+            basic_operator, sparse_representation=True
+        )
+    elif indicator in string_processing_functions:
         mtx = string_processing_functions[indicator](basic_operator)
     else:
-        mtx = model_building_utilities.core_operator_dict[basic_operator]
+        mtx = np.array(model_building_utilities.core_operator_dict[basic_operator])
 
+    if sparse_representation:
+        mtx = sparse.csr_matrix(mtx)
     return mtx
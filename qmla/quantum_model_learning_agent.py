@@ -34,6 +34,12 @@ from qmla.remote_bayes_factor import remote_bayes_factor_calculation
 from qmla.remote_model_learning import remote_learn_model_parameters
 import qmla.exploration_tree
 import qmla.utilities
+import qmla.operator_cache
+import qmla.completion_events
+import qmla.learned_info_storage
+import qmla.local_backend
+import qmla.tracing
+import qmla.cost_model
 
 pickle.HIGHEST_PROTOCOL = 4
 plt.switch_backend("agg")
@@ -144,7 +150,43 @@ class QuantumModelLearningAgent:
         self.debug_mode = self.qmla_controls.debug_mode
         self.plot_level = self.qmla_controls.plot_level
 
-        # Databases for storing learning/comparison data
+        # Spans of this process are traced here; jobs write their own traces alongside
+        if self.qmla_controls.trace:
+            self.trace_directory = os.path.join(
+                self.results_directory, "traces", "qmla_{}".format(self.qmla_id)
+            )
+            qmla.tracing.configure_tracing(
+                self.trace_directory,
+                process_name="QMLA {} agent".format(self.qmla_id),
+            )
+        else:
+            self.trace_directory = None
+
+        # Term matrices are cached per process, and optionally shared on disk
+        self.operator_cache_size = self.exploration_class.operator_cache_size
+        if self.exploration_class.persist_operator_cache:
+            self.operator_cache_directory = os.path.join(
+                self.results_directory, "operator_cache"
+            )
+        else:
+            self.operator_cache_directory = None
+        qmla.operator_cache.configure_operator_cache(
+            max_size=self.operator_cache_size,
+            persistence_directory=self.operator_cache_directory,
+        )
+
+        # Databases for storing learning/comparison data:
+        # on the redis server, or held locally if not using redis
+        self.parallel_backend = self.qmla_controls.parallel_backend
+        if self.parallel_backend == "local":
+            self.local_backend = qmla.local_backend.LocalParallelBackend(
+                host_name=self.redis_host_name,
+                port_number=self.redis_port_number,
+                qmla_id=self.qmla_id,
+                num_workers=self.qmla_controls.num_local_workers,
+            )
+        else:
+            self.local_backend = None
         self.redis_databases = rds.get_redis_databases_by_qmla_id(
             self.redis_host_name,
             self.redis_port_number,
@@ -152,6 +194,12 @@ class QuantumModelLearningAgent:
         )
         self.redis_databases["any_job_failed"].set("Status", 0)
 
+        # Workers announce finished jobs on this channel
+        self.completion_channel = qmla.completion_events.RedisCompletionChannel(
+            self.redis_databases["completion_events"]
+        )
+        self.completion_channel.clear()
+
         # Logistics
         self.models_learned = []
         self.timings = {
@@ -165,6 +213,8 @@ class QuantumModelLearningAgent:
             "jobs_finished": 0,
         }
         self.sleep_duration = 2
+        # max time to wait for a completion event before inspecting all branches
+        self.completion_event_timeout = 5
 
     def _true_model_definition(self):
         r"""Information related to true (target) model."""
@@ -194,6 +244,19 @@ class QuantumModelLearningAgent:
         self.true_model_hamiltonian = self.exploration_class.true_hamiltonian
         self.log_print(["True model:", self.true_model_name])
 
+        # Diagonalise true Hamiltonian once; shared by all models' likelihood calculations
+        if (
+            self.exploration_class.expectation_value_subroutine
+            is qmla.shared_functionality.expectation_value_functions.default_expectation_value
+            and not self.exploration_class.iqle_mode
+        ):
+            self.true_hamiltonian_spectrum = qmla.shared_functionality.qinfer_model_interface.true_system_spectrum(
+                qmla_id=self.qmla_id,
+                true_hamiltonian=self.true_model_constructor.fixed_matrix,
+            )
+        else:
+            self.true_hamiltonian_spectrum = None
+
     def _setup_tree_and_exploration_strategies(
         self,
     ):
@@ -304,6 +367,7 @@ class QuantumModelLearningAgent:
         self.experimental_measurement_times = sorted(
             list(self.experimental_measurements.keys())
         )
+        self._set_experimental_data_index()
 
         # Used for consistent plotting
         self.times_to_plot = self.experimental_measurement_times
@@ -355,22 +419,98 @@ class QuantumModelLearningAgent:
     def _setup_parallel_requirements(self):
         r"""Infrastructure for use when QMLA run in parallel."""
 
-        self.use_rq = self.qmla_controls.use_rq
+        # jobs run on RQ workers, or on the local process pool
+        self.use_rq = self.qmla_controls.use_rq and self.parallel_backend == "rq"
+        self.use_local_workers = (
+            self.qmla_controls.use_rq and self.parallel_backend == "local"
+        )
         self.rq_timeout = self.qmla_controls.rq_timeout
+        # RQ jobs time out after the upper bound of their predicted time,
+        # if the run's cost model has been fitted (by time_required_calculation)
+        self.cost_model = None
+        self.cost_model_confidence = 0.999
+        self.minimum_rq_timeout = 60
+        cost_model_file = os.path.join(
+            self.results_directory, qmla.cost_model.cost_model_file_name
+        )
+        if os.path.isfile(cost_model_file):
+            try:
+                self.cost_model = qmla.cost_model.CostModel.load(cost_model_file)
+                self.log_print(["Job timeouts from cost model", cost_model_file])
+            except Exception as e:
+                self.log_print(["Failed to load cost model. Error: {}".format(e)])
+        # comparisons complete branches, unblocking the next generation of models,
+        # so they are placed on a queue which RQ workers take jobs from first
+        self.rq_priority_queue_name = "{}_priority".format(self.qmla_id)
+        # when each branch's jobs were launched and completed, to assess scheduling
+        self.branch_schedule_times = {}
+        self.branch_makespans = None
+        self.makespan = None
+        self.ideal_makespan = None
         self.rq_log_file = self.log_file
         # writeable file object to use for logging:
         self.write_log_file = open(self.log_file, "a")
 
-        try:
-            self.redis_conn = redis.Redis(
-                host=self.redis_host_name, port=self.redis_port_number
-            )
+        if self.local_backend is not None:
+            # no redis server
+            self.redis_conn = None
             parallel_enabled = True
-        except BaseException:
-            self.log_print("Importing rq failed: enforcing serial.")
-            parallel_enabled = False
+        else:
+            try:
+                self.redis_conn = redis.Redis(
+                    host=self.redis_host_name, port=self.redis_port_number
+                )
+                parallel_enabled = True
+            except BaseException:
+                self.log_print("Importing rq failed: enforcing serial.")
+                parallel_enabled = False
         self.run_in_parallel = parallel_enabled
 
+    def _set_experimental_data_index(self):
+        r"""
+        Index of the system's measurements, shared with learners and comparisons.
+
+        ``set_qmla_params.py`` stores the run's
+        :class:`~qmla.shared_functionality.experimental_data_processing.ExperimentalDataIndex`
+        alongside the system measurements file, so it is loaded (memory-mapped)
+        by every instance of the run and its workers (through
+        :func:`~qmla.worker_cache.get_experimental_data_index`).
+        If it isn't available, e.g. if measurements were passed directly,
+        it is built here and stored in the results directory.
+        """
+
+        data_processing = qmla.shared_functionality.experimental_data_processing
+        index_file = data_processing.experimental_data_index_path(
+            self.qmla_controls.system_measurements_file
+        )
+        experimental_data_index = None
+        if os.path.isfile(index_file):
+            experimental_data_index = data_processing.ExperimentalDataIndex.load(
+                index_file
+            )
+            if len(experimental_data_index) != len(self.experimental_measurements):
+                self.log_print(
+                    [
+                        "Experimental data index {} does not match measurements; rebuilding.".format(
+                            index_file
+                        )
+                    ]
+                )
+                experimental_data_index = None
+
+        if experimental_data_index is None:
+            experimental_data_index = data_processing.ExperimentalDataIndex.from_measurements(
+                self.experimental_measurements
+            )
+            index_file = os.path.join(
+                self.results_directory,
+                "experimental_data_index_{}.npy".format(self.qmla_id),
+            )
+            experimental_data_index.save(index_file)
+
+        self.experimental_data_index = experimental_data_index
+        self.experimental_data_index_file = index_file
+
     def _compute_base_resources(self):
         r"""
         Compute the set of minimal resources for models to learn on.
@@ -459,8 +599,14 @@ class QuantumModelLearningAgent:
             "store_particles_weights": False,  # TODO from exploration strategy or unneeded
             "qhl_plots": False,  # TODO get from exploration strategy
             "experimental_measurement_times": self.experimental_measurement_times,
+            "experimental_data_index_file": self.experimental_data_index_file,
             "num_probes": self.probe_number,  # from exploration strategy or unneeded,
             "run_info_file": self.qmla_controls.run_info_file,
+            "operator_cache_size": self.operator_cache_size,
+            "operator_cache_directory": self.operator_cache_directory,
+            "true_hamiltonian_spectrum": self.true_hamiltonian_spectrum,
+            "parallel_bayes_factor_sides": self.exploration_class.parallel_bayes_factor_sides,
+            "trace_directory": self.trace_directory,
         }
         self.log_print(
             ["QMLA settings figure_format:", self.qmla_settings["figure_format"]]
@@ -489,6 +635,7 @@ class QuantumModelLearningAgent:
     # Section: Calculation of models parameters and Bayes factors
     ##########
 
+    @qmla.tracing.traced(category="learning")
     def learn_models_on_given_branch(self, branch_id, blocking=False):
         r"""
         Launches jobs to learn all models on the specified branch.
@@ -505,6 +652,9 @@ class QuantumModelLearningAgent:
         This method can block, meaning it waits for a model's learning to complete
         before proceeding. If in parallel, do not block as model learning
         won't be launched until the previous model has completed.
+        Models are launched in order of their predicted learning time,
+        longest first (see :meth:`_predict_job_time`), so that the longest
+        jobs do not start last and extend the time the branch takes.
 
         :param int branch_id: unique QMLA branch ID to learn models of.
         :param bool use_rq: whether to implement learning via RQ workers.
@@ -517,6 +667,7 @@ class QuantumModelLearningAgent:
             branch_id
         ].num_precomputed_models
         unlearned_models_this_branch = self.branches[branch_id].unlearned_models
+        self.branch_schedule_times[branch_id] = {"launched": time.time()}
 
         # Update redis database
         active_branches_learning_models = self.redis_databases[
@@ -525,6 +676,10 @@ class QuantumModelLearningAgent:
         active_branches_learning_models.set(
             int(branch_id), num_models_already_set_this_branch
         )
+        # in case all models on the branch were already learned
+        self.completion_channel.publish(
+            qmla.completion_events.learning_event, branch_id
+        )
 
         # Learn models
         self.log_print(
@@ -537,12 +692,92 @@ class QuantumModelLearningAgent:
             ]
         )
 
-        for model_name in unlearned_models_this_branch:
+        predicted_times = {
+            model_name: self._predict_job_time(
+                job_type="learning",
+                model_id=self._get_model_id_from_name(model_name=model_name),
+                num_experiments=self.num_experiments,
+            )["median"]
+            for model_name in unlearned_models_this_branch
+        }
+        for model_name in sorted(
+            unlearned_models_this_branch, key=lambda m: -predicted_times[m]
+        ):
             self.learn_model(
                 model_name=model_name, branch_id=branch_id, blocking=blocking
             )
         self.log_print(["Learning models from branch {} finished.".format(branch_id)])
 
+    def _job_features(self, job_type, model_id, num_experiments):
+        r"""Arguments of :meth:`~qmla.CostModel.predict` for a job on ``model_id``."""
+
+        model_constructor = self.model_database[
+            self.model_database.model_id == model_id
+        ].model_constructor.item()
+        exploration_class = self.branches[
+            self.models_branches[model_id]
+        ].exploration_class
+        return {
+            "job_type": job_type,
+            "num_qubits": model_constructor.num_qubits,
+            "num_terms": model_constructor.num_terms,
+            "num_particles": self.num_particles,
+            "num_experiments": num_experiments,
+            "expectation_value_function": qmla.cost_model.expectation_value_function_name(
+                exploration_class
+            ),
+        }
+
+    def _predict_job_time(self, job_type, model_id, num_experiments, confidence=0.95):
+        r"""
+        Time a job is predicted to take by the cost model.
+
+        Without a cost model fitted to previous runs, the analytic estimate
+        of :class:`~qmla.CostModel` is used, which suffices to order jobs.
+
+        :param str job_type: ``learning`` or ``comparison``.
+        :param int model_id: model learned, or model A of the comparison.
+        :param int num_experiments: number of experiments performed by the job.
+        :param float confidence: probability that the time lies within the bounds.
+        :return dict prediction: ``median``, ``lower`` and ``upper`` (seconds).
+        """
+
+        cost_model = self.cost_model
+        if cost_model is None:
+            cost_model = qmla.cost_model.CostModel()
+        return cost_model.predict(
+            confidence=confidence,
+            **self._job_features(job_type, model_id, num_experiments)
+        )
+
+    def _rq_job_timeout(self, job_type, model_id, num_experiments):
+        r"""
+        Timeout for an RQ job, from the upper bound of its time predicted by the cost model,
+        multiplied by the exploration strategy's ``rq_timeout_insurance_factor``
+        (see :meth:`~qmla.CostModel.job_timeout`).
+
+        Without a cost model, jobs time out after ``rq_timeout``;
+        with one, ``rq_timeout`` (if positive) caps the predicted timeout.
+
+        :param str job_type: ``learning`` or ``comparison``.
+        :param int model_id: model learned, or model A of the comparison.
+        :param int num_experiments: number of experiments performed by the job.
+        :return int timeout: seconds after which RQ stops the job.
+        """
+
+        if self.cost_model is None:
+            return self.rq_timeout
+        exploration_class = self.branches[
+            self.models_branches[model_id]
+        ].exploration_class
+        return self.cost_model.job_timeout(
+            confidence=self.cost_model_confidence,
+            insurance_factor=exploration_class.rq_timeout_insurance_factor,
+            minimum_timeout=self.minimum_rq_timeout,
+            maximum_timeout=self.rq_timeout,
+            **self._job_features(job_type, model_id, num_experiments)
+        )
+
     def learn_model(self, model_name, branch_id, blocking=False):
         r"""
         Learn a given model by calling the standalone model learning functionality.
@@ -578,12 +813,17 @@ class QuantumModelLearningAgent:
                 self.models_learned.append(model_id)
 
             if self.run_in_parallel and self.use_rq:
+                job_timeout = self._rq_job_timeout(
+                    job_type="learning",
+                    model_id=model_id,
+                    num_experiments=self.num_experiments,
+                )
                 # get access to the RQ queue
                 queue = rq.Queue(
                     self.qmla_id,
                     connection=self.redis_conn,
                     is_async=self.use_rq,
-                    default_timeout=self.rq_timeout,
+                    default_timeout=job_timeout,
                 )
                 self.log_print(
                     [
@@ -598,7 +838,7 @@ class QuantumModelLearningAgent:
                     remote_learn_model_parameters,
                     result_ttl=-1,
                     # ttl = -1,
-                    job_timeout=self.rq_timeout,
+                    job_timeout=job_timeout,
                     name=model_name,
                     model_id=model_id,
                     exploration_rule=self.branches[branch_id].exploration_strategy,
@@ -630,8 +870,30 @@ class QuantumModelLearningAgent:
                             )
                             raise NameError("Remote QML failure")
                             break
-                        time.sleep(self.sleep_duration)
+                        with qmla.tracing.span("wait_for_job", category="idle"):
+                            time.sleep(self.sleep_duration)
                     self.log_print(["Blocking RQ - model learned:", model_name])
+            elif self.use_local_workers:
+                # send model-learning as task to local process pool
+                job = self.local_backend.submit(
+                    job_name="learn model {}".format(model_id),
+                    function=remote_learn_model_parameters,
+                    name=model_name,
+                    model_id=model_id,
+                    exploration_rule=self.branches[branch_id].exploration_strategy,
+                    branch_id=branch_id,
+                    remote=True,
+                    host_name=self.redis_host_name,
+                    port_number=self.redis_port_number,
+                    qid=self.qmla_id,
+                    log_file=self.rq_log_file,
+                )
+                self.log_print(["Model {} on local job {}".format(model_id, job)])
+                if blocking:
+                    # raises any exception from the job
+                    with qmla.tracing.span("wait_for_job", category="idle"):
+                        job.result()
+                    self.log_print(["Blocking local job - model learned:", model_name])
             else:
                 # run model learning fnc locally
                 self.log_print(
@@ -658,6 +920,7 @@ class QuantumModelLearningAgent:
                     port_number=self.redis_port_number,
                     qid=self.qmla_id,
                     log_file=self.rq_log_file,
+                    completion_channel=self.completion_channel,
                 )
 
     def compare_model_pair(
@@ -691,6 +954,11 @@ class QuantumModelLearningAgent:
         :returns bayes_factor: the Bayes factor calculated between the two models,
             i.e. BF(m1,m2) where m1 is the lower model id. Only returned when
             `wait_on_result==True`.
+
+        Comparisons within a branch are launched once all of the branch's models
+        are learned, so they are all that stands between the branch and the next
+        generation of models: they are placed on a priority queue,
+        to start before any queued learning jobs.
         """
 
         unique_id = model_building_utilities.unique_model_pair_identifier(
@@ -698,17 +966,24 @@ class QuantumModelLearningAgent:
         )
         if unique_id not in self.bayes_factor_pair_computed:
             self.bayes_factor_pair_computed.append(unique_id)
+        high_priority = branch_id is not None
 
         # Launch comparison, either remotely or locally
         if self.use_rq:
             # launch remotely
             from rq import Connection, Queue, Worker
 
+            # each model replays the experiments of the other
+            job_timeout = self._rq_job_timeout(
+                job_type="comparison",
+                model_id=model_a_id,
+                num_experiments=2 * self.num_experiments,
+            )
             queue = Queue(
-                self.qmla_id,
+                self.rq_priority_queue_name if high_priority else self.qmla_id,
                 connection=self.redis_conn,
                 is_async=self.use_rq,
-                default_timeout=self.rq_timeout,
+                default_timeout=job_timeout,
             )
 
             # the function object is the first argument to RQ enqueue function
@@ -716,7 +991,7 @@ class QuantumModelLearningAgent:
                 remote_bayes_factor_calculation,
                 result_ttl=-1,
                 # ttl = -1,
-                job_timeout=self.rq_timeout,
+                job_timeout=job_timeout,
                 model_a_id=model_a_id,
                 model_b_id=model_b_id,
                 branch_id=branch_id,
@@ -743,6 +1018,27 @@ class QuantumModelLearningAgent:
                     sleep(self.sleep_duration)
             elif return_job == True:
                 return job
+        elif self.use_local_workers:
+            # launch on local process pool
+            job = self.local_backend.submit(
+                job_name="compare models {}/{}".format(model_a_id, model_b_id),
+                function=remote_bayes_factor_calculation,
+                priority=1 if high_priority else 0,
+                model_a_id=model_a_id,
+                model_b_id=model_b_id,
+                branch_id=branch_id,
+                times_record=self.bayes_factors_store_times_file,
+                bf_data_folder=self.instance_learning_and_comparisons_path,
+                bayes_threshold=self.bayes_threshold_lower,
+                host_name=self.redis_host_name,
+                port_number=self.redis_port_number,
+                qid=self.qmla_id,
+                log_file=self.rq_log_file,
+            )
+            if wait_on_result == True:
+                job.result()
+            elif return_job == True:
+                return job
         else:
             # run comparison locally
             remote_bayes_factor_calculation(
@@ -757,6 +1053,7 @@ class QuantumModelLearningAgent:
                 port_number=self.redis_port_number,
                 qid=self.qmla_id,
                 log_file=self.rq_log_file,
+                completion_channel=self.completion_channel,
             )
         if wait_on_result == True:
             pair_id = model_building_utilities.unique_model_pair_identifier(
@@ -830,7 +1127,13 @@ class QuantumModelLearningAgent:
                     if job.is_failed:
                         self.log_print(["Model comparison job failed:", job])
                         raise NameError("Remote job failure")
-                    time.sleep(self.sleep_duration)
+                    with qmla.tracing.span("wait_for_job", category="idle"):
+                        time.sleep(self.sleep_duration)
+        elif wait_on_result and self.use_local_workers:
+            for job in remote_jobs:
+                # raises any exception from the job
+                with qmla.tracing.span("wait_for_job", category="idle"):
+                    job.result()
         else:
             self.log_print(
                 [
@@ -839,6 +1142,7 @@ class QuantumModelLearningAgent:
                 ]
             )
 
+    @qmla.tracing.traced(category="comparison")
     def compare_models_within_branch(
         self, branch_id, pair_list=None, remote=True, recompute=False
     ):
@@ -860,10 +1164,15 @@ class QuantumModelLearningAgent:
             passed directly to :meth:`~qmla.QuantumModelLearningAgent.compare_model_pair`
         :param bool recompute: whether to force comparison even if a pair has
             been compared previously
+
+        As models on a branch, comparisons are launched longest first.
         """
 
         if pair_list is None:
             pair_list = self.branches[branch_id].pairs_to_compare
+        self.branch_schedule_times.setdefault(branch_id, {}).setdefault(
+            "learning_complete", time.time()
+        )
         self.log_print(
             [
                 "compare_models_within_branch for branch {} has {} pairs: {}".format(
@@ -877,24 +1186,40 @@ class QuantumModelLearningAgent:
         active_branches_bayes.set(int(branch_id), 0)
 
         # Compare model pairs
+        pairs_to_launch = {}
         for a, b in pair_list:
             if a != b:
                 unique_id = model_building_utilities.unique_model_pair_identifier(a, b)
                 if (
                     unique_id not in self.bayes_factor_pair_computed
                     or recompute == True
-                ):
+                ) and unique_id not in pairs_to_launch:
                     # ie not yet considered or recomputing
-                    self.compare_model_pair(
-                        a,
-                        b,
-                        remote=remote,
-                        branch_id=branch_id,
-                    )
-                elif unique_id in self.bayes_factor_pair_computed:
+                    pairs_to_launch[unique_id] = (a, b)
+                else:
                     # if this is already computed,
                     # tell this branch not to wait on it.
                     active_branches_bayes.incr(int(branch_id), 1)
+        predicted_times = {
+            unique_id: self._predict_job_time(
+                job_type="comparison",
+                model_id=a,
+                num_experiments=2 * self.num_experiments,
+            )["median"]
+            for unique_id, (a, b) in pairs_to_launch.items()
+        }
+        for unique_id in sorted(pairs_to_launch, key=lambda u: -predicted_times[u]):
+            a, b = pairs_to_launch[unique_id]
+            self.compare_model_pair(
+                a,
+                b,
+                remote=remote,
+                branch_id=branch_id,
+            )
+        # in case all comparisons on the branch were already computed
+        self.completion_channel.publish(
+            qmla.completion_events.comparison_event, branch_id
+        )
 
     def process_model_pair_comparison(
         self,
@@ -1055,6 +1380,7 @@ class QuantumModelLearningAgent:
 
         return champ_id
 
+    @qmla.tracing.traced(category="comparison")
     def process_comparisons_within_branch(self, branch_id, pair_list=None):
         r"""
         Process comparisons between models on the same branch.
@@ -1084,6 +1410,9 @@ class QuantumModelLearningAgent:
 
         branch = self.branches[branch_id]
         active_models_in_branch = branch.resident_model_ids
+        self.branch_schedule_times.setdefault(branch_id, {}).setdefault(
+            "comparisons_complete", time.time()
+        )
 
         # Establish pairs to check comparisons between
         if pair_list is None:
@@ -1170,6 +1499,12 @@ class QuantumModelLearningAgent:
         inner workings of the tree/exploration strategy: a branch is
         simply a set of models to learn and compare.
 
+        Rather than polling the redis databases, the agent waits for workers to
+        announce finished jobs on its ``completion_channel``
+        (see :mod:`qmla.completion_events`), and only inspects the branches
+        named in those events. If no event arrives within
+        ``completion_event_timeout`` seconds, all active branches are inspected.
+
         When all trees have completed learning, this method terminates.
         """
 
@@ -1193,17 +1528,23 @@ class QuantumModelLearningAgent:
         self.log_print(["Entering while loop: learning/comparing/spawning models."])
         ctr = 0
         while self.tree_count_completed < self.tree_count:
-            # get most recent branches on redis database
-            branch_ids_on_db = list(active_branches_learning_models.keys())
-            branch_ids_on_db = [int(b) for b in branch_ids_on_db]
+            # wait until workers report finished jobs
+            with qmla.tracing.span("wait_for_workers", category="idle"):
+                events = self.completion_channel.wait(
+                    timeout=self.completion_event_timeout
+                )
 
             # check if any job has crashed
             if self.run_in_parallel:
-                sleep(self.sleep_duration)
                 self._inspect_remote_job_crashes()
 
-            # loop through active branches
-            for branch_id in branch_ids_on_db:
+            (
+                learning_branch_ids,
+                comparison_branch_ids,
+            ) = self._branches_to_inspect(events)
+
+            # loop through branches with newly learned models
+            for branch_id in learning_branch_ids:
 
                 # inspect if branch has finished learning
                 num_models_learned_on_branch = int(
@@ -1236,10 +1577,10 @@ class QuantumModelLearningAgent:
                         ]
                     )
 
-            for branchID_bytes in active_branches_bayes.keys():
-                branch_id = int(branchID_bytes)
+            # loop through branches with newly completed comparisons
+            for branch_id in comparison_branch_ids:
                 num_comparisons_complete_on_branch = active_branches_bayes.get(
-                    branchID_bytes
+                    branch_id
                 )
                 if not self.branches[branch_id].comparisons_complete and (
                     int(num_comparisons_complete_on_branch)
@@ -1325,6 +1666,9 @@ class QuantumModelLearningAgent:
             ):
                 # break out of this while loop
                 still_learning = False
+            else:
+                with qmla.tracing.span("wait_for_workers", category="idle"):
+                    self.completion_channel.wait(timeout=self.completion_event_timeout)
 
         # Finalise all trees.
         for tree in self.trees.values():
@@ -1334,6 +1678,52 @@ class QuantumModelLearningAgent:
 
         self.log_print(["Learning stage complete on all trees."])
 
+    def _branches_to_inspect(self, events):
+        r"""
+        Branches whose learning/comparison counters may have changed.
+
+        :param list events: ``(event_type, branch_id)`` pairs received
+            from the completion channel.
+        :return tuple branch_ids: lists of branch IDs to check for completed
+            learning, and completed comparisons, respectively.
+            If there are no events, all active branches are returned,
+            in case any event was missed.
+        """
+
+        if len(events) == 0:
+            learning_branch_ids = [
+                int(b)
+                for b in self.redis_databases["active_branches_learning_models"].keys()
+            ]
+            comparison_branch_ids = [
+                int(b) for b in self.redis_databases["active_branches_bayes"].keys()
+            ]
+        else:
+            learning_branch_ids = sorted(
+                set(
+                    [
+                        branch_id
+                        for event_type, branch_id in events
+                        if event_type == qmla.completion_events.learning_event
+                    ]
+                )
+            )
+            comparison_branch_ids = sorted(
+                set(
+                    [
+                        branch_id
+                        for event_type, branch_id in events
+                        if event_type == qmla.completion_events.comparison_event
+                    ]
+                )
+            )
+
+        # ignore branches not belonging to this instance
+        learning_branch_ids = [b for b in learning_branch_ids if b in self.branches]
+        comparison_branch_ids = [b for b in comparison_branch_ids if b in self.branches]
+        return learning_branch_ids, comparison_branch_ids
+
+    @qmla.tracing.traced(category="qmla")
     def spawn_from_branch(
         self,
         branch_id,
@@ -1640,6 +2030,8 @@ class QuantumModelLearningAgent:
 
     def finalise_instance(self):
         self.compute_statistical_metrics_by_generation()
+        self._record_makespans()
+        self._record_experiments_saved()
         self.exploration_class.exploration_strategy_finalise()
 
         if self.qhl_mode_multiple_models:
@@ -1649,6 +2041,145 @@ class QuantumModelLearningAgent:
         else:
             self.finalise_qmla()
 
+    def _record_experiments_saved(self):
+        r"""
+        Report the experiments each model learned from, and those saved
+        by stopping its learning early (see the exploration strategy's
+        ``early_stopping_criteria``), in ``experiments_saved.csv``.
+        """
+
+        experiments = []
+        for model_id in sorted(set(self.models_learned)):
+            mod = self.get_model_storage_instance_by_id(model_id)
+            try:
+                num_experiments_run = mod.num_experiments_run
+            except AttributeError:
+                # learned info not retrieved
+                continue
+            experiments.append(
+                {
+                    "model_id": int(model_id),
+                    "model_name": mod.model_name,
+                    "num_experiments": mod.num_experiments,
+                    "num_experiments_run": num_experiments_run,
+                    "experiments_saved": mod.num_experiments - num_experiments_run,
+                    "early_stopping_reason": mod.early_stopping_reason,
+                }
+            )
+        if not experiments:
+            return
+        experiments = pd.DataFrame(experiments)
+        experiments.to_csv(
+            os.path.join(self.qmla_controls.plots_directory, "experiments_saved.csv")
+        )
+        self.log_print(
+            [
+                "Experiments saved by early stopping: {} of {} ({} of {} models stopped early)".format(
+                    experiments.experiments_saved.sum(),
+                    experiments.num_experiments.sum(),
+                    (experiments.experiments_saved > 0).sum(),
+                    len(experiments),
+                )
+            ]
+        )
+
+    def _num_workers(self):
+        r"""Number of processes running this instance's jobs."""
+        if self.use_local_workers:
+            return self.local_backend.num_workers
+        elif self.use_rq:
+            try:
+                return max(
+                    1,
+                    len(
+                        rq.Worker.all(
+                            queue=rq.Queue(self.qmla_id, connection=self.redis_conn)
+                        )
+                    ),
+                )
+            except Exception:
+                return 1
+        return 1
+
+    def _record_makespans(self):
+        r"""
+        Compare the time taken by each branch with an ideal schedule of its jobs.
+
+        The makespan of a branch is the time from launching its models' learning
+        to the completion of its comparisons.
+        Its lower bound is found from the durations of the branch's jobs,
+        recorded by the jobs (see :func:`~qmla.record_job_timing`):
+        comparisons can only start when learning is complete, and each stage takes
+        at least as long as its longest job, and as its total time shared
+        between the workers. For the instance, the bound is the larger of the
+        branches' bounds and the total time of all jobs shared between the workers.
+        Makespans are stored in ``branch_makespans.csv``; the instance's makespan
+        and its bound are also stored in the results of the instance.
+        """
+
+        records = [
+            r
+            for r in qmla.cost_model.load_job_timings([self.results_directory])
+            if r.get("qmla_id") == self.qmla_id
+        ]
+        num_workers = self._num_workers()
+
+        def stage_bound(durations):
+            if not durations:
+                return 0
+            return max(max(durations), sum(durations) / num_workers)
+
+        makespans = []
+        for branch_id, times in self.branch_schedule_times.items():
+            start = times.get("launched", times.get("learning_complete"))
+            end = times.get("comparisons_complete")
+            if start is None or end is None:
+                continue
+            durations = {
+                job_type: [
+                    r["duration"]
+                    for r in records
+                    if r["job_type"] == job_type and r.get("branch_id") == branch_id
+                ]
+                for job_type in qmla.cost_model.job_types
+            }
+            ideal_makespan = stage_bound(durations["learning"]) + stage_bound(
+                durations["comparison"]
+            )
+            makespans.append(
+                {
+                    "branch_id": branch_id,
+                    "num_learning_jobs": len(durations["learning"]),
+                    "num_comparison_jobs": len(durations["comparison"]),
+                    "start": start,
+                    "end": end,
+                    "makespan": end - start,
+                    "ideal_makespan": ideal_makespan,
+                }
+            )
+        if not makespans:
+            return
+        self.branch_makespans = pd.DataFrame(makespans)
+        self.branch_makespans["num_workers"] = num_workers
+        self.branch_makespans.to_csv(
+            os.path.join(self.qmla_controls.plots_directory, "branch_makespans.csv")
+        )
+
+        self.makespan = (
+            self.branch_makespans.end.max() - self.branch_makespans.start.min()
+        )
+        self.ideal_makespan = max(
+            self.branch_makespans.ideal_makespan.max(),
+            sum([r["duration"] for r in records]) / num_workers,
+        )
+        self.log_print(
+            [
+                "Makespan {:.1f}s; ideal schedule of jobs on {} workers: {:.1f}s".format(
+                    self.makespan, num_workers, self.ideal_makespan
+                )
+            ]
+        )
+
     def finalise_qmla(self):
         r"""
         Steps to end QMLA algorithm, such as storing analytics.
@@ -1828,9 +2359,12 @@ class QuantumModelLearningAgent:
             "QID": self.qmla_id,
             "NumParticles": self.num_particles,
             "NumExperiments": mod.num_experiments,
+            "NumExperimentsRun": mod.num_experiments_run,
             "ConfigLatex": self.latex_config,
             "Heuristic": mod.model_heuristic_class,
             "Time": time_taken,
+            "Makespan": self.makespan,
+            "IdealMakespan": self.ideal_makespan,
             "Host": self.redis_host_name,
             "Port": self.redis_port_number,
             "ResampleThreshold": self.exploration_class.qinfer_resampler_threshold,
@@ -2024,10 +2558,9 @@ class QuantumModelLearningAgent:
             )
 
             # get champion leared info
-            reduced_champion_info = pickle.loads(
-                self.redis_databases["learned_models_info_db"].get(
-                    str(self.champion_model_id)
-                )
+            reduced_champion_info = qmla.learned_info_storage.load_learned_info(
+                database=self.redis_databases["learned_models_info_db"],
+                key=str(self.champion_model_id),
             )
 
             reduced_params = {}
@@ -2062,17 +2595,15 @@ class QuantumModelLearningAgent:
             reduced_champion_info["normalization_record"] = []
             reduced_champion_info["times"] = []
 
-            compressed_reduced_champ_info = pickle.dumps(
-                reduced_champion_info, protocol=4
-            )
-
             # TODO generate new model for champion
             # - scratch normalization record;
             # - learn according to MPGH for both champion
             #   and suggested reduced champion,
             #   then take BF based on that
-            self.redis_databases["learned_models_info_db"].set(
-                str(float(reduced_mod_id)), compressed_reduced_champ_info
+            qmla.learned_info_storage.store_learned_info(
+                database=self.redis_databases["learned_models_info_db"],
+                key=str(float(reduced_mod_id)),
+                learned_info=reduced_champion_info,
             )
 
             self.get_model_storage_instance_by_id(
@@ -2197,6 +2728,7 @@ class QuantumModelLearningAgent:
     # Section: Run available algorithms (QMLA, QHL or QHL with multiple models)
     ##########
 
+    @qmla.tracing.traced(category="qmla")
     def run_quantum_hamiltonian_learning(
         self,
     ):
@@ -2236,6 +2768,7 @@ class QuantumModelLearningAgent:
         self.finalise_instance()
         # self._plot_statistical_metrics()
 
+    @qmla.tracing.traced(category="qmla")
     def run_quantum_hamiltonian_learning_multiple_models(self, model_names=None):
         r"""
         Run Quantum Hamiltonian Learning algorithm with multiple simulated models.
@@ -2315,6 +2848,7 @@ class QuantumModelLearningAgent:
             )
         self.finalise_instance()
 
+    @qmla.tracing.traced(category="qmla")
     def run_complete_qmla(
         self,
     ):
@@ -2505,9 +3039,11 @@ class QuantumModelLearningAgent:
                 pass
 
     def _inspect_remote_job_crashes(self):
-        r"""Check if any job on redis queue has failed."""
+        r"""Check if any job on redis queue (or local process pool) has failed."""
         self.call_counter["job_crashes"] += 1
         t_init = time.time()
+        if self.local_backend is not None:
+            self.local_backend.raise_failed_jobs()
         if self.redis_databases["any_job_failed"]["Status"] == b"1":
             # TODO better way to detect errors?
             self.log_print(["Failure on remote job. Terminating QMLA."])
@@ -2519,12 +3055,44 @@ class QuantumModelLearningAgent:
 
         del self.redis_conn
         del self.redis_databases
+        del self.completion_channel
+        if self.local_backend is not None:
+            self.local_backend.shutdown()
+        del self.local_backend
         del self.write_log_file
 
+    def export_trace(self):
+        r"""
+        Write this process's trace, and merge it with those of this instance's jobs.
+
+        The merged trace is written to ``traces/trace_qmla_<qmla_id>.json``
+        in the results directory, with the corresponding folded stacks
+        (for flame graphs) in ``traces/trace_qmla_<qmla_id>.folded``.
+
+        :return str merged_trace_file: path to the merged trace; None if not tracing.
+        """
+
+        if self.trace_directory is None:
+            return None
+        qmla.tracing.write_trace("agent_{}.json".format(self.qmla_id))
+        merged_trace_file = os.path.join(
+            self.results_directory, "traces", "trace_qmla_{}.json".format(self.qmla_id)
+        )
+        num_spans = qmla.tracing.merge_traces(
+            self.trace_directory,
+            merged_trace_file,
+            folded_stacks_file=merged_trace_file.replace(".json", ".folded"),
+        )
+        self.log_print(
+            ["Trace of {} spans merged to {}".format(num_spans, merged_trace_file)]
+        )
+        return merged_trace_file
+
     ##########
     # Section: Analysis/plotting methods
     ##########
 
+    @qmla.tracing.traced(category="analysis")
     def analyse_instance(self):
         r"""Basic analysis of this instance"""
 
@@ -2676,6 +3244,7 @@ class QuantumModelLearningAgent:
         self.model_sensitivities[model_id] = sensitivity
         return f_score
 
+    @qmla.tracing.traced(category="plotting")
     def plot_instance_outcomes(
         self,
     ):
@@ -18,9 +18,17 @@ to perform QMLA, without requiring all information be held on all actors
 at all times.
 This method is quite slow - useful information is stored in dictionaries and
 pickled to redis. Pickling and unpickling is quite slow, so should be minimised.
+Models' learned info, the largest data stored, is instead stored field by field
+through :mod:`qmla.learned_info_storage`.
 """
 
-__all__ = ["databases_required", "get_redis_databases_by_qmla_id", "get_seed"]
+__all__ = [
+    "databases_required",
+    "get_redis_databases_by_qmla_id",
+    "get_seed",
+    "clear_redis_databases",
+    "set_redis_databases_by_qmla_id",
+]
 
 
 databases_required = [
@@ -33,8 +41,12 @@ databases_required = [
     "active_branches_bayes",
     "active_interbranch_bayes",  # TODO unused?
     "any_job_failed",
+    "completion_events",
 ]
 
+# database connections already opened by this process, by (host, port, qmla_id)
+_redis_databases = {}
+
 
 def get_redis_databases_by_qmla_id(
     host_name,
@@ -53,6 +65,8 @@ def get_redis_databases_by_qmla_id(
 
     A set of databases are stored at the redis database host_name:port_number;
     these are listed in ``qmla.redis_settings.databases_required``.
+    Connections are opened once per process for each QMLA instance,
+    and reused by subsequent calls, e.g. from later jobs on the same worker.
 
     :param str host_name: name of host server on which redis database exists.
     :param int port_number: this QMLA instance's unique port number (6300 + qmla_id).
@@ -60,6 +74,10 @@ def get_redis_databases_by_qmla_id(
     :return dict database_dict: set of database addresses unique to the qmla_id, host_name and port_number.
     """
 
+    database_key = (host_name, port_number, qmla_id)
+    if database_key in _redis_databases:
+        return _redis_databases[database_key]
+
     database_dict = {}
     # Seed this QMLA instance's database ID's
     seed = get_seed(host_name=host_name, port_number=port_number, qmla_id=qmla_id)
@@ -74,9 +92,40 @@ def get_redis_databases_by_qmla_id(
             host=host_name, port=port_number, db=seed + i
         )
 
+    _redis_databases[database_key] = database_dict
     return database_dict
 
 
+def set_redis_databases_by_qmla_id(host_name, port_number, qmla_id, database_dict):
+    r"""
+    Register the databases to use for this QMLA instance within this process,
+    instead of connecting to the redis server,
+    e.g. in-memory databases of :class:`~qmla.local_backend.LocalParallelBackend`.
+
+    :param str host_name: name of host server of this QMLA instance.
+    :param int port_number: this QMLA instance's unique port number.
+    :param int qmla_id: QMLA id, unique to a single instance within a run.
+    :param dict database_dict: database for each of ``databases_required``,
+        with the same interface as ``redis.StrictRedis``;
+        if None, any registered databases are discarded.
+    """
+
+    database_key = (host_name, port_number, qmla_id)
+    if database_dict is None:
+        _redis_databases.pop(database_key, None)
+    else:
+        _redis_databases[database_key] = database_dict
+
+
+def clear_redis_databases():
+    r"""Discard the database connections held by this process."""
+    for database_dict in _redis_databases.values():
+        for database in database_dict.values():
+            if hasattr(database, "connection_pool"):
+                database.connection_pool.disconnect()
+    _redis_databases.clear()
+
+
 def get_seed(host_name, port_number, qmla_id):
     r"""
     Unique seed for this QMLA id.
@@ -1,4 +1,6 @@
 import copy
+import concurrent.futures
+import multiprocessing.util
 import pickle
 import random
 import time as time
@@ -18,6 +20,11 @@ import qmla.model_building_utilities as model_building_utilities
 import qmla.model_for_comparison
 import qmla.logging
 import qmla.redis_settings as rds
+import qmla.completion_events
+import qmla.worker_cache
+import qmla.learned_info_storage
+import qmla.tracing
+import qmla.cost_model
 import redis
 
 pickle.HIGHEST_PROTOCOL = 4
@@ -26,7 +33,12 @@ plt.switch_backend("agg")
 
 __all__ = ["remote_bayes_factor_calculation", "plot_dynamics_from_models"]
 
+# process in which one side of Bayes factor calculations is run, reused between jobs
+_bayes_factor_pool = None
 
+
+@qmla.logging.flushes_logs
+@qmla.tracing.traced_job("compare_models", category="comparison")
 def remote_bayes_factor_calculation(
     model_a_id,
     model_b_id,
@@ -40,6 +52,7 @@ def remote_bayes_factor_calculation(
     port_number=6379,
     qid=0,
     log_file="rq_output.log",
+    completion_channel=None,
 ):
     r"""
     Standalone function to compute Bayes factors.
@@ -57,11 +70,15 @@ def remote_bayes_factor_calculation(
     From these we extract log likelihoods to compute the Bayes factor, BF(A,B).
     Models have a unique pair_id, simply (min(A,B), max(A,B)).
     For BF(A,B) >> 1, A is deemed the winner; BF(A,B)<<1 deems B the winner.
+    The two sides are independent, so unless plots of the models are required,
+    model B's side is computed in a separate process, concurrently with model A's,
+    if ``parallel_bayes_factor_sides`` is set by the exploration strategy.
     The result is then stored redis databases:
         - bayes_factors_db: BF(A,B)
         - bayes_factors_winners_db: id of winning model
         - active_branches_bayes: when complete, increase the count of
-          complete pairs' BF on the given branch.
+          complete pairs' BF on the given branch, and announce this
+          on the completion channel.
 
     :param int model_a_id: unique id for model A
     :param int model_b_id: unique id for model B
@@ -82,6 +99,9 @@ def remote_bayes_factor_calculation(
     :param int qid: QMLA id, unique to a single instance within a run.
         Used to identify the redis database corresponding to this instance.
     :param str log_file: Path of the log file.
+    :param CompletionChannel completion_channel: channel on which to announce
+        that this comparison has finished. Default None: events are
+        pushed to the redis database of this QMLA instance.
     """
 
     def log_print(to_print_list):
@@ -114,11 +134,15 @@ def remote_bayes_factor_calculation(
             active_branches_bayes = redis_databases["active_branches_bayes"]
             active_interbranch_bayes = redis_databases["active_interbranch_bayes"]
             any_job_failed_db = redis_databases["any_job_failed"]
+            if completion_channel is None:
+                completion_channel = qmla.completion_events.RedisCompletionChannel(
+                    redis_databases["completion_events"]
+                )
 
             # Retrieve data from databases
-            qmla_core_info_dict = pickle.loads(
-                redis_databases["qmla_core_info_database"]["qmla_settings"]
-            )
+            qmla_core_info_dict = qmla.worker_cache.get_qmla_core_info(
+                host_name, port_number, qid
+            )["qmla_settings"]
             break
         except Exception as e:
             if k == num_redis_retries - 1:
@@ -131,12 +155,21 @@ def remote_bayes_factor_calculation(
                 )
                 any_job_failed_db.set("Status", 1)
                 raise
+    qmla.tracing.start_job_tracing(qmla_core_info_dict.get("trace_directory"))
 
     # Whether to build plots
     save_plots_of_posteriors = False
     plot_level = qmla_core_info_dict["plot_level"]
     figure_format = qmla_core_info_dict["figure_format"]
 
+    # Plots require both updated models in this process;
+    # otherwise model B's side can be computed in a separate process.
+    parallel_sides = (
+        qmla_core_info_dict["parallel_bayes_factor_sides"]
+        and plot_level < 4
+        and not save_plots_of_posteriors
+    )
+
     # Get model instances
     for k in range(num_redis_retries):
         try:
@@ -161,49 +194,96 @@ def remote_bayes_factor_calculation(
                 any_job_failed_db.set("Status", 1)
                 raise
 
-    for k in range(num_redis_retries):
+    side_b = None
+    if parallel_sides:
         try:
-            model_b = qmla.model_for_comparison.ModelInstanceForComparison(
+            side_b = _get_bayes_factor_pool().submit(
+                _log_likelihood_against_opponent,
                 model_id=model_b_id,
+                opponent_id=model_a_id,
+                opponent_times=model_a.times_learned_over,
+                opponent_experimental_params=model_a.track_experiment_parameters,
                 qid=qid,
-                opponent=model_a_id,
-                log_file=log_file,
                 host_name=host_name,
                 port_number=port_number,
+                log_file=log_file,
+                trace_directory=qmla_core_info_dict.get("trace_directory"),
             )
-            break
         except Exception as e:
-            if k == num_redis_retries - 1:
-                log_print(
-                    [
-                        "BF Failed to instantiate model {}. Error: {}".format(
-                            model_b_id, e
-                        )
-                    ]
+            log_print(["BF failed to launch parallel process. Error: {}".format(e)])
+            _reset_bayes_factor_pool()
+
+    if side_b is not None:
+        # model B is instantiated in the other process; only its record is needed
+        model_b = None
+        for k in range(num_redis_retries):
+            try:
+                opponent_of_a = qmla.learned_info_storage.load_learned_info(
+                    database=learned_models_info_db,
+                    key=str(float(model_b_id)),
+                    fields=["times_learned_over", "track_experiment_parameters"],
                 )
-                any_job_failed_db.set("Status", 1)
-                raise
-
-    log_print(["Both models instantiated on branch {}.".format(branch_id)])
+                break
+            except Exception as e:
+                if k == num_redis_retries - 1:
+                    log_print(
+                        [
+                            "BF Failed to retrieve learned info of model {}. Error: {}".format(
+                                model_b_id, e
+                            )
+                        ]
+                    )
+                    any_job_failed_db.set("Status", 1)
+                    raise
+    else:
+        for k in range(num_redis_retries):
+            try:
+                model_b = qmla.model_for_comparison.ModelInstanceForComparison(
+                    model_id=model_b_id,
+                    qid=qid,
+                    opponent=model_a_id,
+                    log_file=log_file,
+                    host_name=host_name,
+                    port_number=port_number,
+                )
+                break
+            except Exception as e:
+                if k == num_redis_retries - 1:
+                    log_print(
+                        [
+                            "BF Failed to instantiate model {}. Error: {}".format(
+                                model_b_id, e
+                            )
+                        ]
+                    )
+                    any_job_failed_db.set("Status", 1)
+                    raise
+        opponent_of_a = {
+            "times_learned_over": model_b.times_learned_over,
+            "track_experiment_parameters": model_b.track_experiment_parameters,
+        }
+
+        log_print(["Both models instantiated on branch {}.".format(branch_id)])
 
     # Take a copy of each updater before updates (for plotting later)
-    for k in range(num_redis_retries):
-        try:
-            updater_a_copy = copy.deepcopy(model_a.qinfer_updater)
-            updater_b_copy = copy.deepcopy(model_b.qinfer_updater)
-            break
-        except Exception as e:
-            if k == num_redis_retries - 1:
-                log_print(["BF Failed to copy updaters. Error: {}".format(e)])
-                any_job_failed_db.set("Status", 1)
-                raise
+    if save_plots_of_posteriors:
+        for k in range(num_redis_retries):
+            try:
+                updater_a_copy = copy.deepcopy(model_a.qinfer_updater)
+                updater_b_copy = copy.deepcopy(model_b.qinfer_updater)
+                break
+            except Exception as e:
+                if k == num_redis_retries - 1:
+                    log_print(["BF Failed to copy updaters. Error: {}".format(e)])
+                    any_job_failed_db.set("Status", 1)
+                    raise
 
     # Update the models with the times trained by the other model.
     for k in range(num_redis_retries):
         try:
             log_l_a = model_a.update_log_likelihood(
-                new_times=model_b.times_learned_over,
-                new_experimental_params=model_b.track_experiment_parameters,
+                new_times=opponent_of_a["times_learned_over"],
+                new_experimental_params=opponent_of_a["track_experiment_parameters"],
             )
             break
         except Exception as e:
@@ -217,24 +297,45 @@ def remote_bayes_factor_calculation(
                 )
                 any_job_failed_db.set("Status", 1)
                 raise
-    for k in range(num_redis_retries):
+    normalization_record_a = model_a.qinfer_updater.normalization_record
+
+    if side_b is not None:
         try:
-            log_l_b = model_b.update_log_likelihood(
-                new_times=model_a.times_learned_over,
-                new_experimental_params=model_a.track_experiment_parameters,
-            )
-            break
+            with qmla.tracing.span("wait_for_opponent_side", category="idle"):
+                side_b_result = side_b.result()
+            log_l_b = side_b_result["log_total_likelihood"]
+            normalization_record_b = side_b_result["normalization_record"]
         except Exception as e:
-            if k == num_redis_retries - 1:
-                log_print(
-                    [
-                        "BF Failed to compute log likelihood for {}. Error: {}".format(
-                            model_b_id, k
-                        )
-                    ]
+            log_print(
+                [
+                    "BF Failed to compute log likelihood for {} in parallel process. Error: {}".format(
+                        model_b_id, e
+                    )
+                ]
+            )
+            any_job_failed_db.set("Status", 1)
+            _reset_bayes_factor_pool()
+            raise
+    else:
+        for k in range(num_redis_retries):
+            try:
+                log_l_b = model_b.update_log_likelihood(
+                    new_times=model_a.times_learned_over,
+                    new_experimental_params=model_a.track_experiment_parameters,
                 )
-                any_job_failed_db.set("Status", 1)
-                raise
+                break
+            except Exception as e:
+                if k == num_redis_retries - 1:
+                    log_print(
+                        [
+                            "BF Failed to compute log likelihood for {}. Error: {}".format(
+                                model_b_id, k
+                            )
+                        ]
+                    )
+                    any_job_failed_db.set("Status", 1)
+                    raise
+        normalization_record_b = model_b.qinfer_updater.normalization_record
 
     bayes_factor = np.exp(log_l_a - log_l_b)
 
@@ -293,51 +394,75 @@ def remote_bayes_factor_calculation(
         model_a_id, model_b_id
     )
 
-    for k in range(num_redis_retries):
-        try:
-            if float(model_a_id) < float(model_b_id):
-                # so that BF in database always refers to (low/high), not (high/low).
-                bayes_factors_db.set(pair_id, bayes_factor)
-            else:
-                bayes_factors_db.set(pair_id, (1.0 / bayes_factor))
-            break
-        except Exception as e:
-            if k == num_redis_retries - 1:
-                log_print(["BF Failed to set bf on redis bf db. Error: ", e])
-                any_job_failed_db.set("Status", 1)
-                raise
-
-    # Record winner if BF > threshold
-    for k in range(num_redis_retries):
-        try:
-            if bayes_factor > bayes_threshold:
-                bayes_factors_winners_db.set(pair_id, "a")
-            elif bayes_factor < (1.0 / bayes_threshold):
-                bayes_factors_winners_db.set(pair_id, "b")
-            else:
-                log_print(["Neither model much better."])
-                log_print(
-                    [
-                        "Renorm record A: \n {}".format(
-                            model_a.qinfer_updater._normalization_record
-                        ),
-                        "\nRenorm record B: \n {}".format(
-                            model_b.qinfer_updater._normalization_record
-                        ),
-                    ]
-                )
-            break
-        except Exception as e:
-            if k == num_redis_retries - 1:
-                log_print(["BF Failed to set bf on redis winner db. Error: ", e])
-                any_job_failed_db.set("Status", 1)
-                raise
+    with qmla.tracing.span("store_bayes_factor", category="redis"):
+        for k in range(num_redis_retries):
+            try:
+                if float(model_a_id) < float(model_b_id):
+                    # so that BF in database always refers to (low/high), not (high/low).
+                    bayes_factors_db.set(pair_id, bayes_factor)
+                else:
+                    bayes_factors_db.set(pair_id, (1.0 / bayes_factor))
+                break
+            except Exception as e:
+                if k == num_redis_retries - 1:
+                    log_print(["BF Failed to set bf on redis bf db. Error: ", e])
+                    any_job_failed_db.set("Status", 1)
+                    raise
+
+        # Record winner if BF > threshold
+        for k in range(num_redis_retries):
+            try:
+                if bayes_factor > bayes_threshold:
+                    bayes_factors_winners_db.set(pair_id, "a")
+                elif bayes_factor < (1.0 / bayes_threshold):
+                    bayes_factors_winners_db.set(pair_id, "b")
+                else:
+                    log_print(["Neither model much better."])
+                    log_print(
+                        [
+                            "Renorm record A: \n {}".format(normalization_record_a),
+                            "\nRenorm record B: \n {}".format(normalization_record_b),
+                        ]
+                    )
+                break
+            except Exception as e:
+                if k == num_redis_retries - 1:
+                    log_print(["BF Failed to set bf on redis winner db. Error: ", e])
+                    any_job_failed_db.set("Status", 1)
+                    raise
+
+    # Record how long the comparison took, for fitting the cost model of jobs;
+    # features are model A's, with the experiments replayed by both sides
+    try:
+        qmla.cost_model.record_job_timing(
+            results_directory=model_a.results_directory,
+            job_type="comparison",
+            duration=time.time() - time_start,
+            num_qubits=model_a.model_constructor.num_qubits,
+            num_terms=model_a.model_constructor.num_terms,
+            num_particles=model_a.num_particles,
+            num_experiments=(
+                len(model_a.times_learned_over)
+                + len(opponent_of_a["times_learned_over"])
+            ),
+            expectation_value_function=qmla.cost_model.expectation_value_function_name(
+                model_a.exploration_class
+            ),
+            qmla_id=qid,
+            model_ids=[int(model_a_id), int(model_b_id)],
+            branch_id=None if branch_id is None else int(branch_id),
+        )
+    except Exception as e:
+        log_print(["Failed to record job timing. Error: {}".format(e)])
 
     # Record this result to the branch
     for k in range(num_redis_retries):
         try:
             if branch_id is not None:
                 active_branches_bayes.incr(int(branch_id), 1)
+                completion_channel.publish(
+                    qmla.completion_events.comparison_event, branch_id
+                )
             else:
                 active_interbranch_bayes.set(pair_id, True)
             break
@@ -356,7 +481,7 @@ def remote_bayes_factor_calculation(
         ]
     )
 
-    del model_a, model_b
+    del model_a, model_b, side_b
     return bayes_factor
 
 
@@ -377,6 +502,74 @@ def log_print(to_print_list, log_file, log_identifier):
 #########
 
 
+def _get_bayes_factor_pool():
+    r"""Process pool for computing one side of Bayes factors, started on first use."""
+    global _bayes_factor_pool
+    if _bayes_factor_pool is None:
+        _bayes_factor_pool = concurrent.futures.ProcessPoolExecutor(max_workers=1)
+        # stop the pool before this process joins its children at exit;
+        # otherwise a process which is itself a multiprocessing child
+        # (e.g. on the local parallel backend) waits on the pool forever
+        multiprocessing.util.Finalize(
+            None, _bayes_factor_pool.shutdown, exitpriority=100
+        )
+    return _bayes_factor_pool
+
+
+def _reset_bayes_factor_pool():
+    r"""Discard the process pool, e.g. after its process failed."""
+    global _bayes_factor_pool
+    if _bayes_factor_pool is not None:
+        _bayes_factor_pool.shutdown(wait=False)
+    _bayes_factor_pool = None
+
+
+@qmla.logging.flushes_logs
+@qmla.tracing.traced_job("log_likelihood_against_opponent", category="comparison")
+def _log_likelihood_against_opponent(
+    model_id,
+    opponent_id,
+    opponent_times,
+    opponent_experimental_params,
+    qid,
+    host_name,
+    port_number,
+    log_file,
+    trace_directory=None,
+):
+    r"""
+    Compute one side of a Bayes factor, i.e. a model's log likelihood
+    after updating on its opponent's experiments.
+
+    Run in a separate process by :func:`remote_bayes_factor_calculation`,
+    so the model is instantiated from the redis database there.
+
+    :param str trace_directory: trace directory of the QMLA instance,
+        if it is traced (see :mod:`qmla.tracing`).
+    :return dict result: ``log_total_likelihood`` and ``normalization_record``
+        of the model's updater.
+    """
+
+    qmla.tracing.start_job_tracing(trace_directory)
+    model = qmla.model_for_comparison.ModelInstanceForComparison(
+        model_id=model_id,
+        qid=qid,
+        opponent=opponent_id,
+        log_file=log_file,
+        host_name=host_name,
+        port_number=port_number,
+    )
+    log_total_likelihood = model.update_log_likelihood(
+        new_times=opponent_times,
+        new_experimental_params=opponent_experimental_params,
+    )
+    return {
+        "log_total_likelihood": log_total_likelihood,
+        "normalization_record": model.qinfer_updater.normalization_record,
+    }
+
+
+@qmla.tracing.traced(category="plotting")
 def plot_dynamics_from_models(
     models, exp_msmts, bf_times, bayes_factor, save_directory, figure_format="png"
 ):
@@ -472,7 +665,7 @@ def plot_models_dynamics(
         times, experimental_exp_vals, label="Exp data", color="red", alpha=0.6, s=5
     )
     ax1.set_ylabel("Exp Val")
-    plot_probes = pickle.load(open(plot_probes_path, "rb"))
+    plot_probes = qmla.worker_cache.get_plot_probes(plot_probes_path)
 
     for mod in [model_a, model_b]:
         final_params = mod.qinfer_updater.est_mean()
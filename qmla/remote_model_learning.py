@@ -11,6 +11,11 @@ import redis
 import qmla.model_for_learning
 import qmla.redis_settings
 import qmla.logging
+import qmla.completion_events
+import qmla.learned_info_storage
+import qmla.worker_cache
+import qmla.tracing
+import qmla.cost_model
 
 pickle.HIGHEST_PROTOCOL = 4
 plt.switch_backend("agg")
@@ -18,6 +23,8 @@ plt.switch_backend("agg")
 __all__ = ["remote_learn_model_parameters"]
 
 
+@qmla.logging.flushes_logs
+@qmla.tracing.traced_job("learn_model", category="learning")
 def remote_learn_model_parameters(
     name,
     model_id,
@@ -29,6 +36,7 @@ def remote_learn_model_parameters(
     port_number=6379,
     qid=0,
     log_file="rq_output.log",
+    completion_channel=None,
 ):
     """
     Standalone function to perform Quantum Hamiltonian Learning on individual models.
@@ -63,6 +71,9 @@ def remote_learn_model_parameters(
     :param int qid: QMLA id, unique to a single instance within a run.
         Used to identify the redis database corresponding to this instance.
     :param str log_file: Path of the log file.
+    :param CompletionChannel completion_channel: channel on which to announce
+        that this model has finished learning. Default None: events are
+        pushed to the redis database of this QMLA instance.
     """
 
     def log_print(to_print_list):
@@ -85,14 +96,22 @@ def remote_learn_model_parameters(
     learned_models_ids = redis_databases["learned_models_ids"]
     active_branches_learning_models = redis_databases["active_branches_learning_models"]
     any_job_failed_db = redis_databases["any_job_failed"]
+    if completion_channel is None:
+        completion_channel = qmla.completion_events.RedisCompletionChannel(
+            redis_databases["completion_events"]
+        )
 
     if qmla_core_info_dict is not None:
         # for local runs, qmla_core_info_dict passed, with probe_dict included
         # in it.
         probe_dict = qmla_core_info_dict["probe_dict"]
     else:
-        qmla_core_info_dict = pickle.loads(qmla_core_info_database["qmla_settings"])
-        probe_dict = pickle.loads(qmla_core_info_database["probes_system"])
+        qmla_core_info = qmla.worker_cache.get_qmla_core_info(
+            host_name, port_number, qid
+        )
+        qmla_core_info_dict = qmla_core_info["qmla_settings"]
+        probe_dict = qmla_core_info["probes_system"]
+    qmla.tracing.start_job_tracing(qmla_core_info_dict.get("trace_directory"))
 
     true_model_terms_matrices = qmla_core_info_dict["true_oplist"]
     qhl_plots = qmla_core_info_dict["qhl_plots"]
@@ -168,18 +187,44 @@ def remote_learn_model_parameters(
             pass
 
     # Throw away model instance; only need to store results.
-    updated_model_info = copy.deepcopy(qml_instance.learned_info_dict())
-    compressed_info = pickle.dumps(updated_model_info, protocol=4)
+    updated_model_info = qml_instance.learned_info_dict()
+
+    # Record how long learning took, for fitting the cost model of jobs
+    try:
+        qmla.cost_model.record_job_timing(
+            results_directory=qml_instance.results_directory,
+            job_type="learning",
+            duration=time.time() - time_start,
+            num_qubits=qml_instance.model_constructor.num_qubits,
+            num_terms=qml_instance.model_constructor.num_terms,
+            num_particles=qml_instance.num_particles,
+            num_experiments=qml_instance.num_experiments_run,
+            expectation_value_function=qmla.cost_model.expectation_value_function_name(
+                qml_instance.exploration_class
+            ),
+            qmla_id=qid,
+            model_id=int(model_id),
+            branch_id=int(branch_id),
+        )
+    except Exception as e:
+        log_print(["Failed to record job timing. Error: {}".format(e)])
 
     # Store the (compressed) result set on the redis database.
     for k in range(num_redis_retries):
         try:
-            learned_models_info_db.set(str(model_id), compressed_info)
+            storage_summary = qmla.learned_info_storage.store_learned_info(
+                database=learned_models_info_db,
+                key=str(model_id),
+                learned_info=updated_model_info,
+            )
             log_print(
                 [
                     "learned_models_info_db added to db for model {} after {} attempts".format(
                         str(model_id), k
-                    )
+                    ),
+                    "Stored {} bytes; encoded in {:.3f}s".format(
+                        storage_summary["num_bytes"], storage_summary["encode_time"]
+                    ),
                 ]
             )
             break
@@ -196,6 +241,7 @@ def remote_learn_model_parameters(
         try:
             active_branches_learning_models.incr(int(branch_id), 1)
             learned_models_ids.set(str(model_id), 1)
+            completion_channel.publish(qmla.completion_events.learning_event, branch_id)
             log_print(
                 [
                     "Updated model/branch learned on redis db  {}/{}".format(
@@ -211,7 +257,6 @@ def remote_learn_model_parameters(
 
     if remote:
         del updated_model_info
-        del compressed_info
         del qml_instance
         log_print(
             [
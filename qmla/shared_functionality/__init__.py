@@ -1,7 +1,78 @@
-from qmla.shared_functionality.branch_mapping import *
-from qmla.shared_functionality.expectation_value_functions import *
-from qmla.shared_functionality.model_pairing_strategies import *
-from qmla.shared_functionality.probe_transformer import *
-from qmla.shared_functionality.qinfer_model_interface import *
-from qmla.shared_functionality.genetic_algorithm import *
-from qmla.shared_functionality.model_constructors import *
+import qmla.lazy_loading
+
+r"""
+Submodules, and the names they export, are imported on first use;
+see :mod:`qmla.lazy_loading`.
+"""
+
+_submodule_exports = {
+    "branch_mapping": [
+        "branch_is_num_params",
+        "branch_is_num_dims",
+        "branch_is_num_params_and_qubits",
+        "branch_computed_from_qubit_and_param_count",
+    ],
+    "expectation_value_functions": [
+        "krylov_dimension_threshold",
+        "default_expectation_value",
+        "krylov_expectation_value",
+        "size_dependent_expectation_value",
+        "batched_expectation_values",
+        "spectral_decomposition",
+        "spectral_expectation_values",
+        "hahn_evolution",
+        "make_inversion_gate_rotate_y",
+        "make_inversion_gate",
+        "hahn_via_z_pi_gate",
+        "n_qubit_hahn_evolution_double_time_reverse",
+        "n_qubit_hahn_evolution",
+        "hahn_inversion_gate",
+        "spectral_hahn_evolution",
+        "hahn_echo_likelihoods",
+        "reduced_first_qubit_density_matrices",
+        "reduced_probe_projector",
+        "spectral_hahn_subroutines",
+        "partial_trace",
+        "partial_trace_out_second_qubit",
+        "n_qubit_plus_state",
+    ],
+    "model_pairing_strategies": [
+        "generate_random_regular_graph",
+        "generate_graph",
+        "check_graph_meet_criteria",
+        "generate_configurations",
+        "attempt_minimal_graph",
+        "find_efficient_comparison_pairs",
+    ],
+    "early_stopping": [
+        "EarlyStoppingCriterion",
+        "VolumeThreshold",
+        "VolumePlateau",
+        "ParameterUncertaintyRatio",
+        "EffectiveSampleSizeStability",
+        "EarlyStopping",
+    ],
+    "probe_transformer": ["ProbeTransformation", "FirstQuantisationToJordanWigner"],
+    "qinfer_model_interface": [
+        "true_system_spectrum",
+        "ParticleSpectrumCache",
+        "QInferModelQMLA",
+        "QInferNVCentreExperiment",
+        "QInferInterfaceJordanWigner",
+        "QInferInterfaceAnalytical",
+    ],
+    "genetic_algorithm": [
+        "GeneticAlgorithmQMLA",
+        "GeneticAlgorithmFullyConnectedLikewisePauliTerms",
+    ],
+    "model_constructors": [
+        "BaseModel",
+        "SparseModel",
+        "PauliLikewiseModel",
+        "FermilibModel",
+        "SharedParametersModel",
+        "LiouvillianModel",
+    ],
+}
+
+__getattr__, __dir__, __all__ = qmla.lazy_loading.attach(__name__, _submodule_exports)
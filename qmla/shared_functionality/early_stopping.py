@@ -0,0 +1,185 @@
+import numpy as np
+
+r"""
+Criteria for stopping parameter learning before all experiments are performed.
+
+:meth:`~qmla.ModelInstanceForLearning.update_model` runs up to ``num_experiments``
+experiments; after each, the model's :class:`~qmla.shared_functionality.early_stopping.EarlyStopping`
+checks whether its :class:`~qmla.EpochRecorder` shows that further experiments
+are unlikely to improve the parameter estimates. Models which converge quickly
+then cost a fraction of the compute of the hardest model on their branch.
+
+Criteria only read the epochs recorded so far, so they hold no state and
+the same instances can be shared by every model of an exploration strategy,
+which lists them in ``early_stopping_criteria``.
+Custom criteria should inherit from :class:`EarlyStoppingCriterion`
+and implement :meth:`~EarlyStoppingCriterion.is_met`.
+"""
+
+__all__ = [
+    "EarlyStoppingCriterion",
+    "VolumeThreshold",
+    "VolumePlateau",
+    "ParameterUncertaintyRatio",
+    "EffectiveSampleSizeStability",
+    "EarlyStopping",
+]
+
+
+class EarlyStoppingCriterion:
+    r"""
+    Condition on the epochs recorded so far, under which learning can stop.
+
+    :param int window: number of most recent experiments the criterion
+        considers; it is not met until that many experiments have been recorded.
+    """
+
+    def __init__(self, window=1):
+        self.window = window
+
+    def __call__(self, epoch_recorder):
+        # epoch 0 is the initial distribution, before any experiment
+        if len(epoch_recorder) - 1 < self.window:
+            return False
+        return bool(self.is_met(epoch_recorder))
+
+    def is_met(self, epoch_recorder):
+        r"""
+        Whether learning can stop, given at least ``window`` experiments.
+
+        :param EpochRecorder epoch_recorder: record of the model's learning.
+        :return bool met: True if no further experiments are needed.
+        """
+
+        raise NotImplementedError
+
+    def __repr__(self):
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join("{}={}".format(k, v) for k, v in sorted(vars(self).items())),
+        )
+
+
+class VolumeThreshold(EarlyStoppingCriterion):
+    r"""
+    Volume of the parameter distribution has fallen below ``threshold``.
+
+    Used for the exploration strategy's ``terminate_learning_at_volume_convergence``.
+
+    :param float threshold: volume below which to stop.
+    """
+
+    def __init__(self, threshold=1e-8):
+        super().__init__(window=1)
+        self.threshold = threshold
+
+    def is_met(self, epoch_recorder):
+        return epoch_recorder.volumes[-1] < self.threshold
+
+
+class VolumePlateau(EarlyStoppingCriterion):
+    r"""
+    Volume of the parameter distribution has stopped decreasing.
+
+    The smallest volume of the last ``window`` experiments is compared with
+    the smallest volume before them; the minimum is used, rather than the
+    latest volume, since resampling makes the volume jump between experiments.
+
+    :param int window: number of experiments over which the volume must plateau.
+    :param float tolerance: fraction by which the volume must decrease
+        over the window for learning to continue.
+    """
+
+    def __init__(self, window=20, tolerance=0.05):
+        super().__init__(window=window)
+        self.tolerance = tolerance
+
+    def is_met(self, epoch_recorder):
+        volumes = epoch_recorder.volumes
+        recent = np.min(volumes[-self.window :])
+        before = np.min(volumes[: -self.window])
+        return recent >= (1 - self.tolerance) * before
+
+
+class ParameterUncertaintyRatio(EarlyStoppingCriterion):
+    r"""
+    Every parameter's uncertainty is a small fraction of its estimate.
+
+    :param float threshold: ratio of uncertainty (standard deviation) to
+        estimate below which every parameter must lie.
+    :param float minimum_scale: scale used in place of estimates of smaller
+        magnitude, so that parameters near zero need only an absolute uncertainty
+        of ``threshold * minimum_scale``.
+    """
+
+    def __init__(self, threshold=0.01, minimum_scale=1e-3):
+        super().__init__(window=1)
+        self.threshold = threshold
+        self.minimum_scale = minimum_scale
+
+    def is_met(self, epoch_recorder):
+        scale = np.maximum(np.abs(epoch_recorder.param_means[-1]), self.minimum_scale)
+        return np.all(epoch_recorder.param_uncertainties[-1] / scale < self.threshold)
+
+
+class EffectiveSampleSizeStability(EarlyStoppingCriterion):
+    r"""
+    Effective sample size has stopped changing, without resampling.
+
+    Informative experiments reweight the particles, reducing the effective sample
+    size; if it barely changes over ``window`` experiments, they are no longer
+    updating the distribution.
+
+    :param int window: number of experiments over which the
+        effective sample size must be stable.
+    :param float tolerance: largest change of the effective sample size
+        over the window, as a fraction of its value.
+    """
+
+    def __init__(self, window=20, tolerance=0.01):
+        super().__init__(window=window)
+        self.tolerance = tolerance
+
+    def is_met(self, epoch_recorder):
+        records = epoch_recorder.records[-self.window :]
+        if np.any(records["just_resampled"]):
+            return False
+        ess = records["effective_sample_size"]
+        return np.ptp(ess) <= self.tolerance * np.max(ess)
+
+
+class EarlyStopping:
+    r"""
+    Decides when a model's learning stops, from a set of criteria.
+
+    Built for each model by
+    :meth:`~qmla.exploration_strategies.ExplorationStrategy.get_early_stopping`.
+
+    :param list criteria: :class:`EarlyStoppingCriterion` instances;
+        if empty, learning never stops early.
+    :param int minimum_experiments: number of experiments to perform
+        before any criterion is considered.
+    :param bool require_all: stop when all criteria are met;
+        otherwise, stop when any of them is met.
+    """
+
+    def __init__(self, criteria=None, minimum_experiments=0, require_all=False):
+        self.criteria = list(criteria) if criteria is not None else []
+        self.minimum_experiments = minimum_experiments
+        self.require_all = require_all
+
+    def check(self, epoch_recorder):
+        r"""
+        Whether to stop learning after the epochs recorded so far.
+
+        :param EpochRecorder epoch_recorder: record of the model's learning.
+        :return str reason: description of the criteria met, or None to continue.
+        """
+
+        if not self.criteria or len(epoch_recorder) - 1 < self.minimum_experiments:
+            return None
+
+        met = [c for c in self.criteria if c(epoch_recorder)]
+        if not met or (self.require_all and len(met) < len(self.criteria)):
+            return None
+        return ", ".join(repr(c) for c in met)
@@ -28,7 +28,14 @@ except:
     from scipy.linalg import expm
 
 from scipy import linalg
+from scipy import sparse
+from scipy.sparse.linalg import expm_multiply
 import qmla.logging
+import qmla.operator_cache
+
+# Hilbert space dimension (7 qubits) from which propagating the probe
+# directly is cheaper than building the full unitary.
+krylov_dimension_threshold = 2 ** 7
 
 
 def log_print(to_print_list, log_file, log_identifier="ExpectationValue"):
@@ -58,6 +65,12 @@ def default_expectation_value(
     :return: probability of measuring the input state after Hamiltonian evolution
     """
 
+    if sparse.issparse(ham):
+        # sparse Hamiltonians are propagated without forming the unitary
+        return krylov_expectation_value(
+            ham=ham, t=t, state=state, log_file=log_file, log_identifier=log_identifier
+        )
+
     probe_bra = state.conj().T
     u = expm(-1j * ham * t)
     # h = hexp.LinalgUnitaryEvolvingMatrix(
@@ -94,6 +107,204 @@ def default_expectation_value(
     return prob_of_measuring_input_state
 
 
+def krylov_expectation_value(
+    ham, t, state, log_file="qmla_log.log", log_identifier="Krylov Expectation Value"
+):
+    r"""
+    Probability calculation | <state.transpose | e^{-iHt} | state> |**2,
+    propagating the probe without constructing e^{-iHt}.
+
+    The action of the unitary on the probe is computed by
+    ``scipy.sparse.linalg.expm_multiply``, on a sparse (CSR) copy of ``ham``,
+    so the d x d unitary is never formed.
+    Preferable to :func:`default_expectation_value` for large systems.
+
+    :param np.array ham: Hamiltonian needed for the time-evolution;
+        dense or scipy sparse
+    :param float t: Evolution time
+    :param np.array state: Initial state to evolve and measure on
+    :param str log_file: (optional) path of the log file
+    :param str log_identifier: (optional) identifier for the log
+
+    :return: probability of measuring the input state after Hamiltonian evolution
+    """
+
+    generator = sparse.csr_matrix(ham) * (-1j * t)
+    u_psi = expm_multiply(generator, state)
+    expectation_value = np.vdot(state, u_psi)  # in general a complex number
+    prob_of_measuring_input_state = np.abs(expectation_value) ** 2
+
+    ex_val_tol = 1e-9
+    if prob_of_measuring_input_state > (
+        1 + ex_val_tol
+    ) or prob_of_measuring_input_state < (0 - ex_val_tol):
+        log_print(
+            [
+                "prob_of_measuring_input_state > 1 or < 0 (={}) at t={}\n Probe={}".format(
+                    prob_of_measuring_input_state, t, repr(state)
+                )
+            ],
+            log_file=log_file,
+            log_identifier=log_identifier,
+        )
+        raise NameError("Unphysical expectation value")
+    return prob_of_measuring_input_state
+
+
+def size_dependent_expectation_value(
+    ham,
+    t,
+    state,
+    dimension_threshold=None,
+    log_file="qmla_log.log",
+    log_identifier="Expecation Value",
+):
+    r"""
+    Probability calculation | <state.transpose | e^{-iHt} | state> |**2,
+    choosing the method by the size of the Hamiltonian.
+
+    Hamiltonians of dimension below ``dimension_threshold`` use
+    :func:`default_expectation_value` (dense exponentiation);
+    larger Hamiltonians use :func:`krylov_expectation_value`.
+    Can be set as the ``expectation_value_subroutine`` of any exploration strategy.
+
+    :param np.array ham: Hamiltonian needed for the time-evolution
+    :param float t: Evolution time
+    :param np.array state: Initial state to evolve and measure on
+    :param int dimension_threshold: dimension at which to switch to Krylov propagation;
+        if None, uses ``krylov_dimension_threshold``.
+    :param str log_file: (optional) path of the log file
+    :param str log_identifier: (optional) identifier for the log
+
+    :return: probability of measuring the input state after Hamiltonian evolution
+    """
+
+    if dimension_threshold is None:
+        dimension_threshold = krylov_dimension_threshold
+
+    if ham.shape[0] >= dimension_threshold:
+        expectation_value_method = krylov_expectation_value
+    else:
+        expectation_value_method = default_expectation_value
+
+    return expectation_value_method(
+        ham=ham,
+        t=t,
+        state=state,
+        log_file=log_file,
+        log_identifier=log_identifier,
+    )
+
+
+def batched_expectation_values(
+    hamiltonians,
+    times,
+    state,
+    log_file="qmla_log.log",
+    log_identifier="Batched expectation values",
+):
+    r"""
+    Vectorised equivalent of :func:`default_expectation_value`
+    for a stack of Hamiltonians and a list of times.
+
+    All Hamiltonians are diagonalised in a single call to ``np.linalg.eigh``,
+    :math:`\hat{H}_p = V_p \Lambda_p V_p^{\dagger}`, so that
+    :math:`\langle \psi | e^{-i \hat{H}_p t} | \psi \rangle
+    = \sum_k |\langle v_{p,k} | \psi \rangle|^2 e^{-i \lambda_{p,k} t}`
+    is computed for every (particle, time) pair by broadcasting,
+    rather than by one matrix exponential per pair.
+    Only valid for Hermitian Hamiltonians.
+
+    :param np.ndarray hamiltonians: stack of Hamiltonians with shape
+        ``(num_hamiltonians, d, d)``
+    :param list times: evolution times
+    :param np.array state: initial state to evolve and measure on, length ``d``
+    :param str log_file: (optional) path of the log file
+    :param str log_identifier: (optional) identifier for the log
+
+    :return np.ndarray probabilities: shape ``(num_hamiltonians, len(times))``,
+        probability of measuring the input state after each evolution
+    """
+
+    eigenvalues, eigenvectors = np.linalg.eigh(hamiltonians)
+    return spectral_expectation_values(
+        eigenvalues=eigenvalues,
+        eigenvectors=eigenvectors,
+        times=times,
+        state=state,
+        log_file=log_file,
+        log_identifier=log_identifier,
+    )
+
+
+def spectral_decomposition(ham):
+    r"""
+    Eigendecomposition of a Hamiltonian, for reuse in computing expectation values
+    at many times through :func:`spectral_expectation_values`.
+
+    :param np.array ham: Hamiltonian (dense or scipy sparse)
+    :return dict spectrum: with keys ``eigenvalues`` and ``eigenvectors``;
+        None if ``ham`` is not Hermitian, in which case the expectation
+        value must be computed by exponentiation.
+    """
+
+    if sparse.issparse(ham):
+        ham = ham.toarray()
+    if not np.allclose(ham, ham.conj().T):
+        return None
+    eigenvalues, eigenvectors = np.linalg.eigh(ham)
+    return {"eigenvalues": eigenvalues, "eigenvectors": eigenvectors}
+
+
+def spectral_expectation_values(
+    eigenvalues,
+    eigenvectors,
+    times,
+    state,
+    log_file="qmla_log.log",
+    log_identifier="Spectral expectation values",
+):
+    r"""
+    Compute | <state.transpose | e^{-iHt} | state> |**2 for a list of times
+    from the eigendecomposition :math:`\hat{H} = V \Lambda V^{\dagger}`.
+
+    Uses :math:`\langle \psi | e^{-i \hat{H} t} | \psi \rangle
+    = \sum_k |\langle v_k | \psi \rangle|^2 e^{-i \lambda_k t}`.
+    Leading dimensions of ``eigenvalues``/``eigenvectors`` are treated
+    as a stack of Hamiltonians.
+
+    :param np.ndarray eigenvalues: shape ``(..., d)``
+    :param np.ndarray eigenvectors: shape ``(..., d, d)``, eigenvectors as columns
+    :param list times: evolution times
+    :param np.array state: initial state to evolve and measure on, length ``d``
+    :param str log_file: (optional) path of the log file
+    :param str log_identifier: (optional) identifier for the log
+
+    :return np.ndarray probabilities: shape ``(..., len(times))``
+    """
+
+    state = np.asarray(state).reshape(-1)
+    # weight of the probe on each eigenvector: |<v_k|psi>|^2
+    overlaps = np.abs(np.einsum("...ij,i->...j", eigenvectors.conj(), state)) ** 2
+    phases = np.exp(-1j * eigenvalues[..., np.newaxis] * np.asarray(times, dtype=float))
+    expectation_values = np.einsum("...k,...kt->...t", overlaps, phases)
+    probabilities = np.abs(expectation_values) ** 2
+
+    ex_val_tol = 1e-9
+    if np.any(probabilities > 1 + ex_val_tol) or np.any(probabilities < -ex_val_tol):
+        log_print(
+            [
+                "Probabilities > 1 or < 0 (range {} - {}) for times {}\n Probe={}".format(
+                    np.min(probabilities), np.max(probabilities), times, repr(state)
+                )
+            ],
+            log_file=log_file,
+            log_identifier=log_identifier,
+        )
+        raise NameError("Unphysical expectation value")
+    return probabilities
+
+
 # Expectation value function using Hahn inversion gate:
 def hahn_evolution(ham, t, state, precision=1e-10, log_file=None, log_identifier=None):
     r"""
@@ -254,6 +465,10 @@ def n_qubit_hahn_evolution(
     r"""
     n qubits time evolution for Hahn-echo measurement returning measurement probability for input state
 
+    The Hamiltonian is diagonalised once, and both evolution segments are applied
+    through :func:`spectral_hahn_evolution`.
+    Non-Hermitian Hamiltonians are exponentiated instead.
+
     :param ham: Hamiltonian needed for the time-evolution
     :type ham: np.array()
     :param t: Evolution time
@@ -270,26 +485,20 @@ def n_qubit_hahn_evolution(
     :output: probability of measuring input state after time t
     """
 
-    import numpy as np
-    import qmla.model_building_utilities
-    from scipy import linalg
+    spectrum = spectral_decomposition(ham)
+    if spectrum is not None:
+        likelihood = spectral_hahn_evolution(
+            eigenvalues=spectrum["eigenvalues"],
+            eigenvectors=spectrum["eigenvectors"],
+            times=[t],
+            state=state,
+            second_time_evolution_factor=second_time_evolution_factor,
+            pi_rotation=pi_rotation,
+        )[0]
+        return likelihood
 
     num_qubits = int(np.log2(np.shape(ham)[0]))
-
-    if pi_rotation == "y":
-        from qmla.shared_functionality.hahn_y_gates import (
-            precomputed_hahn_y_inversion_gates,
-        )
-
-        inversion_gate = precomputed_hahn_y_inversion_gates[num_qubits]
-    elif pi_rotation == "z":
-        from qmla.shared_functionality.hahn_inversion_gates import (
-            precomputed_hahn_z_inversion_gates,
-        )
-
-        inversion_gate = precomputed_hahn_z_inversion_gates[num_qubits]
-
-    # inversion_gate = make_inversion_gate_rotate_y(num_qubits)
+    inversion_gate = hahn_inversion_gate(num_qubits, pi_rotation)
 
     # want to evolve for t, then apply Hahn inversion gate,
     # then again evolution for (S * t)
@@ -299,67 +508,300 @@ def n_qubit_hahn_evolution(
     second_unitary_time_evolution = np.linalg.matrix_power(
         first_unitary_time_evolution, second_time_evolution_factor
     )
-
     total_evolution = np.dot(
         second_unitary_time_evolution,
         np.dot(inversion_gate, first_unitary_time_evolution),
     )
-
     ev_state = np.dot(total_evolution, state)
-    nm = np.linalg.norm(ev_state)
-    if np.abs(1 - nm) > 1e-5:
-        print(
-            "\n\n[n qubit Hahn]\n norm ev state:",
-            nm,
-            "\nt=",
-            t,
-            "\nprobe=",
-            repr(state),
-        )
-        print("\nev state:\n", repr(ev_state))
-        print("\nham:\n", repr(ham))
-        print("\nHam element[0,2]:\n", ham[0][2])
-        print("\ntotal evolution:\n", repr(total_evolution))
-        print("\nfirst unitary:\n", first_unitary_time_evolution)
-        print("\nsecond unitary:\n", second_unitary_time_evolution)
-        print("\ninversion_gate:\n", inversion_gate)
+    return hahn_echo_likelihoods(evolved_states=ev_state, state=state)
 
-    density_matrix = np.kron(ev_state, (ev_state.T).conj())
-    dim_hilbert_space = 2 ** num_qubits
-    density_matrix = np.reshape(density_matrix, [dim_hilbert_space, dim_hilbert_space])
 
-    # qdm = qutip.Qobj(density_matrix, dims=[[2],[2]])
-    # reduced_matrix_qutip = qdm.ptrace(0).full()
+# Pauli matrices about which the Hahn inversion gate rotates the first qubit
+_hahn_pi_rotations = {
+    "y": np.array([[0, -1j], [1j, 0]]),
+    "z": np.array([[1, 0], [0, -1]], dtype=complex),
+}
+
 
-    # below methods give different results for reduced_matrix
-    # reduced_matrix = qdm.ptrace(0).full()
+def hahn_inversion_gate(num_qubits, pi_rotation="y"):
+    r"""
+    Inversion gate applied between the two evolution segments of a Hahn echo.
+
+    The gate is :math:`e^{-i \frac{\pi}{2} \sigma \otimes \mathbb{I}}`
+    for the Pauli matrix :math:`\sigma` on the first qubit;
+    since :math:`(\sigma \otimes \mathbb{I})^2 = \mathbb{I}`,
+    this is :math:`-i \sigma \otimes \mathbb{I}`, built without exponentiation.
+    Gates are held by :attr:`~qmla.operator_cache.shared_operator_cache`,
+    so are built once per process (and shared on disk between processes
+    when the cache is persisted), for any number of qubits.
+
+    :param int num_qubits: number of qubits the gate acts on
+    :param str pi_rotation: axis of the pi rotation on the first qubit, ``"y"`` or ``"z"``
+    :return np.ndarray inversion_gate: unitary of dimension ``2**num_qubits``;
+        read-only, as it is shared between callers.
+    """
+
+    if pi_rotation not in _hahn_pi_rotations:
+        raise ValueError(
+            "pi_rotation must be 'y' or 'z', received {}".format(pi_rotation)
+        )
+    num_qubits = int(num_qubits)
+    return qmla.operator_cache.shared_operator_cache.get(
+        key=("hahn_inversion_gate", pi_rotation, num_qubits),
+        constructor=lambda: np.kron(
+            -1j * _hahn_pi_rotations[pi_rotation], np.eye(2 ** (num_qubits - 1))
+        ),
+    )
 
-    to_trace = list(range(num_qubits - 1))
-    reduced_matrix = partial_trace(density_matrix, to_trace)
 
-    density_mtx_initial_state = np.kron(state, state.conj())
+def spectral_hahn_evolution(
+    eigenvalues,
+    eigenvectors,
+    times,
+    state,
+    second_time_evolution_factor=1,
+    pi_rotation="y",
+):
+    r"""
+    Vectorised equivalent of :func:`n_qubit_hahn_evolution`
+    for a stack of Hamiltonians and a list of times,
+    from the eigendecompositions :math:`\hat{H}_p = V_p \Lambda_p V_p^{\dagger}`.
+
+    Both segments of the echo, :math:`e^{-i \hat{H}_p t}` and
+    :math:`e^{-i \hat{H}_p S t}`, are applied to the state in the eigenbasis,
+    so a single decomposition serves both (and every time),
+    and no unitary is formed.
+    Leading dimensions of ``eigenvalues``/``eigenvectors`` are treated
+    as a stack of Hamiltonians, e.g. one per particle.
+
+    :param np.ndarray eigenvalues: shape ``(..., d)``
+    :param np.ndarray eigenvectors: shape ``(..., d, d)``, eigenvectors as columns
+    :param list times: evolution times
+    :param np.array state: initial state to evolve and measure on, length ``d``
+    :param int second_time_evolution_factor: S, ratio of the second evolution
+        segment to the first
+    :param str pi_rotation: axis of the inversion gate, see :func:`hahn_inversion_gate`
+
+    :return np.ndarray probabilities: shape ``(..., len(times))``
+    """
 
-    density_mtx_initial_state = np.reshape(
-        density_mtx_initial_state, [dim_hilbert_space, dim_hilbert_space]
+    state = np.asarray(state).reshape(-1)
+    times = np.asarray(times, dtype=float)
+    num_qubits = int(np.log2(len(state)))
+    inversion_gate = hahn_inversion_gate(num_qubits, pi_rotation)
+
+    # states are held as rows, shape (..., num_times, d), so are
+    # transformed by right-multiplying with transposed operators
+    eigenvectors_transpose = np.swapaxes(eigenvectors, -1, -2)
+    eigenvalues = eigenvalues[..., np.newaxis, :]
+    times = times[:, np.newaxis]
+
+    # first segment, in the eigenbasis: e^{-i Lambda t} V^dagger |psi>
+    coefficients = np.matmul(state, eigenvectors.conj())[..., np.newaxis, :]
+    evolved_states = np.matmul(
+        np.exp(-1j * eigenvalues * times) * coefficients, eigenvectors_transpose
     )
-    reduced_density_mtx_initial_state = partial_trace(
-        density_mtx_initial_state, to_trace
+    evolved_states = np.matmul(evolved_states, inversion_gate.T)
+
+    # second segment
+    coefficients = np.matmul(evolved_states, eigenvectors.conj())
+    evolved_states = np.matmul(
+        np.exp(-1j * eigenvalues * (second_time_evolution_factor * times))
+        * coefficients,
+        eigenvectors_transpose,
     )
-    projection_onto_initial_den_mtx = np.dot(
-        reduced_density_mtx_initial_state, reduced_matrix
+    return hahn_echo_likelihoods(evolved_states=evolved_states, state=state)
+
+
+def hahn_echo_likelihoods(evolved_states, state):
+    r"""
+    Likelihoods of Hahn echo measurements on the first qubit of the evolved states.
+
+    The overlap of the evolved and initial states' reduced density matrices
+    on the first qubit is the projection onto :math:`|+\rangle`,
+    whereas :math:`\Pr(0)` refers to projection onto :math:`|-\rangle`,
+    so the likelihood is one minus the overlap.
+
+    :param np.ndarray evolved_states: shape ``(..., d)``
+    :param np.array state: initial state, length ``d``
+    :return np.ndarray likelihoods: shape ``evolved_states.shape[:-1]``
+    """
+
+    reduced_states = reduced_first_qubit_density_matrices(evolved_states)
+    expect_value = np.abs(
+        np.einsum("ab,...ba->...", reduced_probe_projector(state), reduced_states)
     )
-    expect_value = np.abs(np.trace(projection_onto_initial_den_mtx))
+    likelihoods = 1 - expect_value
+
+    ex_val_tol = 1e-9
+    if np.any(likelihoods > 1 + ex_val_tol) or np.any(likelihoods < -ex_val_tol):
+        print(
+            "Unphysical expectation value (range {} - {})".format(
+                np.min(likelihoods), np.max(likelihoods)
+            )
+        )
+    return likelihoods
+
+
+def reduced_first_qubit_density_matrices(states):
+    r"""
+    Reduced density matrices of the first qubit of a stack of pure states.
 
-    # expect_value is projection onto |+>
-    # for this case Pr(0) refers to projection onto |->
-    # so return 1 - expect_value
-    likelihood = 1 - expect_value
+    Equivalent to :func:`partial_trace` of :math:`|\psi\rangle\langle\psi|`
+    over every qubit except the first (leftmost in the tensor product),
+    without forming the full density matrix:
+    reshaping :math:`\psi` to :math:`\psi_{ak}`,
+    :math:`\rho_{ab} = \sum_k \psi_{ak} \psi^*_{bk}`.
 
-    if likelihood > 1 or likelihood < 0:
-        print("Unphysical expectation value:", likelihood)
+    :param np.ndarray states: shape ``(..., 2**n)``
+    :return np.ndarray reduced_density_matrices: shape ``(..., 2, 2)``
+    """
+
+    states = np.asarray(states)
+    split_states = states.reshape(states.shape[:-1] + (2, -1))
+    return np.einsum("...ak,...bk->...ab", split_states, split_states.conj())
+
+
+# reduced density matrices of probes, by probe
+_reduced_probe_projectors = {}
+_max_reduced_probe_projectors = 1024
+
+
+def reduced_probe_projector(state):
+    r"""
+    Reduced density matrix of the first qubit of a probe,
+    onto which Hahn echo measurements project.
+
+    Probes are fixed throughout a QMLA instance, so this is computed
+    once for each probe and cached by the probe's contents.
+
+    :param np.array state: probe, of length ``2**n``
+    :return np.ndarray reduced_density_matrix: shape ``(2, 2)``; must not be modified.
+    """
 
-    return likelihood
-    # return expect_value
+    state = np.ascontiguousarray(state, dtype=complex).reshape(-1)
+    key = state.tobytes()
+    try:
+        return _reduced_probe_projectors[key]
+    except KeyError:
+        pass
+
+    projector = reduced_first_qubit_density_matrices(state)
+    projector.flags.writeable = False
+    if len(_reduced_probe_projectors) >= _max_reduced_probe_projectors:
+        _reduced_probe_projectors.clear()
+    _reduced_probe_projectors[key] = projector
+    return projector
+
+
+# Hahn echo subroutines which can be computed for many Hamiltonians at once
+# by spectral_hahn_evolution, with the settings they use
+spectral_hahn_subroutines = {
+    n_qubit_hahn_evolution: {"second_time_evolution_factor": 1, "pi_rotation": "y"},
+    n_qubit_hahn_evolution_double_time_reverse: {
+        "second_time_evolution_factor": 2,
+        "pi_rotation": "y",
+    },
+    hahn_via_z_pi_gate: {"second_time_evolution_factor": 2, "pi_rotation": "z"},
+}
+
+
+# Open systems: Liouvillian evolution of vectorised density matrices
+def liouvillian_evolve_expectation(
+    ham, t, state, log_file="QMDLog.log", log_identifier="Expecation Value", **kwargs
+):
+    r"""
+    Fidelity between a density matrix and its evolution under a Liouvillian.
+
+    The probe ``state`` is a density matrix :math:`\rho(0)`, flattened
+    row by row (see
+    :class:`~qmla.shared_functionality.model_constructors.LiouvillianModel`);
+    :math:`\rho(t)` is found from :math:`e^{\mathcal{L} t} \rho(0)`,
+    and the likelihood is the fidelity :math:`F(\rho(0), \rho(t))`
+    (see :func:`density_matrix_fidelities`).
+
+    :param np.ndarray ham: Liouvillian superoperator :math:`\mathcal{L}`.
+    :param float t: evolution time.
+    :param np.array state: flattened density matrix.
+    :return float fidelity: fidelity of the initial and evolved density matrices.
+    """
+
+    try:
+        unitary = linalg.expm(ham * t)
+        u_psi = np.dot(unitary, state)
+    except:
+        print("Failed to build unitary for ham:\n {}".format(ham))
+        raise
+
+    N = int(np.sqrt(len(state)))
+    rho1 = np.reshape(state, (N, N))
+    rho2 = np.reshape(u_psi, (N, N))
+
+    ex_val_tol = 1e-9
+    for label, rho in [("rho1", rho1), ("rho2", rho2)]:
+        trace = np.real(np.trace(rho))
+        if trace > 1 + ex_val_tol or trace < 0 - ex_val_tol:
+            log_print(
+                ["{} has trace {} for t={}".format(label, trace, t)],
+                log_file=log_file,
+                log_identifier=log_identifier,
+            )
+    return density_matrix_fidelities(rho1, rho2)
+
+
+def liouvillian_evolve_fidelities(liouvillians, times, state):
+    r"""
+    Vectorised equivalent of :func:`liouvillian_evolve_expectation`
+    for a stack of Liouvillians and a list of times.
+
+    Liouvillians are not normal, so each is exponentiated
+    (with ``scipy.linalg.expm``) rather than diagonalised;
+    the fidelities of all the evolved density matrices are then found
+    together by :func:`density_matrix_fidelities`.
+
+    :param np.ndarray liouvillians: shape ``(num_liouvillians, d**2, d**2)``
+    :param list times: evolution times
+    :param np.array state: flattened density matrix, length ``d**2``
+    :return np.ndarray fidelities: shape ``(num_liouvillians, len(times))``
+    """
+
+    state = np.asarray(state).reshape(-1)
+    N = int(np.sqrt(len(state)))
+
+    evolved = np.empty((len(liouvillians), len(times), N, N), dtype=np.complex128)
+    for p, liouvillian in enumerate(liouvillians):
+        for i, t in enumerate(times):
+            evolved[p, i] = np.dot(linalg.expm(liouvillian * t), state).reshape(N, N)
+    return density_matrix_fidelities(rho=state.reshape(N, N), sigmas=evolved)
+
+
+def density_matrix_fidelities(rho, sigmas):
+    r"""
+    Fidelity of a density matrix with each of a stack of density matrices,
+    :math:`F(\rho, \sigma) = \left( \mathrm{Tr} \sqrt{\sqrt{\rho} \sigma \sqrt{\rho}} \right)^2`.
+
+    Rather than computing matrix square roots for every :math:`\sigma`,
+    :math:`\sqrt{\rho}` is found once from the eigendecomposition of :math:`\rho`,
+    and :math:`\mathrm{Tr} \sqrt{M} = \sum_k \sqrt{\mu_k}`
+    from the eigenvalues :math:`\mu_k` of the Hermitian matrices
+    :math:`M = \sqrt{\rho} \sigma \sqrt{\rho}`, computed in one call.
+
+    :param np.ndarray rho: density matrix, shape ``(d, d)``
+    :param np.ndarray sigmas: density matrices, shape ``(..., d, d)``
+    :return np.ndarray fidelities: shape ``(...)``
+    """
+
+    rho = np.asarray(rho)
+    sigmas = np.asarray(sigmas)
+    eigenvalues, eigenvectors = np.linalg.eigh((rho + rho.conj().T) / 2)
+    sqrt_rho = np.dot(
+        eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None)), eigenvectors.conj().T
+    )
+    products = np.matmul(np.matmul(sqrt_rho, sigmas), sqrt_rho)
+    # Hermitian up to numerical error in evolving sigma
+    products = (products + np.swapaxes(products.conj(), -1, -2)) / 2
+    product_eigenvalues = np.linalg.eigvalsh(products)
+    return np.sum(np.sqrt(np.clip(product_eigenvalues, 0, None)), axis=-1) ** 2
 
 
 def partial_trace(mat, trace_systems, dimensions=None, reverse=True):
@@ -4,6 +4,164 @@ import numpy as np
 from bisect import bisect_left
 import random
 
+r"""
+Map times requested by learners to the times at which experimental data exist.
+
+:class:`ExperimentalDataIndex` serves vectorised nearest-time lookups
+from sorted arrays; it is built once per run (alongside the system
+measurements file) and loaded, memory-mapped, by each process.
+"""
+
+__all__ = [
+    "ExperimentalDataIndex",
+    "experimental_data_index_path",
+    "nearest_experimental_time_available",
+    "nearest_experimental_expect_val_available",
+]
+
+
+class ExperimentalDataIndex:
+    r"""
+    Immutable index of experimental measurements by time.
+
+    Times and expectation values are held as sorted (read-only) arrays,
+    so the nearest available time to each of an array of times is found
+    with a single ``np.searchsorted``,
+    rather than bisecting a list and looking up a float-keyed dict per time.
+    Follows the convention of :func:`nearest_experimental_time_available`:
+    where two times are equally close, the smaller is used, and
+    times beyond the last measurement are mapped to a random measured time.
+
+    The index is stored as a single ``.npy`` array (see :meth:`save`),
+    so that every process of a run can load it memory-mapped
+    (see :meth:`load` and :func:`~qmla.worker_cache.get_experimental_data_index`).
+
+    :param np.ndarray times: times of measurements.
+    :param np.ndarray expectation_values: measurement at each time.
+    """
+
+    def __init__(self, times, expectation_values):
+        times = np.asarray(times, dtype=float)
+        expectation_values = np.asarray(expectation_values, dtype=float)
+        if times.shape != expectation_values.shape or times.ndim != 1:
+            raise ValueError(
+                "Times and expectation values must be 1D arrays of equal length; "
+                "received shapes {} and {}".format(
+                    times.shape, expectation_values.shape
+                )
+            )
+        order = np.argsort(times, kind="stable")
+        self._data = np.stack([times[order], expectation_values[order]])
+        self._data.flags.writeable = False
+
+    @classmethod
+    def from_measurements(cls, experimental_measurements):
+        r"""
+        Index of a dict of measurements.
+
+        :param dict experimental_measurements: expectation values by time,
+            e.g. :attr:`~qmla.QuantumModelLearningAgent.experimental_measurements`.
+        """
+
+        times = list(experimental_measurements.keys())
+        return cls(
+            times=times,
+            expectation_values=[experimental_measurements[t] for t in times],
+        )
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        r"""
+        Load an index stored by :meth:`save`.
+
+        :param str path: path to the ``.npy`` file.
+        :param str mmap_mode: passed to ``np.load``; memory-mapped (read-only)
+            by default, so processes share the operating system's copy of the data.
+        """
+
+        index = cls.__new__(cls)
+        index._data = np.load(path, mmap_mode=mmap_mode)
+        if index._data.ndim != 2 or index._data.shape[0] != 2:
+            raise ValueError(
+                "{} is not an experimental data index; array has shape {}".format(
+                    path, index._data.shape
+                )
+            )
+        return index
+
+    def save(self, path):
+        r"""
+        Store the index as a ``.npy`` file at ``path``.
+
+        The file is written under a temporary name and then moved into place,
+        so that processes never load a partially written index.
+        """
+
+        temporary_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(temporary_path, "wb") as f:
+            np.save(f, np.asarray(self._data))
+        os.replace(temporary_path, path)
+
+    @property
+    def times(self):
+        r"""Sorted times of measurements (read-only array)."""
+        return self._data[0]
+
+    @property
+    def expectation_values(self):
+        r"""Measurements, in the order of :attr:`times` (read-only array)."""
+        return self._data[1]
+
+    def __len__(self):
+        return self._data.shape[1]
+
+    def nearest_indices(self, times):
+        r"""
+        Positions in :attr:`times` of the nearest measurement to each of ``times``.
+
+        :param np.ndarray times: times to look up, of any shape.
+        :return np.ndarray indices: integer array of the same shape as ``times``.
+        """
+
+        times = np.asarray(times, dtype=float)
+        available_times = self.times
+        num_times = len(available_times)
+
+        after = np.searchsorted(available_times, times, side="left")
+        before = np.clip(after - 1, 0, num_times - 1)
+        after = np.clip(after, 0, num_times - 1)
+        use_after = available_times[after] - times < times - available_times[before]
+        indices = np.where(use_after, after, before)
+
+        beyond = times > available_times[-1]
+        if np.any(beyond):
+            indices = np.where(
+                beyond, np.random.randint(num_times, size=indices.shape), indices
+            )
+        return indices
+
+    def nearest_times(self, times):
+        r"""Nearest time at which a measurement is available, for each of ``times``."""
+
+        return self.times[self.nearest_indices(times)]
+
+    def nearest_expectation_values(self, times):
+        r"""Measurement at the nearest available time, for each of ``times``."""
+
+        return self.expectation_values[self.nearest_indices(times)]
+
+
+def experimental_data_index_path(system_measurements_file):
+    r"""
+    Path at which the :class:`ExperimentalDataIndex` of a run's measurements is stored.
+
+    :param str system_measurements_file: path to the run's pickled system
+        measurements, e.g. ``ControlsQMLA.system_measurements_file``.
+    :return str path: path to the index's ``.npy`` file, in the same directory.
+    """
+
+    return "{}_index.npy".format(os.path.splitext(system_measurements_file)[0])
+
 
 def nearest_experimental_time_available(times, t):
     """
@@ -13,7 +171,7 @@ def nearest_experimental_time_available(times, t):
 
     If two times are equally close, return the smallest.
     """
-    if t > max(times):
+    if t > times[-1]:
         nearest = random.choice(times)
 
     else:
@@ -39,7 +197,7 @@ def nearest_experimental_expect_val_available(times, experimental_data, t):
 
     If two times are equally close, return the smallest.
     """
-    if t > max(times):
+    if t > times[-1]:
         nearest = random.choice(times)
 
     else:
@@ -276,18 +276,11 @@ def n_qubit_hahn_evolution(
 
     num_qubits = int(np.log2(np.shape(ham)[0]))
 
-    if pi_rotation == "y":
-        from qmla.shared_functionality.hahn_y_gates import (
-            precomputed_hahn_y_inversion_gates,
-        )
-
-        inversion_gate = precomputed_hahn_y_inversion_gates[num_qubits]
-    elif pi_rotation == "z":
-        from qmla.shared_functionality.hahn_inversion_gates import (
-            precomputed_hahn_z_inversion_gates,
-        )
+    from qmla.shared_functionality.expectation_value_functions import (
+        hahn_inversion_gate,
+    )
 
-        inversion_gate = precomputed_hahn_z_inversion_gates[num_qubits]
+    inversion_gate = hahn_inversion_gate(num_qubits, pi_rotation)
 
     # inversion_gate = make_inversion_gate_rotate_y(num_qubits)
 
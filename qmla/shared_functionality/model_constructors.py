@@ -4,6 +4,7 @@ import numpy as np
 import copy
 import pandas as pd
 import sys
+from scipy import sparse
 
 from qmla.model_building_utilities import (
     core_operator_dict,
@@ -14,6 +15,7 @@ from qmla.model_building_utilities import (
     compute,
 )
 from qmla.shared_functionality import latex_model_names
+from qmla.operator_cache import shared_operator_cache
 from qmla.process_string_to_matrix import process_basic_operator
 from qmla.string_processing_functions import (
     process_multipauli_term,
@@ -49,13 +51,21 @@ class BaseModel:
         -- uniquely identifies equivalent operators for comparison
                 against previously considered models
 
+    If sparse_representation, terms_matrices and the output of construct_matrix
+    are scipy sparse (CSR) matrices, so memory and construction cost scale
+    with the number of nonzero elements rather than 4^N.
+
     :param str name: name of model
+    :param bool sparse_representation: whether to construct terms as sparse matrices
 
     """
 
-    def __init__(self, name, fixed_parameters=None, **kwargs):
+    def __init__(
+        self, name, fixed_parameters=None, sparse_representation=False, **kwargs
+    ):
         self.name = alph(name)
         self.fixed_parameters = fixed_parameters
+        self.sparse_representation = sparse_representation
         print("BASE MODEL fixed_parameters : ", fixed_parameters)
 
         # Modular functionality
@@ -92,9 +102,24 @@ class BaseModel:
     def terms_matrices(self):
         """
         List of matrices of constituents.
+        Retrieved from the process-wide :attr:`~qmla.operator_cache.shared_operator_cache`,
+        which constructs them only on the first request.
         """
+        processer = "{}.{}".format(
+            self.basic_string_processer.__module__,
+            self.basic_string_processer.__qualname__,
+        )
+        if self.sparse_representation:
+            construct_operator = self.model_specific_sparse_operator
+        else:
+            construct_operator = self.model_specific_basic_operator
+
         operators = [
-            self.model_specific_basic_operator(term) for term in self.terms_names
+            shared_operator_cache.get(
+                key=(processer, term, self.sparse_representation),
+                constructor=lambda term=term: construct_operator(term),
+            )
+            for term in self.terms_names
         ]
         return operators
 
@@ -118,9 +143,9 @@ class BaseModel:
         mtx = None
         for i in self.terms_matrices:
             if mtx is None:
-                mtx = i
+                mtx = copy.copy(i)
             else:
-                mtx += i
+                mtx = mtx + i
         return mtx
 
     @property
@@ -159,9 +184,37 @@ class BaseModel:
         Default:
             sum(p[i] * operators[i])
         """
+        if self.sparse_representation:
+            terms = self.terms_matrices
+            mtx = parameters[0] * terms[0]
+            for p, term in zip(parameters[1:], terms[1:]):
+                mtx = mtx + p * term
+            return mtx.tocsr()
+
         mtx = np.tensordot(np.array(parameters), np.array(self.terms_matrices), axes=1)
         return mtx
 
+    def construct_matrices(self, particles):
+        r"""
+        Matrices for a set of parameter lists (e.g. QInfer particles),
+        stacked with shape ``(num_particles, d, d)``.
+
+        Used by the batched likelihood engine of
+        :class:`~qmla.shared_functionality.qinfer_model_interface.QInferModelQMLA`.
+        Default: sum(p[i] * operators[i]) for every particle in one call,
+        unless ``construct_matrix`` is customised,
+        in which case it is called for each particle.
+        """
+
+        if (
+            type(self).construct_matrix is BaseModel.construct_matrix
+            and not self.sparse_representation
+        ):
+            return np.tensordot(
+                np.array(particles), np.array(self.terms_matrices), axes=1
+            )
+        return np.array([self.construct_matrix(p) for p in particles])
+
     def model_specific_basic_operator(self, term):
         # process a basic term in the formalism of this model
         # this can use a prebuilt fnc, or build one from scratch without relying on compute() etc.
@@ -169,6 +222,18 @@ class BaseModel:
 
         return self.basic_string_processer(term)
 
+    def model_specific_sparse_operator(self, term):
+        # sparse (CSR) equivalent of model_specific_basic_operator.
+        # pauli string processers construct sparse matrices natively,
+        # others are built densely then converted.
+
+        if self.basic_string_processer in (
+            process_multipauli_term,
+            process_likewise_pauli_sum,
+        ):
+            return self.basic_string_processer(term, sparse_representation=True)
+        return sparse.csr_matrix(self.model_specific_basic_operator(term))
+
     @property
     def model_prior(self):
         # TODO move prior definition here and all calls to get_prior go via exploration_strategy
@@ -177,6 +242,21 @@ class BaseModel:
         return
 
 
+class SparseModel(BaseModel):
+    r"""
+    BaseModel whose terms and Hamiltonians are sparse (CSR) matrices.
+
+    Intended for large (6-8 qubit) models; use with an expectation value
+    function which accepts sparse Hamiltonians, e.g.
+    :func:`~qmla.shared_functionality.expectation_value_functions.default_expectation_value`
+    or :func:`~qmla.shared_functionality.expectation_value_functions.krylov_expectation_value`.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["sparse_representation"] = True
+        super().__init__(**kwargs)
+
+
 class PauliLikewiseModel(BaseModel):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -311,113 +391,216 @@ class LiouvillianModel(BaseModel):
             op = op + mini_op
         return op
 
+    def liouvillian_term_operators(self, term):
+        r"""
+        Hilbert space operators of a single term of a Liouvillian model name.
+
+        A ``HamLiouvillian`` term gives a single Hamiltonian operator;
+        a ``DissLiouvillian`` term gives one operator for each ``~``-separated
+        component of its jump operator, each of which takes its own parameter.
+
+        :param str term: single (``+``-separated) term of a Liouvillian name.
+        :return list operators: unweighted Hilbert space operators of the term.
+        """
+
+        if term.split("_")[0] == "DissLiouvillian":
+            # Dissipator Handeling
+            size = int(term.split("_")[-1][1:])
+            i = term.split("_")[1:-1]
+            i = ("_".join(i)).split("_~_")
+            operators = []
+            for j in i:
+                matrix_type = j.split("_")[1]
+                if matrix_type[0] == "l":
+                    matrix_type = matrix_type[1:]
+
+                position = j.split("_")[2:]
+                empty = [["i"] * size for x in range(len(position))]
+
+                for num, x in enumerate(position):
+                    if "J" in matrix_type:
+                        if "J" not in x:
+                            sys.exit(
+                                "Matrix pointer is the tensor product over two sites but only one site is referenced."
+                            )
+                        empty[num][int(x.split("J")[0]) - 1] = matrix_type[0]
+                        empty[num][int(x.split("J")[1]) - 1] = matrix_type[-1]
+                    elif "J" in x:
+                        empty[num][int(x.split("J")[0]) - 1] = matrix_type
+                        empty[num][int(x.split("J")[1]) - 1] = matrix_type
+                    else:
+                        empty[num][int(x) - 1] = matrix_type
+
+                operators.append(self.list_to_mtx(empty))
+            return operators
+
+        elif term.split("_")[0] == "HamLiouvillian":
+            pointer_list = []
+
+            i = term.split("_")[1:]
+            size = int(i[-1][1:])
+            matrix_type = i[0]
+            position = i[1:-1]
+            # bulk out pointer_list
+
+            for x in range(len(position)):
+                pointer_list.append([])
+                for y in range(size):
+                    pointer_list[x].append("i")
+
+            for num, x in enumerate(position):
+                if "J" in matrix_type:
+                    if "J" not in x:
+                        sys.exit(
+                            "Matrix pointer is the tensor product over two sites but only one site is referenced."
+                        )
+                    pointer_list[num][int(x.split("J")[0]) - 1] = matrix_type[0]
+                    pointer_list[num][int(x.split("J")[1]) - 1] = matrix_type[-1]
+                elif "J" in x:
+                    pointer_list[num][int(x.split("J")[0]) - 1] = matrix_type[-1]
+                    pointer_list[num][int(x.split("J")[1]) - 1] = matrix_type[-1]
+                else:
+                    pointer_list[num][int(x) - 1] = matrix_type[-1]
+            return [self.list_to_mtx(pointer_list)]
+        else:
+            sys.exit("Liouvillian term not recognised" + str(term.split("_")[0]))
+
+    def dissipator_cross_to_liouvillian(self, mtx_a, mtx_b):
+        r"""
+        Superoperator of :math:`\rho \rightarrow A \rho B^{\dagger} - \frac{1}{2} \{ B^{\dagger} A, \rho \}`.
+
+        A dissipator with jump operator :math:`L = \sum_j p_j A_j`
+        is :math:`\sum_{j,k} p_j p_k` times these superoperators, for each pair
+        :math:`(A_j, A_k)`; when :math:`A = B` this is :meth:`lindblad_to_liouvillian`.
+        """
+        identity = np.eye(mtx_a.shape[0])
+        product = np.dot(mtx_b.conj().T, mtx_a)
+        return (
+            np.kron(mtx_a, mtx_b.conj())
+            - 0.5 * np.kron(product, identity)
+            - 0.5 * np.kron(identity, product.T)
+        )
+
+    def superoperator_basis(self, string=None):
+        r"""
+        Superoperators of which Liouvillians of this model are linear combinations.
+
+        Hamiltonian terms are linear in their parameter, while a dissipator
+        is quadratic in the parameters of its jump operator, so the Liouvillian
+        for parameters :math:`\vec{p}` is :math:`\sum_b m_b(\vec{p}) S_b`,
+        where each monomial :math:`m_b` is :math:`p_j` or :math:`p_j p_k`.
+        The superoperators are built once per model name, and held in the
+        process-wide :attr:`~qmla.operator_cache.shared_operator_cache`,
+        so constructing a Liouvillian for each particle is a single
+        linear combination (see :meth:`construct_matrix` and :meth:`construct_matrices`).
+
+        :param str string: Liouvillian name; default is this model's name.
+        :return tuple basis: ``(monomials, superoperators)``;
+            ``monomials`` has shape ``(num_basis, 2)`` and holds the indices
+            of the parameters whose product weights each superoperator,
+            with -1 in place of the second index for linear terms;
+            ``superoperators`` has shape ``(num_basis, 4**n, 4**n)``.
+        """
+
+        if string is None:
+            string = self.name
+
+        monomials = []
+        parameter_index = 0
+        for term in string.split("+"):
+            num_term_parameters = self.liouvillian_parameters(string=term)
+            if term.split("_")[0] == "HamLiouvillian":
+                monomials.append((parameter_index, -1))
+            else:
+                for j in range(num_term_parameters):
+                    for k in range(j, num_term_parameters):
+                        monomials.append((parameter_index + j, parameter_index + k))
+            parameter_index += num_term_parameters
+
+        superoperators = shared_operator_cache.get(
+            key=("liouvillian_superoperator_basis", string),
+            constructor=lambda: self._construct_superoperator_basis(string),
+        )
+        return np.array(monomials), superoperators
+
+    def _construct_superoperator_basis(self, string):
+        superoperators = []
+        for term in string.split("+"):
+            operators = self.liouvillian_term_operators(term)
+            if term.split("_")[0] == "HamLiouvillian":
+                superoperators.append(self.hamiltonian_to_liouvillian(operators[0]))
+                continue
+            for j in range(len(operators)):
+                superoperators.append(self.lindblad_to_liouvillian(operators[j]))
+                for k in range(j + 1, len(operators)):
+                    superoperators.append(
+                        self.dissipator_cross_to_liouvillian(operators[j], operators[k])
+                        + self.dissipator_cross_to_liouvillian(
+                            operators[k], operators[j]
+                        )
+                    )
+        return np.array(superoperators, dtype=np.complex128)
+
+    @staticmethod
+    def monomial_values(parameters, monomials):
+        r"""
+        Weights of the superoperator basis for parameter vector(s) ``parameters``,
+        of shape ``(..., num_parameters)``.
+        """
+
+        parameters = np.asarray(parameters)
+        # trailing 1 is the second factor of linear (Hamiltonian) monomials
+        parameters = np.concatenate(
+            [parameters, np.ones(parameters.shape[:-1] + (1,))], axis=-1
+        )
+        return parameters[..., monomials[:, 0]] * parameters[..., monomials[:, 1]]
+
     def construct_matrix(self, parameters, string=None):
         """
         Given a string of a Liouvillian system and a list of parameters this function will return
         the full matrix, provided the parameters are ordered alphabetically.
-        """
-
-        param_list = parameters
 
-        if type(param_list) == type(np.array([0])):
-            param_list = param_list.tolist()
+        Computed as a combination of the precomputed :meth:`superoperator_basis`.
+        """
 
         if string == None:
             string = self.name
 
-        if "Liouvillian" in string:
-            # Liouvillian Handeling
-            string_terms = string.split("+")
-            qubits = float(string_terms[0].split("_")[-1][1:])
-            output_mtx = np.zeros(
-                (int(4 ** qubits), int(4 ** qubits)), dtype=np.complex128
-            )
-            for i in string_terms:
-                if i.split("_")[0] == "DissLiouvillian":
-                    # Dissipator Handeling
-                    size = int(i.split("_")[-1][1:])
-                    op = np.zeros(
-                        (int(2 ** qubits), int(2 ** qubits)), dtype=np.complex128
-                    )
-                    i = i.split("_")[1:-1]
-                    i = ("_".join(i)).split("_~_")
-                    for j in i:
-                        matrix_type = j.split("_")[1]
-                        if matrix_type[0] == "l":
-                            matrix_type = matrix_type[1:]
-
-                        position = j.split("_")[2:]
-                        empty = [["i"] * size for x in range(len(position))]
-
-                        for num, x in enumerate(position):
-                            if "J" in matrix_type:
-                                if "J" not in x:
-                                    sys.exit(
-                                        "Matrix pointer is the tensor product over two sites but only one site is referenced."
-                                    )
-                                empty[num][int(x.split("J")[0]) - 1] = matrix_type[0]
-                                empty[num][int(x.split("J")[1]) - 1] = matrix_type[-1]
-                            elif "J" in x:
-                                empty[num][int(x.split("J")[0]) - 1] = matrix_type
-                                empty[num][int(x.split("J")[1]) - 1] = matrix_type
-                            else:
-                                empty[num][int(x) - 1] = matrix_type
-
-                        op = op + self.list_to_mtx(empty) * param_list.pop(0)
-
-                    # i is the collection of matrix decleration withint he dissipation term. params_in_use should be
-                    # the parmeters that correspond to those matrix declerations and param_list should be preserved.
-
-                    output_mtx += self.lindblad_to_liouvillian(op)
-
-                elif i.split("_")[0] == "HamLiouvillian":
-                    pointer_list = []
-
-                    i = i.split("_")[1:]
-                    size = int(i[-1][1:])
-                    matrix_type = i[0]
-                    position = i[1:-1]
-                    # bulk out pointer_list
-
-                    for x in range(len(position)):
-                        pointer_list.append([])
-                        for y in range(size):
-                            pointer_list[x].append("i")
-
-                    for num, x in enumerate(position):
-                        if "J" in matrix_type:
-                            if "J" not in x:
-                                sys.exit(
-                                    "Matrix pointer is the tensor product over two sites but only one site is referenced."
-                                )
-                            pointer_list[num][int(x.split("J")[0]) - 1] = matrix_type[0]
-                            pointer_list[num][int(x.split("J")[1]) - 1] = matrix_type[
-                                -1
-                            ]
-                        elif "J" in x:
-                            pointer_list[num][int(x.split("J")[0]) - 1] = matrix_type[
-                                -1
-                            ]
-                            pointer_list[num][int(x.split("J")[1]) - 1] = matrix_type[
-                                -1
-                            ]
-                        else:
-                            pointer_list[num][int(x) - 1] = matrix_type[-1]
-                    op = self.list_to_mtx(pointer_list) * param_list.pop(0)
-                    output_mtx += self.hamiltonian_to_liouvillian(op)
-                else:
-                    sys.exit("Liouvillian term not recognised" + str(i.split("_")[0]))
-        else:
+        if "Liouvillian" not in string:
             # Non Hamiltonian Modeling
-            output_mtx = compute(string)
-        string_terms = string.split("+")
+            if len(parameters) != 0:
+                sys.exit(
+                    "The number of parameters exceeds the number of parameters expected from the terms"
+                )
+            return compute(string)
 
-        if param_list != []:
+        if len(parameters) != self.liouvillian_parameters(string=string):
             sys.exit(
-                "The number of parameters exceeds the number of parameters expected from the terms"
+                "The number of parameters does not match the number of parameters expected from the terms"
             )
+        monomials, superoperators = self.superoperator_basis(string=string)
+        return np.tensordot(
+            self.monomial_values(parameters, monomials), superoperators, axes=1
+        )
+
+    def construct_matrices(self, particles):
+        r"""
+        Liouvillians for a set of particles, as one linear combination of the
+        :meth:`superoperator_basis`.
+
+        :param np.ndarray particles: shape ``(num_particles, num_parameters)``
+        :return np.ndarray liouvillians: shape ``(num_particles, 4**n, 4**n)``
+        """
 
-        return output_mtx
+        particles = np.asarray(particles)
+        if particles.shape[-1] != self.liouvillian_parameters():
+            sys.exit(
+                "The number of parameters does not match the number of parameters expected from the terms"
+            )
+        monomials, superoperators = self.superoperator_basis()
+        return np.tensordot(
+            self.monomial_values(particles, monomials), superoperators, axes=1
+        )
 
     @property
     def num_qubits(self):
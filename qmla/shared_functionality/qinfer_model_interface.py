@@ -4,8 +4,10 @@ import numpy as np
 import sys
 import warnings
 import copy
+import hashlib
 
 import scipy as sp
+from scipy import sparse
 import qinfer as qi
 import time
 
@@ -13,8 +15,11 @@ import qmla.shared_functionality.experimental_data_processing
 import qmla.get_exploration_strategy
 import qmla.memory_tests
 import qmla.shared_functionality.probe_set_generation
+import qmla.shared_functionality.expectation_value_functions
+import qmla.shared_functionality.model_constructors
 import qmla.model_building_utilities
 import qmla.logging
+import qmla.tracing
 
 global_print_loc = False
 global debug_print
@@ -24,6 +29,217 @@ debug_mode = True
 global debug_print_file_line
 debug_print_file_line = False
 
+# Eigendecompositions of true Hamiltonians, shared by all QInfer models
+# (learning and comparison) of each QMLA instance within this process.
+_true_system_spectra = {}
+
+
+def true_system_spectrum(qmla_id, true_hamiltonian, precomputed_spectrum=None):
+    r"""
+    Retrieve the eigendecomposition of the true Hamiltonian,
+    computing it only on the first request for this QMLA instance.
+
+    :param int qmla_id: ID of the QMLA instance
+    :param np.ndarray true_hamiltonian: Hamiltonian of the true system
+    :param dict precomputed_spectrum: spectrum already computed by this function
+        within the QMLA instance, e.g. passed to remote workers through the QMLA settings.
+        Only used if it was computed from the same Hamiltonian.
+    :return dict spectrum: eigenvalues and eigenvectors of true_hamiltonian,
+        or None if it can not be diagonalised as a Hermitian matrix.
+    """
+    if sparse.issparse(true_hamiltonian):
+        true_hamiltonian = true_hamiltonian.toarray()
+    hamiltonian_hash = hashlib.sha1(
+        np.ascontiguousarray(true_hamiltonian).tobytes()
+    ).hexdigest()
+    key = (qmla_id, hamiltonian_hash)
+
+    if key not in _true_system_spectra:
+        if (
+            precomputed_spectrum is not None
+            and precomputed_spectrum["hamiltonian_hash"] == hamiltonian_hash
+        ):
+            spectrum = precomputed_spectrum
+        else:
+            spectrum = qmla.shared_functionality.expectation_value_functions.spectral_decomposition(
+                true_hamiltonian
+            )
+            if spectrum is not None:
+                spectrum["hamiltonian_hash"] = hamiltonian_hash
+        _true_system_spectra[key] = spectrum
+    return _true_system_spectra[key]
+
+
+class ParticleSpectrumCache:
+    r"""
+    Eigendecompositions of the Hamiltonians of the current set of particles.
+
+    Between resampling events, the particles held by the QInfer updater
+    do not move (only their weights change), so the decomposition
+    :math:`\hat{H}_p = V_p \Lambda_p V_p^{\dagger}` of each particle's Hamiltonian
+    can be reused for every experiment, leaving only the phases
+    :math:`e^{-i \lambda_{p,k} t}` and the probe's overlaps to compute per experiment.
+    Only the decomposition for a single set of particles is held,
+    so memory is bounded by :math:`N_p (d^2 + d)` complex numbers;
+    the cache is emptied by :meth:`invalidate` when the updater resamples.
+    Requests for any other particles (compared exactly) are recomputed,
+    so the cache never serves a stale decomposition.
+
+    :param int max_bytes: largest decomposition to hold; larger decompositions
+        are computed but not stored. If 0, nothing is stored.
+    """
+
+    def __init__(self, max_bytes=2 ** 30):
+        self.max_bytes = max_bytes
+        self._particles = None
+        self._eigenvalues = None
+        self._eigenvectors = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.peak_bytes = 0
+
+    def get(self, particles, hamiltonians_constructor, batch_size=None):
+        r"""
+        Eigendecomposition of the Hamiltonians of ``particles``.
+
+        :param np.ndarray particles: particles, of shape ``(num_particles, num_params)``
+        :param callable hamiltonians_constructor: function of the particles which
+            returns their Hamiltonians, of shape ``(num_particles, d, d)``;
+            called on cache misses.
+        :param int batch_size: largest number of particles whose Hamiltonians
+            are constructed and diagonalised together; all at once if None.
+        :return tuple spectrum: ``(eigenvalues, eigenvectors)``,
+            of shapes ``(num_particles, d)`` and ``(num_particles, d, d)``.
+        """
+
+        if self._particles is not None and np.array_equal(particles, self._particles):
+            self.hits += 1
+            return self._eigenvalues, self._eigenvectors
+
+        self.misses += 1
+        if batch_size is None or len(particles) <= batch_size:
+            eigenvalues, eigenvectors = np.linalg.eigh(
+                hamiltonians_constructor(particles)
+            )
+        else:
+            eigenvalues, eigenvectors = None, None
+            for start in range(0, len(particles), batch_size):
+                batch = slice(start, start + batch_size)
+                values, vectors = np.linalg.eigh(
+                    hamiltonians_constructor(particles[batch])
+                )
+                if eigenvalues is None:
+                    eigenvalues = np.empty(
+                        (len(particles),) + values.shape[1:], dtype=values.dtype
+                    )
+                    eigenvectors = np.empty(
+                        (len(particles),) + vectors.shape[1:], dtype=vectors.dtype
+                    )
+                eigenvalues[batch] = values
+                eigenvectors[batch] = vectors
+        self.invalidate(count=False)
+        if eigenvalues.nbytes + eigenvectors.nbytes <= self.max_bytes:
+            self._particles = np.array(particles)
+            self._eigenvalues = eigenvalues
+            self._eigenvectors = eigenvectors
+            self.peak_bytes = max(self.peak_bytes, self.num_bytes)
+        return eigenvalues, eigenvectors
+
+    def invalidate(self, count=True):
+        r"""Discard the stored decomposition, e.g. after the particles are resampled."""
+        if count and self._particles is not None:
+            self.invalidations += 1
+        self._particles = None
+        self._eigenvalues = None
+        self._eigenvectors = None
+
+    @property
+    def num_bytes(self):
+        r"""Memory currently held by the stored decomposition."""
+        if self._particles is None:
+            return 0
+        return (
+            self._particles.nbytes + self._eigenvalues.nbytes + self._eigenvectors.nbytes
+        )
+
+    @property
+    def hit_rate(self):
+        r"""Fraction of requests served without diagonalising."""
+        num_requests = self.hits + self.misses
+        if num_requests == 0:
+            return 0
+        return self.hits / num_requests
+
+    def info(self):
+        r"""Summary of cache usage, e.g. for logging."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "invalidations": self.invalidations,
+            "num_bytes": self.num_bytes,
+            "peak_bytes": self.peak_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+class ProbabilitySketch:
+    r"""
+    Streaming summary of a stream of probabilities, e.g. the likelihoods of particles.
+
+    Values are counted in ``num_bins`` equal bins on :math:`[0, 1]`,
+    so memory is fixed however many values are added, adding values costs
+    a single pass over them (no sorting), and quantiles, the mean and the
+    standard deviation are available to within ``1 / num_bins``.
+
+    :param int num_bins: resolution of the summary.
+    """
+
+    def __init__(self, num_bins=1024):
+        self.num_bins = num_bins
+        self.counts = np.zeros(num_bins, dtype=np.int64)
+
+    def update(self, values):
+        r"""Add values (of any shape) to the sketch; values outside :math:`[0, 1]` are counted in the end bins."""
+        bins = (np.ravel(values) * self.num_bins).astype(np.int64)
+        np.minimum(np.maximum(bins, 0, out=bins), self.num_bins - 1, out=bins)
+        self.counts += np.bincount(bins, minlength=self.num_bins)
+
+    @property
+    def count(self):
+        return int(self.counts.sum())
+
+    def quantile(self, q):
+        r"""Approximate ``q``-th quantile (``0 <= q <= 1``) of the values added; ``nan`` if empty."""
+        cumulative_counts = np.cumsum(self.counts)
+        count = cumulative_counts[-1]
+        if count == 0:
+            return np.nan
+        bin_idx = min(np.searchsorted(cumulative_counts, q * count), self.num_bins - 1)
+        # interpolate within the bin
+        preceding_count = cumulative_counts[bin_idx] - self.counts[bin_idx]
+        fraction = (q * count - preceding_count) / max(self.counts[bin_idx], 1)
+        return (bin_idx + np.clip(fraction, 0, 1)) / self.num_bins
+
+    def info(self):
+        r"""Summary of the values added, with the mean and standard deviation of the bins' centres."""
+        count = self.count
+        if count == 0:
+            mean = std = np.nan
+        else:
+            bin_centres = (np.arange(self.num_bins) + 0.5) / self.num_bins
+            mean = np.dot(self.counts, bin_centres) / count
+            std = np.sqrt(np.dot(self.counts, (bin_centres - mean) ** 2) / count)
+        return {
+            "count": count,
+            "mean": mean,
+            "std": std,
+            "median": self.quantile(0.5),
+            "lower_quartile": self.quantile(0.25),
+            "upper_quartile": self.quantile(0.75),
+        }
+
 
 class QInferModelQMLA(qi.FiniteOutcomeModel):
     r"""
@@ -66,9 +282,31 @@ class QInferModelQMLA(qi.FiniteOutcomeModel):
     :param dict experimental_measurements: fixed measurements of the target system,
         indexed by time.
     :param list experimental_measurement_times: times indexed in experimental_measurements.
+    :param ExperimentalDataIndex experimental_data_index: index of experimental_measurements
+        for nearest-time lookups (see
+        :class:`~qmla.shared_functionality.experimental_data_processing.ExperimentalDataIndex`),
+        shared by all models of the QMLA instance;
+        built from experimental_measurements if not given.
     :param str log_file: Path of log file.
+    :param dict true_hamiltonian_spectrum: eigendecomposition of the true Hamiltonian,
+        if already computed by the QMLA instance.
+    :param str likelihood_instrumentation: what :meth:`likelihood` records besides
+        computing likelihoods, one of ``likelihood_instrumentation_levels``:
+
+        * ``"off"``: nothing;
+        * ``"summary"``: timings, and streaming summaries (:class:`ProbabilitySketch`)
+          of the system's and particles' likelihoods, and their differences,
+          over all calls (see :meth:`likelihood_summary`);
+        * ``"full"``: additionally, the system's likelihoods and statistics
+          of the particles' likelihoods at every call, as used by
+          model evaluation and plots.
+
+        Defaults to the exploration strategy's ``likelihood_instrumentation``;
+        evaluation models always use ``"full"``.
     """
 
+    likelihood_instrumentation_levels = ("off", "summary", "full")
+
     ## INITIALIZER ##
 
     def __init__(
@@ -86,6 +324,9 @@ class QInferModelQMLA(qi.FiniteOutcomeModel):
         qmla_id=-1,
         evaluation_model=False,
         debug_mode=False,
+        true_hamiltonian_spectrum=None,
+        experimental_data_index=None,
+        likelihood_instrumentation=None,
         **kwargs
     ):
 
@@ -132,10 +373,52 @@ class QInferModelQMLA(qi.FiniteOutcomeModel):
         # How to use this model interface
         self.iqle_mode = self.exploration_class.iqle_mode
         self.evaluation_model = evaluation_model
+        # batched likelihoods are only equivalent to the default expectation value
+        # and the Hahn echo subroutines, and would densify sparse models
+        expectation_value_subroutine = (
+            self.exploration_class.expectation_value_subroutine
+        )
+        self.spectral_hahn_settings = qmla.shared_functionality.expectation_value_functions.spectral_hahn_subroutines.get(
+            expectation_value_subroutine
+        )
+        self.liouvillian_evolution = (
+            expectation_value_subroutine
+            is qmla.shared_functionality.expectation_value_functions.liouvillian_evolve_expectation
+        )
+        self.batched_likelihood_engine = (
+            self.exploration_class.batched_likelihood_engine
+            and (
+                expectation_value_subroutine
+                is qmla.shared_functionality.expectation_value_functions.default_expectation_value
+                or self.spectral_hahn_settings is not None
+                or self.liouvillian_evolution
+            )
+            and not self.model_constructor.sparse_representation
+            and (self.liouvillian_evolution or self._model_terms_hermitian())
+        )
+        # system pr0 from a single diagonalisation of the true Hamiltonian,
+        # valid for the default expectation value when the Hamiltonian is fixed
+        self.true_system_spectrum = None
+        if (
+            self.exploration_class.expectation_value_subroutine
+            is qmla.shared_functionality.expectation_value_functions.default_expectation_value
+            and not self.iqle_mode
+            and self.true_hamiltonian is not None
+        ):
+            self.true_system_spectrum = true_system_spectrum(
+                qmla_id=self.qmla_id,
+                true_hamiltonian=self.true_hamiltonian,
+                precomputed_spectrum=true_hamiltonian_spectrum,
+            )
 
         # TODO get experimental_measurements from exploration_class
         self.experimental_measurements = experimental_measurements
         self.experimental_measurement_times = experimental_measurement_times
+        if experimental_data_index is None and experimental_measurements:
+            experimental_data_index = qmla.shared_functionality.experimental_data_processing.ExperimentalDataIndex.from_measurements(
+                experimental_measurements
+            )
+        self.experimental_data_index = experimental_data_index
 
         try:
             self.probes_system = probes_system
@@ -172,11 +455,42 @@ class QInferModelQMLA(qi.FiniteOutcomeModel):
                 "storing_output": 0,
                 "likelihood_array": 0,
                 "likelihood": 0,
+                "batched_pr0": 0,
+                "looped_pr0": 0,
+                "replay_pr0": 0,
+                "particle_spectra": 0,
             }
         self.calls_to_likelihood = 0
+        self._replay = None
+        self.particle_spectra = ParticleSpectrumCache(
+            max_bytes=self.exploration_class.particle_spectrum_cache_max_bytes
+        )
+        self.batched_likelihood_max_bytes = (
+            self.exploration_class.batched_likelihood_max_bytes
+        )
+        self._matrix_dimension = None  # of particles' Hamiltonians/Liouvillians
         self.single_experiment_timings = {k: {} for k in ["system", "simulator"]}
 
-    def log_print(self, to_print_list, log_identifier=None):
+        if self.evaluation_model:
+            # evaluation results are computed from the per-call records
+            likelihood_instrumentation = "full"
+        elif likelihood_instrumentation is None:
+            likelihood_instrumentation = (
+                self.exploration_class.likelihood_instrumentation
+            )
+        if likelihood_instrumentation not in self.likelihood_instrumentation_levels:
+            raise ValueError(
+                "likelihood_instrumentation must be one of {}, not {}".format(
+                    self.likelihood_instrumentation_levels, likelihood_instrumentation
+                )
+            )
+        self.likelihood_instrumentation = likelihood_instrumentation
+        self.likelihood_sketches = {
+            x: ProbabilitySketch() for x in ["system", "particles", "residuals"]
+        }
+        self._latest_system_pr0 = None
+
+    def log_print(self, to_print_list, log_identifier=None, level=qmla.logging.INFO):
         r"""Writng to unique QMLA instance log."""
         if log_identifier is None:
             log_identifier = "QInfer interface {}".format(self.model_name)
@@ -185,14 +499,17 @@ class QInferModelQMLA(qi.FiniteOutcomeModel):
             to_print_list=to_print_list,
             log_file=self.log_file,
             log_identifier=log_identifier,
+            level=level,
         )
 
     def log_print_debug(self, to_print_list):
-        r"""Log print if global debug_mode set to True."""
+        r"""Log print at DEBUG level, if debug_mode set to True."""
 
         if self.debug_mode:
             self.log_print(
-                to_print_list=to_print_list, log_identifier="QInfer interface debug"
+                to_print_list=to_print_list,
+                log_identifier="QInfer interface debug",
+                level=qmla.logging.DEBUG,
             )
 
     ## PROPERTIES ##
@@ -278,6 +595,7 @@ class QInferModelQMLA(qi.FiniteOutcomeModel):
         """
         return 2
 
+    @qmla.tracing.traced(category="likelihood")
     def likelihood(self, outcomes, modelparams, expparams):
         r"""
         Function to calculate likelihoods for all the particles
@@ -344,7 +662,9 @@ class QInferModelQMLA(qi.FiniteOutcomeModel):
         """
 
         self.calls_to_likelihood += 1
-        t_likelihood_start = time.time()
+        instrument = self.likelihood_instrumentation != "off"
+        if instrument:
+            t_likelihood_start = time.time()
         super(QInferModelQMLA, self).likelihood(
             outcomes, modelparams, expparams
         )  # internal QInfer book-kepping
@@ -357,15 +677,15 @@ class QInferModelQMLA(qi.FiniteOutcomeModel):
             expparams_sampled_particle = np.array(
                 [expparams.item(0)[2:]]
             )[0]  # TODO THIS IS DANGEROUS - DONT DO IT OUTSIDE OF TESTS
-            self.log_print_debug(
-                ["expparams_sampled_particle:", repr(expparams_sampled_particle)]
-            )
+            if self.debug_mode:
+                self.log_print_debug(
+                    ["expparams_sampled_particle:", repr(expparams_sampled_particle)]
+                )
             self.ham_from_expparams = self.model_constructor.construct_matrix(
                 expparams_sampled_particle
             )
 
         num_particles = modelparams.shape[0]
-        num_parameters = modelparams.shape[1]
 
         # We assume that calls to likelihood are paired:
         # one for system, one for simulator
@@ -379,122 +699,156 @@ class QInferModelQMLA(qi.FiniteOutcomeModel):
             self.true_evolution = False
             timing_marker = "simulator"
 
-        self.log_print_debug(
-            [
-                "\n\nLikelihood fnc called. Probe counter={}. True system -> {}.".format(
-                    probe_id, self.true_evolution
-                )
-            ]
-        )
+        if self.debug_mode:
+            self.log_print_debug(
+                [
+                    "\n\nLikelihood fnc called. Probe counter={}. True system -> {}.".format(
+                        probe_id, self.true_evolution
+                    )
+                ]
+            )
 
         # Get pr0, the probability of measuring the datum labelled '0'.
-        if self.true_evolution:
+        if instrument:
             t_init = time.time()
-            probe = self.probes_system[
-                probe_id,
-                self.true_model_constructor.num_qubits,
-            ]
-            pr0 = self.get_system_pr0_array(times=times, probe=probe)
-            self.timings[timing_marker]["get_pr0"] += time.time() - t_init
+        if self.true_evolution:
+            pr0 = self._replay_system_pr0(probe_id=probe_id, times=times)
+            if pr0 is None:
+                probe = self.probes_system[
+                    probe_id,
+                    self.true_model_constructor.num_qubits,
+                ]
+                pr0 = self.get_system_pr0_array(times=times, probe=probe)
         else:
-            t_init = time.time()
             probe = self.probes_simulator[probe_id, self.model_constructor.num_qubits]
             pr0 = self.get_simulator_pr0_array(
                 times=times,
                 particles=modelparams,
                 probe=probe,
             )
-            self.timings[timing_marker]["get_pr0"] += time.time() - t_init
 
         # Convert pr0 probabilities to likelihoods for QInfer to use in updating distribution
         likelihood_array = qi.FiniteOutcomeModel.pr0_to_likelihood_array(outcomes, pr0)
 
         # Everything below here in this method is recording, no useful computation
-        # TODO probably most of it can be removed
-        self.single_experiment_timings[timing_marker]["likelihood"] = (
-            time.time() - t_likelihood_start
-        )
-        self.log_print_debug(
-            [
-                "\ntrue_evo:",
-                self.true_evolution,
-                "\nevolution times:",
-                times,
-                "\nlen(outcomes):",
-                len(outcomes),
-                "\nprobe counter:",
-                probe_id,
-                "\nexp:",
-                expparams,
-                "\nOutcomes:",
-                outcomes[:3],
-                "\nparticles:",
-                modelparams[:3],
-                "\nPr0: ",
-                pr0[:3],
-                "\nLikelihood: ",
-                likelihood_array[0][:3],
-                # "\nexpparams_sampled_particle:", expparams_sampled_particle
-            ]
-        )
-        self.timings[timing_marker]["likelihood"] += time.time() - t_likelihood_start
+        if instrument:
+            t_storage_start = time.time()
+            self.timings[timing_marker]["get_pr0"] += t_storage_start - t_init
+            self.timings[timing_marker]["likelihood"] += (
+                t_storage_start - t_likelihood_start
+            )
+            self.single_experiment_timings[timing_marker]["likelihood"] = (
+                t_storage_start - t_likelihood_start
+            )
+            self._record_likelihoods(pr0)
+            self.single_experiment_timings[timing_marker]["storage"] = (
+                time.time() - t_storage_start
+            )
+
+        if self.debug_mode:
+            self.log_print_debug(
+                [
+                    "\ntrue_evo:",
+                    self.true_evolution,
+                    "\nevolution times:",
+                    times,
+                    "\nlen(outcomes):",
+                    len(outcomes),
+                    "\nprobe counter:",
+                    probe_id,
+                    "\nexp:",
+                    expparams,
+                    "\nOutcomes:",
+                    outcomes[:3],
+                    "\nparticles:",
+                    modelparams[:3],
+                    "\nPr0: ",
+                    pr0[:3],
+                    "\nLikelihood: ",
+                    likelihood_array[0][:3],
+                ]
+            )
+            if self.evaluation_model:
+                self.log_print_debug(
+                    [
+                        "\nSystem evolution {}. t={} Likelihood={}".format(
+                            self.true_evolution, times[0], likelihood_array[:3]
+                        )
+                    ]
+                )
+
+        return likelihood_array
+
+    def _record_likelihoods(self, pr0):
+        r"""
+        Record likelihoods computed by :meth:`likelihood`,
+        according to ``likelihood_instrumentation``.
+
+        :param np.ndarray pr0: likelihoods of the system (from a single particle)
+            or of the particles.
+        """
+
+        if self.true_evolution:
+            self._latest_system_pr0 = pr0
+            self.likelihood_sketches["system"].update(pr0)
+        else:
+            self.likelihood_sketches["particles"].update(pr0)
+            if self._latest_system_pr0 is None:
+                # no system likelihoods to compare with
+                return
+            # the system's likelihoods are computed first, for the same experiment
+            diff_p0 = np.abs(pr0 - self._latest_system_pr0)
+            self.likelihood_sketches["residuals"].update(diff_p0)
+
+        if self.likelihood_instrumentation != "full":
+            return
 
-        t_storage_start = time.time()
         if self.true_evolution:
-            self.log_print_debug(["Storing system likelihoods"])
             self.store_likelihoods["system"][self.likelihood_calls["system"]] = pr0
             self.summarise_likelihoods["system"].append(np.median(pr0))
             self.likelihood_calls["system"] += 1
         else:
+            median_pr0 = np.median(pr0)
+            lower_quartile, upper_quartile = np.percentile(pr0, [25, 75])
             self.store_likelihoods["simulator_mean"][
                 self.likelihood_calls["simulator"]
             ] = np.mean(pr0)
             self.store_likelihoods["simulator_median"][
                 self.likelihood_calls["simulator"]
-            ] = np.median(pr0)
-            diff_p0 = np.abs(
-                pr0
-                - self.store_likelihoods["system"][self.likelihood_calls["simulator"]]
-            )
+            ] = median_pr0
             self.store_p0_diffs.append([np.median(diff_p0), np.std(diff_p0)])
-            self.summarise_likelihoods["particles_mean"].append(np.median(pr0))
-            self.summarise_likelihoods["particles_median"].append(np.median(pr0))
+            self.summarise_likelihoods["particles_mean"].append(median_pr0)
+            self.summarise_likelihoods["particles_median"].append(median_pr0)
             self.summarise_likelihoods["particles_std"].append(np.std(pr0))
             self.summarise_likelihoods["particles_lower_quartile"].append(
-                np.percentile(pr0, 25)
+                lower_quartile
             )
             self.summarise_likelihoods["particles_upper_quartile"].append(
-                np.percentile(pr0, 75)
+                upper_quartile
             )
             self.likelihood_calls["simulator"] += 1
-        self.single_experiment_timings[timing_marker]["storage"] = (
-            time.time() - t_storage_start
-        )
-        self.log_print_debug(
-            [
-                "Setting single_experiment_timings for {}[{}] -> {}".format(
-                    timing_marker, "storage", time.time() - t_storage_start
-                )
-            ]
-        )
 
-        self.log_print_debug(["Stored likelihoods"])
+    def likelihood_summary(self):
+        r"""
+        Summaries of the likelihoods computed by this model, over all calls to :meth:`likelihood`.
 
-        if self.evaluation_model:
-            self.log_print_debug(
-                [
-                    "\nSystem evolution {}. t={} Likelihood={}".format(
-                        self.true_evolution, times[0], likelihood_array[:3]
-                    )
-                ]
-            )
+        :return dict summary: for each of ``system``, ``particles`` and ``residuals``
+            (absolute differences between the particles' and system's likelihoods),
+            the :meth:`ProbabilitySketch.info`; empty if ``likelihood_instrumentation``
+            is ``"off"``.
+        """
 
-        return likelihood_array
+        if self.likelihood_instrumentation == "off":
+            return {}
+        return {k: sketch.info() for k, sketch in self.likelihood_sketches.items()}
 
     def get_system_pr0_array(self, times, probe):
         r"""
         Compute pr0 array for the system.
-        # TODO compute e^(-iH) once for true Hamiltonian and use that rather than computing every step.
+
+        When the default expectation value is used (and not IQLE),
+        pr0 is computed from the eigendecomposition of the true Hamiltonian,
+        which is computed once per QMLA instance (see :func:`true_system_spectrum`).
 
         For user specific data, or method to compute system data, replace this function
             in exploration_strategy.qinfer_model_subroutine.
@@ -503,9 +857,20 @@ class QInferModelQMLA(qi.FiniteOutcomeModel):
 
         :returns np.ndarray pr0: probabilities of measuring specified outcome on system
         """
-        from rq import timeouts
+        if self.true_system_spectrum is not None:
+            t_init = time.time()
+            probabilities = qmla.shared_functionality.expectation_value_functions.spectral_expectation_values(
+                eigenvalues=self.true_system_spectrum["eigenvalues"],
+                eigenvectors=self.true_system_spectrum["eigenvectors"],
+                times=times,
+                state=probe,
+                log_file=self.log_file,
+                log_identifier="get pr0 from true spectrum",
+            )
+            self.timings["system"]["expectation_values"] += time.time() - t_init
+            return np.array([probabilities])
 
-        hamiltonian = self.true_model_constructor.fixed_matrix
+        hamiltonian = self.true_hamiltonian
         t_init = time.time()
 
         if self.iqle_mode:
@@ -514,7 +879,7 @@ class QInferModelQMLA(qi.FiniteOutcomeModel):
                 "hamiltonian shape:", hamiltonian.shape, 
                 "\nham_from_expparams:", self.ham_from_expparams.shape
             ])
-            hamiltonian -= self.ham_from_expparams
+            hamiltonian = hamiltonian - self.ham_from_expparams
 
             if np.any(np.isnan(hamiltonian)):
                 self.log_print(
@@ -558,6 +923,15 @@ class QInferModelQMLA(qi.FiniteOutcomeModel):
 
         :returns np.ndarray pr0: probabilities of measuring specified outcome
         """
+        if self.batched_likelihood_engine:
+            t_init = time.time()
+            pr0 = self.get_batched_simulator_pr0_array(
+                particles=particles, times=times, probe=probe
+            )
+            self.timings["simulator"]["batched_pr0"] += time.time() - t_init
+            return pr0
+
+        t_init = time.time()
         num_particles = len(particles)
         pr0 = np.empty([num_particles, len(times)])
 
@@ -587,49 +961,253 @@ class QInferModelQMLA(qi.FiniteOutcomeModel):
                 )
                 pr0[particle_idx][time_idx] = prob_meas_input_state
 
+        self.timings["simulator"]["looped_pr0"] += time.time() - t_init
         return pr0
 
+    def get_batched_simulator_pr0_array(self, particles, times, probe):
+        r"""
+        Compute pr0 array for the simulator, for all particles at once.
+
+        Particle Hamiltonians are stacked into a single
+        ``(num_particles, d, d)`` array, which is diagonalised in one call,
+        or in batches of particles if the stack would exceed
+        ``batched_likelihood_max_bytes`` (see :meth:`_likelihood_batch_size`),
+        and pr0 is computed from the decompositions by
+        :func:`~qmla.shared_functionality.expectation_value_functions.spectral_expectation_values`
+        (or :func:`~qmla.shared_functionality.expectation_value_functions.spectral_hahn_evolution`
+        for Hahn echo subroutines).
+        Equivalent to the per-particle loop of :meth:`get_simulator_pr0_array`
+        when the exploration strategy uses one of those expectation values.
+        Outside IQLE mode, the decompositions are held in :attr:`particle_spectra`
+        and reused for subsequent experiments until the particles are resampled;
+        if they are too large to hold, pr0 is computed for each batch of particles
+        in turn, so memory is bounded by the batch size.
+        For open systems (Liouvillian models), the particles' Liouvillians
+        are instead constructed together, and their fidelities found by
+        :func:`~qmla.shared_functionality.expectation_value_functions.liouvillian_evolve_fidelities`.
 
-class QInferNVCentreExperiment(QInferModelQMLA):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+        :param np.ndarry particles: list of particles (parameter-lists), used to construct
+            Hamiltonians.
+        :param list times: times to compute pr0 for; usually single element.
+        :param np.ndarray probe: state to evolve and measure on.
 
-    def get_system_pr0_array(self, times, particles, **kwargs):
-        self.log_print_debug(["Getting pr0 from experimental dataset."])
-        # time = expparams['t']
-        if len(times) > 1:
-            self.log_print(
-                "Multiple times given to experimental true evolution:", times
+        :returns np.ndarray pr0: probabilities of measuring specified outcome,
+            of shape ``(num_particles, len(times))``
+        """
+
+        batch_size = self._likelihood_batch_size(particles)
+        d = self._matrix_dimension
+        spectra_held = (
+            not self.iqle_mode
+            and not self.liouvillian_evolution
+            and len(particles) * 16 * (d ** 2 + d) <= self.particle_spectra.max_bytes
+        )
+        if len(particles) > batch_size and not spectra_held:
+            return np.concatenate(
+                [
+                    self._batched_simulator_pr0_array(
+                        particles=particles[start : start + batch_size],
+                        times=times,
+                        probe=probe,
+                    )
+                    for start in range(0, len(particles), batch_size)
+                ]
             )
-            sys.exit()
+        return self._batched_simulator_pr0_array(
+            particles=particles, times=times, probe=probe, batch_size=batch_size
+        )
 
-        time = times[0]
+    def _likelihood_batch_size(self, particles):
+        r"""
+        Number of particles whose Hamiltonians (or Liouvillians) are stacked
+        and diagonalised together by the batched likelihood engine.
 
-        try:
-            # If time already exists in experimental data
-            experimental_expec_value = self.experimental_measurements[time]
-        except BaseException:
-            # map to nearest experimental time
-            try:
-                experimental_expec_value = qmla.shared_functionality.experimental_data_processing.nearest_experimental_expect_val_available(
-                    times=self.experimental_measurement_times,
-                    experimental_data=self.experimental_measurements,
-                    t=time,
-                )
-            except:
-                self.log_print_debug(["Failed to get experimental data point"])
-                raise
-            self.log_print_debug(
+        Each particle needs its matrix, its eigenvectors and LAPACK's workspace,
+        about :math:`3 d^2` complex numbers; the batch is bounded so that
+        these do not exceed the exploration strategy's ``batched_likelihood_max_bytes``.
+        """
+
+        if self._matrix_dimension is None:
+            matrix = self._particle_hamiltonians(particles[:1])
+            self._matrix_dimension = matrix.shape[-1]
+        bytes_per_particle = 3 * 16 * self._matrix_dimension ** 2
+        return max(1, int(self.batched_likelihood_max_bytes // bytes_per_particle))
+
+    def _batched_simulator_pr0_array(self, particles, times, probe, batch_size=None):
+        r"""
+        pr0 for ``particles`` by :meth:`get_batched_simulator_pr0_array`,
+        diagonalising at most ``batch_size`` particles' Hamiltonians together
+        when their decompositions are held in :attr:`particle_spectra`.
+        """
+
+        if self.liouvillian_evolution:
+            t_init = time.time()
+            liouvillians = self._particle_hamiltonians(particles)
+            if self.iqle_mode:
+                liouvillians = liouvillians - self.ham_from_expparams
+            self.timings["simulator"]["construct_ham"] += time.time() - t_init
+
+            t_init = time.time()
+            pr0 = qmla.shared_functionality.expectation_value_functions.liouvillian_evolve_fidelities(
+                liouvillians=liouvillians, times=times, state=probe
+            )
+            self.timings["simulator"]["expectation_values"] += time.time() - t_init
+            return pr0
+
+        if not self.iqle_mode:
+            # particle Hamiltonians don't depend on the experiment:
+            # reuse their decomposition until the particles move
+            t_init = time.time()
+            eigenvalues, eigenvectors = self.particle_spectra.get(
+                particles, self._particle_hamiltonians, batch_size=batch_size
+            )
+            self.timings["simulator"]["particle_spectra"] += time.time() - t_init
+        else:
+            t_init = time.time()
+            hamiltonians = (
+                self._particle_hamiltonians(particles) - self.ham_from_expparams
+            )
+            self.timings["simulator"]["construct_ham"] += time.time() - t_init
+
+            t_init = time.time()
+            eigenvalues, eigenvectors = np.linalg.eigh(hamiltonians)
+            self.timings["simulator"]["particle_spectra"] += time.time() - t_init
+
+        t_init = time.time()
+        if self.spectral_hahn_settings is not None:
+            pr0 = qmla.shared_functionality.expectation_value_functions.spectral_hahn_evolution(
+                eigenvalues=eigenvalues,
+                eigenvectors=eigenvectors,
+                times=times,
+                state=probe,
+                **self.spectral_hahn_settings
+            )
+        else:
+            pr0 = qmla.shared_functionality.expectation_value_functions.spectral_expectation_values(
+                eigenvalues=eigenvalues,
+                eigenvectors=eigenvectors,
+                times=times,
+                state=probe,
+                log_file=self.log_file,
+                log_identifier="get batched pr0",
+            )
+        self.timings["simulator"]["expectation_values"] += time.time() - t_init
+        return pr0
+
+    def _model_terms_hermitian(self):
+        r"""
+        Whether all of the model's terms are Hermitian.
+
+        ``np.linalg.eigh`` reads only the lower triangle of each particle's Hamiltonian,
+        so the batched likelihood engine is only used for Hermitian terms;
+        otherwise pr0 is computed per particle, by exponentiating its Hamiltonian
+        (as for the true system, see
+        :func:`~qmla.shared_functionality.expectation_value_functions.spectral_decomposition`).
+        Checked once per model.
+        """
+
+        hermitian = all(
+            np.allclose(term, np.conj(term).T)
+            for term in self.model_constructor.terms_matrices
+        )
+        if not hermitian:
+            self.log_print(
                 [
-                    "experimental value for t={}: {}".format(
-                        time, experimental_expec_value
-                    )
+                    "Model terms are not Hermitian;",
+                    "computing likelihoods per particle.",
                 ]
             )
+        return hermitian
+
+    def _particle_hamiltonians(self, particles):
+        r"""Stack of Hamiltonians, of shape ``(num_particles, d, d)``, for the given particles."""
+
+        if self.evaluation_model:
+            return np.repeat(
+                self.model_constructor.fixed_matrix[np.newaxis, :, :],
+                len(particles),
+                axis=0,
+            )
+        return self.model_constructor.construct_matrices(particles)
+
+    def set_replay_experiments(self, experiments):
+        r"""
+        Prepare to replay a known list of experiments, e.g. to compute Bayes factors.
+
+        When the experiments to be performed are all known in advance,
+        the system's pr0 is tabulated for every experiment up front;
+        the particles' likelihoods are computed from the decompositions held by
+        :attr:`particle_spectra`, so particle Hamiltonians are only diagonalised
+        again when the updater resamples.
+
+        Results are identical to computing likelihoods per experiment.
+        Only available when this class's default methods compute pr0
+        with the batched likelihood engine, and not in IQLE mode.
+
+        :param list experiments: ``(probe_id, time)`` of each experiment to replay.
+        :return bool replaying: whether tables are used for these experiments.
+        """
+
+        self._replay = None
+        cls = type(self)
+        if (
+            not self.batched_likelihood_engine
+            or self.iqle_mode
+            or self.evaluation_model
+            or cls.get_system_pr0_array is not QInferModelQMLA.get_system_pr0_array
+            or cls.get_simulator_pr0_array
+            is not QInferModelQMLA.get_simulator_pr0_array
+            or cls.get_batched_simulator_pr0_array
+            is not QInferModelQMLA.get_batched_simulator_pr0_array
+        ):
+            return False
+
+        t_init = time.time()
+        system_pr0 = {}
+        for probe_id, t in experiments:
+            key = (int(probe_id), float(t))
+            if key not in system_pr0:
+                system_pr0[key] = self.get_system_pr0_array(
+                    times=np.array([t], dtype=float),
+                    probe=self.probes_system[
+                        key[0], self.true_model_constructor.num_qubits
+                    ],
+                )
+        self.timings["system"]["replay_pr0"] += time.time() - t_init
+
+        self._replay = {"system_pr0": system_pr0}
+        return True
+
+    def clear_replay_experiments(self):
+        r"""Discard tables set up by :meth:`set_replay_experiments`."""
+        self._replay = None
+
+    def _replay_system_pr0(self, probe_id, times):
+        if self._replay is None or len(times) != 1:
+            return None
+        return self._replay["system_pr0"].get((int(probe_id), float(times[0])))
+
+
+class QInferNVCentreExperiment(QInferModelQMLA):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def get_system_pr0_array(self, times, particles, **kwargs):
+        self.log_print_debug(["Getting pr0 from experimental dataset."])
+
+        # measurements at the nearest experimental time to each requested time
+        experimental_expec_values = self.experimental_data_index.nearest_expectation_values(
+            times
+        )
         self.log_print_debug(
-            ["Using experimental time", time, "\texp val:", experimental_expec_value]
+            [
+                "Using experimental times",
+                times,
+                "\texp vals:",
+                experimental_expec_values,
+            ]
         )
-        pr0 = np.array([[experimental_expec_value]])
+        pr0 = np.array([experimental_expec_values])
         self.log_print_debug(["pr0 for system:", pr0])
         return pr0
 
@@ -640,12 +1218,7 @@ class QInferNVCentreExperiment(QInferModelQMLA):
         # **kwargs
     ):
         # map times to experimentally available times
-        mapped_times = [
-            qmla.shared_functionality.experimental_data_processing.nearest_experimental_time_available(
-                times=self.experimental_measurement_times, t=t
-            )
-            for t in times
-        ]
+        mapped_times = self.experimental_data_index.nearest_times(times)
         return super().get_simulator_pr0_array(particles, mapped_times)
 
 
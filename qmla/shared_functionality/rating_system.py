@@ -5,7 +5,6 @@ import random
 import math
 
 import pandas as pd
-import seaborn as sns
 import matplotlib.pyplot as plt
 from matplotlib.gridspec import GridSpec
 import matplotlib
@@ -157,6 +156,8 @@ class RatingSystem:
         show_fscore_cmap=False,
         figure_format="png",
     ):
+        import seaborn as sns
+
         self.figure_format = figure_format
 
         all_model_ratings_by_generation = pd.DataFrame()
@@ -277,6 +278,8 @@ class RatingSystem:
     def plot_rating_progress_single_model_static(
         ratings_df, target_model_id, return_df=False, return_lf=None, save_to_file=None
     ):
+        import seaborn as sns
+
         # First isolate the ratings for this model
         model_identifiers = ["a", "b"]
         ratings_of_single_model = pd.DataFrame(
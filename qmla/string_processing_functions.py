@@ -133,7 +133,7 @@ def process_transverse_term(term):
     return mtx
 
 
-def process_multipauli_term(term):
+def process_multipauli_term(term, sparse_representation=False):
     # term of form pauliSet_aJb_iJk_dN
     # where a is operator on site i
     # b is operator on site k
@@ -155,13 +155,22 @@ def process_multipauli_term(term):
     # want tuples of (site, operator) for dict logic
     all_terms = list(zip(sites, operators))
 
+    if sparse_representation:
+        # construct the Pauli string directly rather than parsing its name
+        site_operators = dict(all_terms)
+        return model_building_utilities.sparse_tensor_product(
+            [site_operators.get(site, "i") for site in range(1, 1 + dim)]
+        )
+
     term_dict = {"dim": dim, "terms": [all_terms]}
 
     full_mod_str = full_model_string(term_dict)
-    return model_building_utilities.compute(full_mod_str)
+    return model_building_utilities.compute(
+        full_mod_str, sparse_representation=sparse_representation
+    )
 
 
-def process_likewise_pauli_sum(term):
+def process_likewise_pauli_sum(term, sparse_representation=False):
     r"""
     Terms where the same Pauli is applied to different qubits, summed together.
 
@@ -190,10 +199,12 @@ def process_likewise_pauli_sum(term):
         all_terms.append(new_term)
 
     total_model_string = "+".join(all_terms)
-    return qmla.model_building_utilities.compute(total_model_string)
+    return qmla.model_building_utilities.compute(
+        total_model_string, sparse_representation=sparse_representation
+    )
 
 
-def process_n_qubit_NV_centre_spin(term):
+def process_n_qubit_NV_centre_spin(term, sparse_representation=False):
     components = term.split("_")
     for l in components:
         if l[0] == "d":
@@ -230,7 +241,9 @@ def process_n_qubit_NV_centre_spin(term):
                 op_name += p_str
 
     # print("Type {} ; name {}".format(term_type, op_name))
-    return model_building_utilities.compute(op_name)
+    return model_building_utilities.compute(
+        op_name, sparse_representation=sparse_representation
+    )
 
 
 def process_ising_chain(term):
@@ -248,7 +261,7 @@ def process_ising_chain(term):
         if mtx is None:
             mtx = qmla.model_building_utilities.compute(s)
         else:
-            mtx += qmla.model_building_utilities.compute(s)
+            mtx = mtx + qmla.model_building_utilities.compute(s)
     return mtx
 
 
@@ -294,7 +307,7 @@ def transverse_axis_matrix(num_qubits, transverse_axis):
         individual_transverse_terms.append(single_term)
     running_mtx = model_building_utilities.compute(individual_transverse_terms[0])
     for term in individual_transverse_terms[1:]:
-        running_mtx += model_building_utilities.compute(term)
+        running_mtx = running_mtx + model_building_utilities.compute(term)
     return running_mtx
 
 
@@ -325,7 +338,7 @@ def ising_interaction_component(num_qubits, interaction_axis):
     running_mtx = model_building_utilities.compute(individual_interaction_terms[0])
 
     for term in individual_interaction_terms[1:]:
-        running_mtx += model_building_utilities.compute(term)
+        running_mtx = running_mtx + model_building_utilities.compute(term)
 
     return running_mtx
 
@@ -378,7 +391,7 @@ def single_axis_nearest_neighbour_interaction_chain(num_qubits, interaction_axis
     running_mtx = model_building_utilities.compute(individual_interaction_terms[0])
 
     for term in individual_interaction_terms[1:]:
-        running_mtx += model_building_utilities.compute(term)
+        running_mtx = running_mtx + model_building_utilities.compute(term)
 
     return running_mtx
 
@@ -405,7 +418,7 @@ def single_axis_transverse_component(num_qubits, transverse_axis="z"):
     running_mtx = model_building_utilities.compute(individual_transverse_terms[0])
 
     for term in individual_transverse_terms[1:]:
-        running_mtx += model_building_utilities.compute(term)
+        running_mtx = running_mtx + model_building_utilities.compute(term)
 
     return running_mtx
 
@@ -474,7 +487,7 @@ def process_fermi_hubbard_onsite_sum(constituents):
         if mtx is None:
             mtx = process_basic_operator(onsite_term)
         else:
-            mtx += process_basic_operator(onsite_term)
+            mtx = mtx + process_basic_operator(onsite_term)
     return mtx
 
 
@@ -499,7 +512,7 @@ def process_fermi_hubbard_hopping_sum(constituents):
         if mtx is None:
             mtx = process_basic_operator(hopping_term)
         else:
-            mtx += process_basic_operator(hopping_term)
+            mtx = mtx + process_basic_operator(hopping_term)
     return mtx
 
 
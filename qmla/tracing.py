@@ -0,0 +1,347 @@
+import functools
+import glob
+import json
+import os
+import socket
+import threading
+import time
+
+r"""
+Spans recording where time is spent, exported as Chrome traces.
+
+Code is instrumented with nestable spans, either as context managers::
+
+    with qmla.tracing.span("qinfer_update", category="learning", epoch=epoch):
+        updater.update(datum, experiment)
+
+or by decorating functions with :func:`traced`.
+Spans are only recorded when tracing is enabled for the process; otherwise
+entering a span costs a single check, so instrumentation can be left in hot paths.
+
+The QMLA instance enables tracing for its own process when launched with
+``--trace`` (see :class:`~qmla.ControlsQMLA`), and passes the trace directory
+to workers through its ``qmla_settings``.
+Each job run by workers (decorated with :func:`traced_job`) writes its spans
+to a separate file in that directory, so traces can be recorded across
+processes and hosts; :func:`merge_traces` combines them into a single
+timeline, in the `Chrome trace format
+<https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU>`_,
+which can be opened in ``chrome://tracing`` or https://ui.perfetto.dev.
+Optionally, the merged spans are also written as folded stacks,
+for flame graphs (e.g. by ``flamegraph.pl`` or speedscope).
+"""
+
+__all__ = [
+    "span",
+    "traced",
+    "traced_job",
+    "configure_tracing",
+    "start_job_tracing",
+    "tracing_enabled",
+    "write_trace",
+    "merge_traces",
+]
+
+
+class _Tracer:
+    r"""Spans recorded by this process, and where to write them."""
+
+    def __init__(self):
+        self.enabled = False
+        self.pid = None
+        self.trace_directory = None
+        self.process_name = None
+        self.events = []
+        self.job_depth = 0
+        self.job_owned = False
+        self.lock = threading.Lock()
+
+    def add_span(self, name, category, start_time, duration, args):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start_time * 1e6,
+            "dur": duration * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = {k: str(v) for k, v in args.items()}
+        with self.lock:
+            self.events.append(event)
+
+
+_tracer = _Tracer()
+
+
+class _Span:
+    __slots__ = ["name", "category", "args", "start_time", "start_counter"]
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        # wall clock, to align processes; duration from the monotonic counter
+        self.start_time = time.time()
+        self.start_counter = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter() - self.start_counter
+        if _tracer.enabled:
+            _tracer.add_span(
+                self.name, self.category, self.start_time, duration, self.args
+            )
+        return False
+
+
+class _DisabledSpan:
+    __slots__ = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_disabled_span = _DisabledSpan()
+
+
+def span(name, category="qmla", **args):
+    r"""
+    Context manager recording the time spent within it, if tracing is enabled.
+
+    :param str name: name of the span.
+    :param str category: category of the span, e.g. ``learning``, ``comparison``,
+        ``likelihood``, ``redis``, ``plotting`` or ``idle``.
+    :param args: details shown with the span, e.g. ``model_id``.
+    """
+
+    if not _tracer.enabled:
+        return _disabled_span
+    return _Span(name, category, args)
+
+
+def traced(name=None, category="qmla"):
+    r"""
+    Decorator recording each call of the function as a span.
+
+    :param str name: name of the span; by default the function's qualified name.
+    :param str category: category of the span.
+    """
+
+    def decorator(function):
+        span_name = function.__qualname__ if name is None else name
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return function(*args, **kwargs)
+            with _Span(span_name, category, None):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def tracing_enabled():
+    r"""Whether spans are currently being recorded by this process."""
+    return _tracer.enabled
+
+
+def configure_tracing(trace_directory=None, process_name=None):
+    r"""
+    Enable (or, if ``trace_directory`` is None, disable) tracing for this process.
+
+    :param str trace_directory: directory in which to write traces.
+    :param str process_name: label of this process in merged traces.
+    """
+
+    if trace_directory is not None:
+        os.makedirs(trace_directory, exist_ok=True)
+    if _tracer.pid != os.getpid():
+        # discard spans inherited from a forked parent, which writes them itself
+        _tracer.pid = os.getpid()
+        _tracer.events = []
+    _tracer.trace_directory = trace_directory
+    _tracer.process_name = process_name
+    _tracer.enabled = trace_directory is not None
+
+
+def write_trace(file_name=None):
+    r"""
+    Write the spans recorded so far to the trace directory, and discard them.
+
+    :param str file_name: name of the trace file within the trace directory;
+        by default unique to this process and time.
+    :return str trace_file: path of the trace file; None if tracing is disabled.
+    """
+
+    if _tracer.trace_directory is None:
+        return None
+    host_name = socket.gethostname()
+    if file_name is None:
+        file_name = "trace_{}_{}_{}.json".format(
+            host_name, os.getpid(), int(time.time() * 1e6)
+        )
+    with _tracer.lock:
+        events = _tracer.events
+        _tracer.events = []
+    trace = {
+        "traceEvents": events,
+        "otherData": {
+            "host_name": host_name,
+            "pid": os.getpid(),
+            "process_name": _tracer.process_name,
+        },
+    }
+    trace_file = os.path.join(_tracer.trace_directory, file_name)
+    with open(trace_file, "w") as f:
+        json.dump(trace, f)
+    return trace_file
+
+
+def start_job_tracing(trace_directory):
+    r"""
+    Enable tracing for the rest of the current job (see :func:`traced_job`).
+
+    Called by jobs once they know whether the QMLA instance is traced.
+    If the process is already traced (e.g. jobs run within the QMLA instance's
+    own process), the job's spans are recorded with the process's;
+    tracing inherited by a forked worker is replaced by the job's own.
+
+    :param str trace_directory: the QMLA instance's trace directory;
+        if None, the job is not traced.
+    """
+
+    if trace_directory is None or _tracer.job_depth == 0:
+        return
+    if _tracer.enabled and _tracer.pid == os.getpid():
+        return
+    configure_tracing(trace_directory, process_name="worker")
+    _tracer.job_owned = True
+
+
+def traced_job(name, category="job"):
+    r"""
+    Decorator for jobs run by workers, e.g. learning a model.
+
+    The job is recorded as a span, from its start, if tracing is enabled during
+    the job by :func:`start_job_tracing`; the job's spans are then written to
+    their own file, and tracing is disabled again.
+
+    :param str name: name of the job's span.
+    :param str category: category of the job's span.
+    """
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start_time = time.time()
+            start_counter = time.perf_counter()
+            _tracer.job_depth += 1
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _tracer.job_depth -= 1
+                if _tracer.enabled:
+                    _tracer.add_span(
+                        name,
+                        category,
+                        start_time,
+                        time.perf_counter() - start_counter,
+                        None,
+                    )
+                if _tracer.job_owned and _tracer.job_depth == 0:
+                    try:
+                        write_trace()
+                    finally:
+                        _tracer.job_owned = False
+                        configure_tracing(None)
+
+        return wrapper
+
+    return decorator
+
+
+def _folded_stacks(events):
+    r"""Self time (microseconds) of each stack of nested spans, for flame graphs."""
+
+    stacks = {}
+    by_thread = {}
+    for event in events:
+        if event.get("ph") == "X":
+            by_thread.setdefault((event["pid"], event["tid"]), []).append(event)
+    for thread_events in by_thread.values():
+        # parents start no later, and end no earlier, than their children
+        thread_events.sort(key=lambda e: (e["ts"], -e["dur"]))
+        open_spans = []
+        for event in thread_events:
+            while open_spans and event["ts"] >= (
+                open_spans[-1]["ts"] + open_spans[-1]["dur"]
+            ):
+                open_spans.pop()
+            stack = ";".join([e["name"] for e in open_spans] + [event["name"]])
+            stacks[stack] = stacks.get(stack, 0) + event["dur"]
+            if open_spans:
+                parent_stack = ";".join([e["name"] for e in open_spans])
+                stacks[parent_stack] -= event["dur"]
+            open_spans.append(event)
+    return stacks
+
+
+def merge_traces(trace_directory, output_file, folded_stacks_file=None):
+    r"""
+    Combine the trace files in ``trace_directory`` into a single Chrome trace.
+
+    Processes are labelled by host and process ID (and the name they were given
+    by :func:`configure_tracing`), and renumbered so that processes on different
+    hosts are distinguished.
+
+    :param str trace_directory: directory of trace files written by :func:`write_trace`.
+    :param str output_file: path of the merged trace.
+    :param str folded_stacks_file: if given, path at which to also write the spans'
+        self times as folded stacks (``a;b;c <microseconds>``), for flame graphs.
+    :return int num_events: number of spans in the merged trace.
+    """
+
+    events = []
+    process_ids = {}
+    for trace_file in sorted(glob.glob(os.path.join(trace_directory, "*.json"))):
+        with open(trace_file) as f:
+            trace = json.load(f)
+        other_data = trace.get("otherData", {})
+        host_name = other_data.get("host_name")
+        for event in trace["traceEvents"]:
+            process = (host_name, event["pid"])
+            if process not in process_ids:
+                process_ids[process] = len(process_ids) + 1
+                label = "{}:{}".format(host_name, event["pid"])
+                if other_data.get("process_name"):
+                    label = "{} ({})".format(label, other_data["process_name"])
+                events.append(
+                    {
+                        "name": "process_name",
+                        "ph": "M",
+                        "pid": process_ids[process],
+                        "args": {"name": label},
+                    }
+                )
+            event = dict(event, pid=process_ids[process])
+            events.append(event)
+
+    with open(output_file, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    if folded_stacks_file is not None:
+        with open(folded_stacks_file, "w") as f:
+            for stack, self_time in sorted(_folded_stacks(events).items()):
+                f.write(
+                    "{} {}\n".format(stack.replace(" ", "_"), int(max(self_time, 0)))
+                )
+    return len([e for e in events if e["ph"] == "X"])
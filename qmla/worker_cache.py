@@ -0,0 +1,122 @@
+import pickle
+import threading
+
+import qmla.redis_settings
+import qmla.shared_functionality.experimental_data_processing
+
+r"""
+Per-process cache of the immutable data workers need for each QMLA instance.
+
+Every model learning or comparison job requires the QMLA instance's
+``qmla_settings``, probe dictionaries, plot probes and experimental data index.
+These are stored once by the :class:`~qmla.QuantumModelLearningAgent`
+(on the redis database, or on disk for plot probes and the index) and never change
+during the instance, so workers (which are long-lived, see
+``rq_worker_qmla.py``) retrieve them on their first job for a given
+QMLA instance and reuse them on subsequent jobs.
+Objects returned are shared between jobs, so must not be modified.
+"""
+
+__all__ = [
+    "get_qmla_core_info",
+    "get_plot_probes",
+    "get_experimental_data_index",
+    "clear_worker_cache",
+]
+
+_core_info = {}
+_plot_probes = {}
+_experimental_data_indices = {}
+_lock = threading.Lock()
+
+_core_info_fields = ["qmla_settings", "probes_system", "probes_simulator"]
+
+
+def get_qmla_core_info(host_name, port_number, qmla_id):
+    r"""
+    Core data of a QMLA instance, retrieved from its redis database once per process.
+
+    :param str host_name: name of host server on which redis database exists.
+    :param int port_number: this QMLA instance's unique port number.
+    :param int qmla_id: QMLA id, unique to a single instance within a run.
+    :return dict qmla_core_info_database: ``qmla_settings``, ``probes_system``
+        and ``probes_simulator``, in the same format as
+        :attr:`~qmla.QuantumModelLearningAgent.qmla_core_info_database`.
+    """
+
+    key = (host_name, port_number, qmla_id)
+    with _lock:
+        if key in _core_info:
+            return _core_info[key]
+
+    redis_databases = qmla.redis_settings.get_redis_databases_by_qmla_id(
+        host_name, port_number, qmla_id
+    )
+    pickled_fields = redis_databases["qmla_core_info_database"].mget(_core_info_fields)
+    if any([f is None for f in pickled_fields]):
+        # not yet stored by the QMLA instance; don't cache
+        raise KeyError(
+            "QMLA core info not found on redis database for QMLA {}".format(qmla_id)
+        )
+    core_info = {
+        field: pickle.loads(pickled)
+        for field, pickled in zip(_core_info_fields, pickled_fields)
+    }
+
+    with _lock:
+        _core_info[key] = core_info
+    return core_info
+
+
+def get_plot_probes(probes_plot_file):
+    r"""
+    Probes used for plots, loaded from ``probes_plot_file`` once per process.
+
+    :param str probes_plot_file: path to pickled plot probes,
+        i.e. ``qmla_settings["probes_plot_file"]``.
+    :return dict plot_probes: probes for each number of qubits.
+    """
+
+    with _lock:
+        if probes_plot_file in _plot_probes:
+            return _plot_probes[probes_plot_file]
+
+    with open(probes_plot_file, "rb") as f:
+        plot_probes = pickle.load(f)
+
+    with _lock:
+        _plot_probes[probes_plot_file] = plot_probes
+    return plot_probes
+
+
+def get_experimental_data_index(index_file):
+    r"""
+    Experimental data index, loaded (memory-mapped) from ``index_file`` once per process.
+
+    :param str index_file: path to the stored
+        :class:`~qmla.shared_functionality.experimental_data_processing.ExperimentalDataIndex`,
+        i.e. ``qmla_settings["experimental_data_index_file"]``.
+    :return ExperimentalDataIndex experimental_data_index: index of the
+        system's measurements by time.
+    """
+
+    with _lock:
+        if index_file in _experimental_data_indices:
+            return _experimental_data_indices[index_file]
+
+    experimental_data_index = qmla.shared_functionality.experimental_data_processing.ExperimentalDataIndex.load(
+        index_file
+    )
+
+    with _lock:
+        _experimental_data_indices[index_file] = experimental_data_index
+    return experimental_data_index
+
+
+def clear_worker_cache():
+    r"""Discard all cached core info, plot probes, data indices and redis connections."""
+    with _lock:
+        _core_info.clear()
+        _plot_probes.clear()
+        _experimental_data_indices.clear()
+    qmla.redis_settings.clear_redis_databases()
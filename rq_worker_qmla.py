@@ -16,7 +16,7 @@ import pandas as pd
 
 # Third party libraries
 import redis
-from rq import Queue, Connection, Worker
+from rq import Queue, Connection, Worker, SimpleWorker
 import argparse
 import matplotlib.pyplot as plt
 from matplotlib.gridspec import GridSpec
@@ -50,10 +50,19 @@ parser.add_argument(
         type=int,
         default=1
 )
+parser.add_argument(
+        '-fork', '--fork_per_job',
+        help="Run each job in a new forked process. \
+        By default jobs run in this process, so data cached by \
+        qmla.worker_cache is reused between jobs.",
+        type=int,
+        default=0
+)
 arguments = parser.parse_args()
 redis_host_name = arguments.host_name
 redis_port_number = arguments.port_number
 qmla_id = arguments.qmla_id
+fork_per_job = bool(arguments.fork_per_job)
 
 # Generate a redis connection
 redis_conn = redis.Redis(
@@ -61,7 +70,13 @@ redis_conn = redis.Redis(
         port = redis_port_number
 )
 
+# Jobs on the priority queue (comparisons within branches) are taken first
+queue_names = ["{}_priority".format(qmla_id), str(qmla_id)]
+
 with Connection( redis_conn ):
 
-        w = Worker( [str(qmla_id)] , connection=redis_conn)
+        if fork_per_job:
+                w = Worker( queue_names , connection=redis_conn)
+        else:
+                w = SimpleWorker( queue_names , connection=redis_conn)
         w.work()
\ No newline at end of file
@@ -0,0 +1,591 @@
+import sys
+import os
+import copy
+import json
+import time
+import pickle
+import random
+import fnmatch
+import argparse
+import platform
+import tempfile
+import subprocess
+
+import numpy as np
+import scipy
+
+p = os.path.abspath(os.path.realpath(__file__))
+elements = p.split("/")[:-2]
+qmla_root = os.path.abspath("/".join(elements))
+sys.path.append(qmla_root)
+
+import qmla
+import qmla.shared_functionality.expectation_value_functions as ev_functions
+
+r"""
+Microbenchmarks of the hot paths of QMLA.
+
+Benchmarks, named ``<target>/<parameters>``:
+
+    construct_matrix/q<n>
+        :meth:`~qmla.shared_functionality.model_constructors.BaseModel.construct_matrix`
+        of an Ising chain on ``n`` qubits.
+    expectation_value/<subroutine>/q<n>
+        each expectation value subroutine used by exploration strategies,
+        for a single time.
+    likelihood/q<n>/p<particles>
+        :meth:`~qmla.shared_functionality.qinfer_model_interface.QInferModelQMLA.likelihood`
+        for one experiment, on particles not held in its spectrum cache.
+    update_model/q<n>
+        complete parameter learning,
+        :meth:`~qmla.ModelInstanceForLearning.update_model`.
+    update_log_likelihood/q<n>
+        one side of a Bayes factor,
+        :meth:`~qmla.ModelInstanceForComparison.update_log_likelihood`,
+        against the experiments of the ``update_model`` benchmark.
+    genetic_algorithm_step
+        :meth:`~qmla.shared_functionality.genetic_algorithm.GeneticAlgorithmQMLA.genetic_algorithm_step`,
+        for a generation of 16 models on 5 sites.
+
+Each benchmark is repeated until it has run for ``--min_time`` seconds
+(at least ``--min_repeats`` times, and at most ``--max_repeats``),
+from fixed random seeds; the median and minimum times are reported.
+Results are saved as JSON, with metadata of the machine and versions used,
+and compared against a baseline file (e.g. saved from the main branch
+with ``--save_baseline``), so that regressions show up;
+baselines are only meaningful on the machine they were recorded on.
+
+Likelihood benchmarks whose particles' Hamiltonians and eigendecompositions
+would exceed ``--max_memory`` are skipped; benchmarks which fail record
+their error, and the remaining benchmarks still run.
+``scripts/exponentiation_timing`` holds the older one-off comparisons
+of matrix exponentiation methods.
+"""
+
+# expectation value subroutines, with the numbers of qubits they support
+expectation_value_subroutines = {
+    "default_expectation_value": (ev_functions.default_expectation_value, 1, None),
+    "krylov_expectation_value": (ev_functions.krylov_expectation_value, 1, None),
+    "size_dependent_expectation_value": (
+        ev_functions.size_dependent_expectation_value,
+        1,
+        None,
+    ),
+    "hahn_evolution": (ev_functions.hahn_evolution, 2, 2),
+    "n_qubit_hahn_evolution": (ev_functions.n_qubit_hahn_evolution, 2, None),
+    "n_qubit_hahn_evolution_double_time_reverse": (
+        ev_functions.n_qubit_hahn_evolution_double_time_reverse,
+        2,
+        None,
+    ),
+}
+
+
+def chain_model_name(num_qubits):
+    terms = [
+        "pauliSet_{}J{}_zJz_d{}".format(i, i + 1, num_qubits)
+        for i in range(1, num_qubits)
+    ]
+    terms.append("pauliSet_1_x_d{}".format(num_qubits))
+    return "+".join(terms)
+
+
+def seed(value=0):
+    np.random.seed(value)
+    random.seed(value)
+
+
+def time_function(function, setup=None, min_time=1.0, min_repeats=3, max_repeats=100):
+    r"""
+    Time repeated calls of ``function``.
+
+    :param callable function: called with the arguments returned by ``setup``.
+    :param callable setup: called (untimed) before each call of ``function``,
+        returning a tuple of its arguments; if None, ``function`` takes none.
+    :return dict timing: ``median_time`` and ``min_time`` (seconds), and ``repeats``.
+    """
+
+    times = []
+    while len(times) < max_repeats and (
+        len(times) < min_repeats or sum(times) < min_time
+    ):
+        args = setup() if setup is not None else ()
+        t_init = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - t_init)
+    return {
+        "median_time": float(np.median(times)),
+        "min_time": float(np.min(times)),
+        "repeats": len(times),
+    }
+
+
+def learning_core_info(num_qubits, num_particles, num_experiments, directory):
+    r"""
+    Settings (as ``qmla_core_info_database``) for learning the Ising chain on
+    ``num_qubits`` qubits, without a redis database.
+    """
+
+    # evaluation data is found by its path within the results directory
+    directory = os.path.join(directory, "q{}".format(num_qubits))
+    os.makedirs(directory, exist_ok=True)
+    exploration_strategy = qmla.get_exploration_strategy.get_exploration_class(
+        "ExplorationStrategy", log_file=os.path.join(directory, "qmla_log.log")
+    )
+    exploration_strategy.generate_probes(probe_maximum_number_qubits=num_qubits)
+    # as ExplorationStrategy.generate_evaluation_data, without its plots
+    evaluation_times = np.random.uniform(
+        0, exploration_strategy.max_time_to_consider, 250
+    )
+    evaluation_data = {
+        "probes": exploration_strategy.probes_system,
+        "experiments": [
+            np.array(
+                (t, i % exploration_strategy.num_probes),
+                dtype=[("t", "float"), ("probe_id", "int")],
+            )
+            for i, t in enumerate(evaluation_times)
+        ],
+    }
+    with open(os.path.join(directory, "evaluation_data.p"), "wb") as f:
+        pickle.dump(evaluation_data, f)
+    true_model_name = chain_model_name(num_qubits)
+    true_model_constructor = qmla.shared_functionality.model_constructors.BaseModel(
+        name=true_model_name,
+        fixed_parameters=np.random.uniform(0.2, 0.8, size=num_qubits),
+    )
+
+    probes_plot_file = os.path.join(directory, "plot_probes_{}.p".format(num_qubits))
+    with open(probes_plot_file, "wb") as f:
+        pickle.dump(
+            {num_qubits: exploration_strategy.probes_system[(0, num_qubits)]}, f
+        )
+    experimental_data_index_file = os.path.join(
+        directory, "experimental_data_index.npy"
+    )
+    qmla.shared_functionality.experimental_data_processing.ExperimentalDataIndex.from_measurements(
+        {}
+    ).save(
+        experimental_data_index_file
+    )
+
+    qmla_settings = {
+        "probes_plot_file": probes_plot_file,
+        "plot_times": list(np.linspace(0, 10, 20)),
+        "plots_directory": directory,
+        "debug_mode": False,
+        "plot_level": 0,
+        "figure_format": "png",
+        "num_experiments": num_experiments,
+        "num_particles": num_particles,
+        "num_probes": exploration_strategy.num_probes,
+        "true_oplist": true_model_constructor.terms_matrices,
+        "true_model_terms_params": true_model_constructor.fixed_matrix,
+        "true_name": true_model_name,
+        "true_param_dict": dict(
+            zip(
+                true_model_constructor.terms_names,
+                true_model_constructor.fixed_parameters,
+            )
+        ),
+        "true_model_constructor": true_model_constructor,
+        "true_hamiltonian_spectrum": None,
+        "experimental_measurements": {},
+        "experimental_measurement_times": [],
+        "experimental_data_index_file": experimental_data_index_file,
+        "results_directory": directory,
+        "run_info_file": None,
+        "operator_cache_size": 2048,
+        "operator_cache_directory": None,
+    }
+    return {
+        "qmla_settings": qmla_settings,
+        "probes_system": exploration_strategy.probes_system,
+        "probes_simulator": exploration_strategy.probes_simulator,
+    }
+
+
+def model_for_learning(core_info, directory, model_id=1):
+    return qmla.ModelInstanceForLearning(
+        model_id=model_id,
+        model_name=core_info["qmla_settings"]["true_name"],
+        qid=0,
+        exploration_rule="ExplorationStrategy",
+        log_file=os.path.join(directory, "qmla_log.log"),
+        qmla_core_info_database=core_info,
+    )
+
+
+def benchmark_construct_matrix(num_qubits, **timing_settings):
+    model = qmla.shared_functionality.model_constructors.BaseModel(
+        name=chain_model_name(num_qubits)
+    )
+    model.construct_matrix(np.ones(model.num_terms))  # build term matrices
+    return time_function(
+        model.construct_matrix,
+        setup=lambda: (np.random.rand(model.num_terms),),
+        **timing_settings
+    )
+
+
+def benchmark_expectation_value(subroutine, num_qubits, **timing_settings):
+    model = qmla.shared_functionality.model_constructors.BaseModel(
+        name=chain_model_name(num_qubits)
+    )
+    state = qmla.shared_functionality.probe_set_generation.random_probe(num_qubits)
+
+    def setup():
+        return (
+            model.construct_matrix(np.random.rand(model.num_terms)),
+            np.random.uniform(0, 10),
+        )
+
+    return time_function(
+        lambda ham, t: subroutine(ham=ham, t=t, state=state),
+        setup=setup,
+        **timing_settings
+    )
+
+
+def benchmark_likelihood(num_qubits, num_particles, directory, **timing_settings):
+    core_info = learning_core_info(
+        num_qubits, num_particles=100, num_experiments=1, directory=directory
+    )
+    learner = model_for_learning(core_info, directory)
+    qinfer_model = learner.qinfer_model
+    particles = learner.model_prior.sample(num_particles)
+
+    def setup():
+        experiment = learner.model_heuristic(
+            num_params=learner.num_parameters,
+            epoch_id=0,
+            current_params=learner.track_param_means[-1],
+            current_volume=learner.volume_by_epoch[-1],
+        )
+        # new particles each call, as after resampling, so the spectrum is computed
+        return (particles * np.random.uniform(0.99, 1.01), experiment)
+
+    return time_function(
+        lambda modelparams, expparams: qinfer_model.likelihood(
+            np.array([0]), modelparams, expparams
+        ),
+        setup=setup,
+        **timing_settings
+    )
+
+
+def benchmark_update_model(num_qubits, directory, **timing_settings):
+    core_info = learning_core_info(
+        num_qubits, num_particles=500, num_experiments=50, directory=directory
+    )
+    return time_function(
+        lambda learner: learner.update_model(),
+        setup=lambda: (model_for_learning(core_info, directory),),
+        **timing_settings
+    )
+
+
+def benchmark_update_log_likelihood(num_qubits, directory, **timing_settings):
+    core_info = learning_core_info(
+        num_qubits, num_particles=500, num_experiments=50, directory=directory
+    )
+    learners = [model_for_learning(core_info, directory, model_id=i) for i in [1, 2]]
+    for learner in learners:
+        learner.update_model()
+    learned_info = learners[0].learned_info_dict()
+    opponent_experiments = learners[1].track_experiment_parameters
+
+    def setup():
+        model = qmla.ModelInstanceForComparison(
+            model_id=1,
+            qid=0,
+            opponent=2,
+            qmla_core_info_database=core_info,
+            learned_model_info=copy.deepcopy(learned_info),
+            log_file=os.path.join(directory, "qmla_log.log"),
+        )
+        return (model,)
+
+    return time_function(
+        lambda model: model.update_log_likelihood(
+            new_times=[e["t"] for e in opponent_experiments],
+            new_experimental_params=opponent_experiments,
+        ),
+        setup=setup,
+        **timing_settings
+    )
+
+
+def benchmark_genetic_algorithm_step(directory, **timing_settings):
+    exploration_strategy = qmla.get_exploration_strategy.get_exploration_class(
+        "DemoBayesFactorsByFscore", log_file=os.path.join(directory, "qmla_log.log")
+    )
+    initial_genetic_algorithm = copy.deepcopy(exploration_strategy.genetic_algorithm)
+    models = initial_genetic_algorithm.random_initial_models(16)
+    model_fitnesses = {m: np.random.rand() for m in models}
+
+    def setup():
+        genetic_algorithm = copy.deepcopy(initial_genetic_algorithm)
+        genetic_algorithm.consolidate_generation(model_fitnesses=model_fitnesses)
+        return (genetic_algorithm,)
+
+    return time_function(
+        lambda genetic_algorithm: genetic_algorithm.genetic_algorithm_step(
+            model_fitnesses=model_fitnesses, num_pairs_to_sample=8
+        ),
+        setup=setup,
+        **timing_settings
+    )
+
+
+def likelihood_memory(num_qubits, num_particles):
+    r"""Bytes of particles' Hamiltonians, eigenvectors and evolved probes (complex)."""
+    return 3 * num_particles * (2 ** num_qubits) ** 2 * 16
+
+
+def get_benchmarks(qubits, particles, max_memory, directory):
+    r"""
+    Benchmarks to run, by name.
+
+    :return dict benchmarks: functions which run each benchmark,
+        given the timing settings, or a reason (str) that it is skipped.
+    """
+
+    benchmarks = {}
+    for n in qubits:
+        benchmarks["construct_matrix/q{}".format(n)] = lambda n=n, **kw: (
+            benchmark_construct_matrix(n, **kw)
+        )
+    for name, subroutine_qubits in expectation_value_subroutines.items():
+        subroutine, min_qubits, max_qubits = subroutine_qubits
+        for n in qubits:
+            if n >= min_qubits and (max_qubits is None or n <= max_qubits):
+                benchmarks["expectation_value/{}/q{}".format(name, n)] = (
+                    lambda s=subroutine, n=n, **kw: benchmark_expectation_value(
+                        s, n, **kw
+                    )
+                )
+    for n in qubits:
+        for num_particles in particles:
+            name = "likelihood/q{}/p{}".format(n, num_particles)
+            if likelihood_memory(n, num_particles) > max_memory:
+                benchmarks[name] = "needs {:.1f} GB".format(
+                    likelihood_memory(n, num_particles) / 1e9
+                )
+            else:
+                benchmarks[name] = lambda n=n, p=num_particles, **kw: (
+                    benchmark_likelihood(n, p, directory, **kw)
+                )
+    for n in qubits:
+        benchmarks["update_model/q{}".format(n)] = lambda n=n, **kw: (
+            benchmark_update_model(n, directory, **kw)
+        )
+        benchmarks["update_log_likelihood/q{}".format(n)] = lambda n=n, **kw: (
+            benchmark_update_log_likelihood(n, directory, **kw)
+        )
+    benchmarks["genetic_algorithm_step"] = lambda **kw: (
+        benchmark_genetic_algorithm_step(directory, **kw)
+    )
+    return benchmarks
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "-C", qmla_root, "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def machine_metadata():
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": git_commit(),
+        "host_name": platform.node(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+    }
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    r"""
+    Benchmarks whose median time grew by more than ``tolerance`` (fractional)
+    relative to the baseline.
+
+    :return dict regressions: ``(baseline_time, new_time)`` by benchmark name.
+    """
+
+    regressions = {}
+    for name, result in results.items():
+        baseline_result = baseline["results"].get(name)
+        if "median_time" not in result or baseline_result is None:
+            continue
+        if "median_time" not in baseline_result:
+            continue
+        if result["median_time"] > baseline_result["median_time"] * (1 + tolerance):
+            regressions[name] = (baseline_result["median_time"], result["median_time"])
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark QMLA hot paths.")
+    parser.add_argument(
+        "-b",
+        "--benchmarks",
+        help="Pattern (e.g. 'likelihood/*') of benchmarks to run; may be given several times. Default: all.",
+        action="append",
+        default=[],
+    )
+    parser.add_argument(
+        "-q", "--qubits", help="Numbers of qubits.", type=int, nargs="+", default=None
+    )
+    parser.add_argument(
+        "-p",
+        "--particles",
+        help="Numbers of particles for likelihood benchmarks.",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 5000],
+    )
+    parser.add_argument(
+        "--quick",
+        help="Run on 1-3 qubits and 100 particles, with fewer repeats.",
+        action="store_true",
+    )
+    parser.add_argument("--min_time", type=float, default=1.0)
+    parser.add_argument("--min_repeats", type=int, default=3)
+    parser.add_argument("--max_repeats", type=int, default=100)
+    parser.add_argument(
+        "--max_memory",
+        help="Bytes above which likelihood benchmarks are skipped.",
+        type=float,
+        default=2e9,
+    )
+    parser.add_argument(
+        "-o",
+        "--output_file",
+        help="JSON file to save results to.",
+        type=str,
+        default="hot_path_benchmarks.json",
+    )
+    parser.add_argument(
+        "--baseline",
+        help="JSON results file to compare against.",
+        type=str,
+        default=os.path.join(qmla_root, "scripts", "hot_path_benchmarks_baseline.json"),
+    )
+    parser.add_argument(
+        "--save_baseline",
+        help="Also save the results as the baseline.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-tol",
+        "--tolerance",
+        help="Fractional increase in median time counted as a regression.",
+        type=float,
+        default=0.25,
+    )
+    parser.add_argument("--fail_on_regression", action="store_true")
+    arguments = parser.parse_args()
+
+    if arguments.quick:
+        qubits = arguments.qubits or [1, 2, 3]
+        particles = [100]
+        timing_settings = {"min_time": 0.1, "min_repeats": 1, "max_repeats": 10}
+    else:
+        qubits = arguments.qubits or list(range(1, 9))
+        particles = arguments.particles
+        timing_settings = {
+            "min_time": arguments.min_time,
+            "min_repeats": arguments.min_repeats,
+            "max_repeats": arguments.max_repeats,
+        }
+
+    baseline = None
+    if os.path.exists(arguments.baseline):
+        with open(arguments.baseline) as f:
+            baseline = json.load(f)
+        if baseline["metadata"].get("host_name") != platform.node():
+            print(
+                "Warning: baseline recorded on {}; times are not comparable across machines.".format(
+                    baseline["metadata"].get("host_name")
+                )
+            )
+
+    directory = tempfile.mkdtemp(prefix="qmla_benchmarks_")
+    benchmarks = get_benchmarks(
+        qubits=qubits,
+        particles=particles,
+        max_memory=arguments.max_memory,
+        directory=directory,
+    )
+    if arguments.benchmarks:
+        benchmarks = {
+            name: benchmark
+            for name, benchmark in benchmarks.items()
+            if any(fnmatch.fnmatch(name, pattern) for pattern in arguments.benchmarks)
+        }
+
+    results = {}
+    for name, benchmark in benchmarks.items():
+        if isinstance(benchmark, str):
+            results[name] = {"skipped": benchmark}
+            print("{:<60} skipped: {}".format(name, benchmark))
+            continue
+        seed()
+        try:
+            results[name] = benchmark(**timing_settings)
+        except Exception as e:
+            results[name] = {"error": "{}: {}".format(type(e).__name__, e)}
+            print("{:<60} failed: {}".format(name, results[name]["error"]), flush=True)
+            continue
+        line = "{:<60} median {:.3e}s (min {:.3e}s; {} repeats)".format(
+            name,
+            results[name]["median_time"],
+            results[name]["min_time"],
+            results[name]["repeats"],
+        )
+        if baseline is not None and "median_time" in baseline["results"].get(name, {}):
+            line += "; baseline x{:.2f}".format(
+                results[name]["median_time"] / baseline["results"][name]["median_time"]
+            )
+        print(line, flush=True)
+
+    record = {
+        "metadata": machine_metadata(),
+        "settings": dict(timing_settings, qubits=qubits, particles=particles),
+        "results": results,
+    }
+    output_files = [arguments.output_file]
+    if arguments.save_baseline:
+        output_files.append(arguments.baseline)
+    for output_file in output_files:
+        with open(output_file, "w") as f:
+            json.dump(record, f, indent=2)
+
+    regressions = {}
+    if baseline is not None:
+        regressions = compare_with_baseline(
+            results=results, baseline=baseline, tolerance=arguments.tolerance
+        )
+        for name, (baseline_time, new_time) in regressions.items():
+            print(
+                "REGRESSION: {} {:.3e}s -> {:.3e}s (baseline commit {})".format(
+                    name, baseline_time, new_time, baseline["metadata"].get("commit")
+                )
+            )
+
+    failures = [name for name, result in results.items() if "error" in result]
+    if failures:
+        print("FAILED: {}".format(", ".join(failures)))
+
+    if arguments.fail_on_regression and (regressions or failures):
+        sys.exit(1)
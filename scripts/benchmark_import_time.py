@@ -0,0 +1,219 @@
+import sys
+import os
+import re
+import json
+import time
+import argparse
+import subprocess
+
+import numpy as np
+
+p = os.path.abspath(os.path.realpath(__file__))
+elements = p.split("/")[:-2]
+qmla_root = os.path.abspath("/".join(elements))
+
+r"""
+Time importing the qmla package and the modules each process type needs.
+
+Each module is imported in a fresh interpreter with ``python -X importtime``,
+several times, and the median cumulative import time is reported,
+along with which heavy (plotting/analysis) dependencies the import pulled in.
+Results are appended to a history file (JSON lines), and compared with
+the previous entry, so that regressions in import time are caught;
+with ``--fail_on_regression``, the script exits with status 1 if any module
+became slower than the previous entry by more than ``--tolerance``.
+"""
+
+# modules imported by each type of process
+default_targets = [
+    "qmla",  # any script
+    "qmla.remote_model_learning",  # RQ/local workers
+    "qmla.remote_bayes_factor",  # RQ/local workers
+    "qmla.quantum_model_learning_agent",  # implement_qmla.py
+    "qmla.analysis",  # analysis scripts
+]
+
+# dependencies which only plotting/analysis code should pull in
+heavy_dependencies = [
+    "matplotlib.pyplot",
+    "seaborn",
+    "networkx",
+    "qinfer",
+    "qmla.analysis",
+    "qmla.exploration_strategies",
+]
+
+_importtime_line = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def time_import(module, python=sys.executable):
+    r"""
+    Import ``module`` in a new interpreter.
+
+    :param str module: name of module to import.
+    :param str python: interpreter to use.
+    :return dict result: ``total_time`` (seconds) of the import statement,
+        and ``imported`` : cumulative time (seconds) of each module it imported.
+    """
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [qmla_root] + [p for p in env.get("PYTHONPATH", "").split(os.pathsep) if p]
+    )
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", "import {}".format(module)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env=env,
+        universal_newlines=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(
+            "Failed to import {}:\n{}".format(module, completed.stderr[-2000:])
+        )
+
+    imported = {}
+    total_time = 0
+    for line in completed.stderr.splitlines():
+        match = _importtime_line.match(line)
+        if match is not None:
+            cumulative_time = int(match.group(2)) * 1e-6
+            imported[match.group(4)] = cumulative_time
+            if len(match.group(3)) == 1:
+                # imported directly by the import statement, e.g. the package
+                # containing module, rather than by another module
+                total_time += cumulative_time
+    return {"total_time": total_time, "imported": imported}
+
+
+def benchmark(targets, repeats):
+    r"""
+    Median import time of each target, over ``repeats`` fresh interpreters.
+
+    :param list targets: modules to import.
+    :param int repeats: number of times to import each module.
+    :return dict results: for each target, ``median_time``, ``min_time``
+        and the ``heavy_dependencies`` its import loaded.
+    """
+
+    results = {}
+    for module in targets:
+        timings = [time_import(module) for _ in range(repeats)]
+        total_times = [t["total_time"] for t in timings]
+        results[module] = {
+            "median_time": float(np.median(total_times)),
+            "min_time": float(np.min(total_times)),
+            "heavy_dependencies": [
+                d for d in heavy_dependencies if d in timings[0]["imported"]
+            ],
+        }
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "-C", qmla_root, "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(history_file):
+    if not os.path.exists(history_file):
+        return []
+    with open(history_file) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_regressions(results, previous_results, tolerance):
+    r"""Modules whose median import time grew by more than ``tolerance`` (fractional)."""
+
+    regressions = {}
+    for module, result in results.items():
+        if module not in previous_results:
+            continue
+        previous_time = previous_results[module]["median_time"]
+        if result["median_time"] > previous_time * (1 + tolerance):
+            regressions[module] = (previous_time, result["median_time"])
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark qmla import times.")
+    parser.add_argument(
+        "-m",
+        "--modules",
+        help="Module to time; may be given several times. Default: modules used by each process type.",
+        action="append",
+        default=[],
+    )
+    parser.add_argument("-r", "--repeats", type=int, default=5)
+    parser.add_argument(
+        "-hist",
+        "--history_file",
+        help="JSON lines file to record results in, and compare against.",
+        type=str,
+        default=os.path.join(qmla_root, "scripts", "import_time_history.jsonl"),
+    )
+    parser.add_argument(
+        "-tol",
+        "--tolerance",
+        help="Fractional increase in median import time counted as a regression.",
+        type=float,
+        default=0.25,
+    )
+    parser.add_argument("--fail_on_regression", action="store_true")
+    parser.add_argument(
+        "--no_record",
+        help="Compare with the history without adding this run to it.",
+        action="store_true",
+    )
+    arguments = parser.parse_args()
+
+    targets = arguments.modules if arguments.modules else default_targets
+    results = benchmark(targets=targets, repeats=arguments.repeats)
+
+    history = load_history(arguments.history_file)
+    previous = history[-1] if history else None
+    for module, result in results.items():
+        line = "{:<40} median {:.3f}s (min {:.3f}s)".format(
+            module, result["median_time"], result["min_time"]
+        )
+        if previous is not None and module in previous["results"]:
+            line += "; previously {:.3f}s".format(
+                previous["results"][module]["median_time"]
+            )
+        print(line)
+        if result["heavy_dependencies"]:
+            print("    loads: {}".format(", ".join(result["heavy_dependencies"])))
+
+    regressions = {}
+    if previous is not None:
+        regressions = find_regressions(
+            results=results,
+            previous_results=previous["results"],
+            tolerance=arguments.tolerance,
+        )
+        for module, (previous_time, new_time) in regressions.items():
+            print(
+                "REGRESSION: {} import time {:.3f}s -> {:.3f}s (commit {})".format(
+                    module, previous_time, new_time, previous.get("commit")
+                )
+            )
+
+    if not arguments.no_record:
+        record = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": git_commit(),
+            "python": sys.version.split()[0],
+            "repeats": arguments.repeats,
+            "results": results,
+        }
+        with open(arguments.history_file, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    if arguments.fail_on_regression and regressions:
+        sys.exit(1)
@@ -0,0 +1,82 @@
+import sys
+import os
+import time
+import argparse
+
+import numpy as np
+
+p = os.path.abspath(os.path.realpath(__file__))
+elements = p.split("/")[:-3]
+qmla_root = os.path.abspath("/".join(elements))
+sys.path.append(qmla_root)
+import qmla
+from qmla.shared_functionality.expectation_value_functions import (
+    default_expectation_value,
+    batched_expectation_values,
+)
+
+r"""
+Compare the per-particle likelihood loop used by
+QInferModelQMLA.get_simulator_pr0_array against the batched
+eigendecomposition engine, for a range of model sizes.
+"""
+
+
+def chain_model_name(num_qubits):
+    terms = [
+        "pauliSet_{}J{}_zJz_d{}".format(i, i + 1, num_qubits)
+        for i in range(1, num_qubits)
+    ]
+    terms.append("pauliSet_1_x_d{}".format(num_qubits))
+    return "+".join(terms)
+
+
+def time_methods(num_qubits, num_particles, times):
+    model = qmla.shared_functionality.model_constructors.BaseModel(
+        name=chain_model_name(num_qubits)
+    )
+    particles = np.random.rand(num_particles, model.num_terms)
+    probe = qmla.shared_functionality.probe_set_generation.random_probe(num_qubits)
+
+    t_init = time.time()
+    looped = np.empty([num_particles, len(times)])
+    for i, particle in enumerate(particles):
+        ham = model.construct_matrix(particle)
+        for j, t in enumerate(times):
+            looped[i][j] = default_expectation_value(ham=ham, t=t, state=probe)
+    looped_time = time.time() - t_init
+
+    t_init = time.time()
+    hamiltonians = np.tensordot(particles, np.array(model.terms_matrices), axes=1)
+    batched = batched_expectation_values(
+        hamiltonians=hamiltonians, times=times, state=probe
+    )
+    batched_time = time.time() - t_init
+
+    return {
+        "num_qubits": num_qubits,
+        "looped_time": looped_time,
+        "batched_time": batched_time,
+        "speedup": looped_time / batched_time,
+        "max_difference": np.max(np.abs(looped - batched)),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time batched likelihood engine.")
+    parser.add_argument("-p", "--num_particles", type=int, default=500)
+    parser.add_argument("-q", "--max_num_qubits", type=int, default=5)
+    arguments = parser.parse_args()
+
+    for n in range(1, arguments.max_num_qubits + 1):
+        result = time_methods(
+            num_qubits=n,
+            num_particles=arguments.num_particles,
+            times=[np.random.uniform(0, 10)],
+        )
+        print(
+            "{num_qubits} qubits: looped {looped_time:.3f}s; batched {batched_time:.3f}s; "
+            "speedup x{speedup:.1f}; max |difference| {max_difference:.2e}".format(
+                **result
+            )
+        )
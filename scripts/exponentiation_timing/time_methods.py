@@ -18,7 +18,12 @@ qmla_root = os.path.abspath('/'.join(elements))
 sys.path.append(qmla_root)
 import qmla
 
-import py_hexp
+try:
+    import py_hexp
+except ImportError:
+    # custom exponentiation is only compared where it is installed;
+    # see scripts/benchmark_hot_paths.py for the benchmark suite
+    py_hexp = None
 
 def random_hamiltonian(number_qubits):
     """
@@ -135,6 +140,8 @@ methods = {
     'csr_multiply' : sparse_expm_multiply_csr,
     'custom' : custom_exphm, 
 }
+if py_hexp is None:
+    methods.pop('custom')
 
 
 timings = pd.DataFrame()
@@ -135,6 +135,7 @@ if qmla_controls.pickle_qmla_instance:
 
 qmla_instance.analyse_instance()
 qmla_instance.plot_instance_outcomes()
+qmla_instance.export_trace()
 
 #########################
 # Wrap up
@@ -0,0 +1,50 @@
+import sys
+import os
+import glob
+import argparse
+
+p = os.path.abspath(os.path.realpath(__file__))
+elements = p.split("/")[:-2]
+qmla_root = os.path.abspath("/".join(elements))
+sys.path.append(qmla_root)
+
+import qmla.tracing
+
+r"""
+Merge the traces of each QMLA instance of a run launched with ``--trace``.
+
+QMLA instances merge their own traces when they finish
+(:meth:`~qmla.QuantumModelLearningAgent.export_trace`);
+this script re-merges them, e.g. for instances which crashed,
+or to include traces written by jobs which finished afterwards.
+Each directory ``traces/qmla_<id>`` of the run is merged to
+``traces/trace_qmla_<id>.json`` (open in ``chrome://tracing``
+or https://ui.perfetto.dev), with folded stacks for flame graphs
+in ``traces/trace_qmla_<id>.folded``.
+"""
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merge traces of QMLA instances.")
+    parser.add_argument(
+        "-dir",
+        "--results_directory",
+        help="Directory of the run, containing the traces directory.",
+        type=str,
+        default=os.getcwd(),
+    )
+    arguments = parser.parse_args()
+
+    traces_directory = os.path.join(arguments.results_directory, "traces")
+    for instance_directory in sorted(
+        glob.glob(os.path.join(traces_directory, "qmla_*"))
+    ):
+        merged_trace_file = os.path.join(
+            traces_directory,
+            "trace_{}.json".format(os.path.basename(instance_directory)),
+        )
+        num_spans = qmla.tracing.merge_traces(
+            instance_directory,
+            merged_trace_file,
+            folded_stacks_file=merged_trace_file.replace(".json", ".folded"),
+        )
+        print("Merged {} spans to {}".format(num_spans, merged_trace_file))
@@ -157,6 +157,14 @@ pickle.dump(
         arguments.system_measurements_file, 'wb'
     )
 )
+# and index them by time, for nearest-time lookups by all processes
+qmla.shared_functionality.experimental_data_processing.ExperimentalDataIndex.from_measurements(
+    true_system_measurements
+).save(
+    qmla.shared_functionality.experimental_data_processing.experimental_data_index_path(
+        arguments.system_measurements_file
+    )
+)
 
 # Store an example of the probes used
 exploration_class.generate_probes(
@@ -122,28 +122,40 @@ parser.add_argument(
     default=2
 )
 
+parser.add_argument(
+    '-dir', '--results_directory',
+    help='Directory of this run, where the fitted cost model is stored.',
+    type=str,
+    default=None
+)
+
+parser.add_argument(
+    '-hist', '--timings_history',
+    help='Directory containing previous runs, whose job timings the cost model is fitted to.',
+    action='append',
+    default=[],
+)
+
+parser.add_argument(
+    '-conf', '--confidence',
+    help='Confidence of the upper bounds of predicted times which are requested.',
+    type=float,
+    default=0.95
+)
+
+parser.add_argument(
+    '-rqtenv', '--rq_timeout_env_var',
+    help='Variable to store timeout of individual RQ jobs to.',
+    type=str,
+    default="RQ_TIMEOUT"
+)
+
 
 # Fill a dictionary of maximum number of models by qubit number/shape
 # shape more generally of form (num_qubits, num_terms)
 
 max_num_models_by_shape = {}
 
-# Hamiltonian exponentiation times from testing qutips
-# expm function 100 times for each qubit size.
-hamiltonian_exponentiation_times = {
-    1: 0.0010705208778381348,
-    2: 0.0005974793434143067,
-    3: 0.0017327165603637695,
-    4: 0.0013524317741394043,
-    5: 0.004202978610992432,
-    6: 0.0029761767387390136,
-    7: 0.024223911762237548,
-    8: 0.02105050325393677,
-    9: 0.08048738956451416,
-    10: 0.4869074869155884,
-    11: 2.693910768032074
-}
-
 
 # Functions
 
@@ -152,25 +164,32 @@ def time_required(
     exploration_strategies,
     num_particles,
     num_experiments,
+    cost_model,
     num_processes=1,
     resource_reallocation=False,
     # num_bayes_times=None,
     minimum_allowed_time=100,
     insurance_factor=2.5,
+    confidence=0.95,
     **kwargs
 ):
-    times_reqd = {}
+    r"""
+    Time to request for QMLA instances, predicted by the cost model.
 
-    num_hamiltonians_per_model = (
-        num_particles *
-        (2*num_experiments)
-    )
+    Each model learned (up to the exploration strategies'
+    ``max_num_models_by_shape``) is assumed to be compared about once,
+    replaying both models' experiments.
+    Models of the search are assumed to have as many terms as the true model.
+    Times requested are the upper bounds of the predictions,
+    multiplied by the insurance factors.
+    """
 
+    times_reqd = {}
     parallelisability = {}
+    instance_jobs = []
+    largest_jobs = []
 
     print("exploration strategies:", exploration_strategies)
-#  print("num models by shape:", generator_max_num_models_by_shape)
-    total_time_required = 0
     for gen in exploration_strategies:
         try:
             exploration_class = qmla.get_exploration_class(
@@ -186,9 +205,17 @@ def time_required(
 
         parallelisability[gen] = exploration_class.num_processes_to_parallelise_over
         max_num_qubits = exploration_class.max_num_qubits
+        job_features = {
+            'num_terms': exploration_class.model_constructor(
+                name=exploration_class.true_model
+            ).num_terms,
+            'num_particles': num_particles,
+            'expectation_value_function': qmla.expectation_value_function_name(
+                exploration_class
+            ),
+        }
 
         for q in range(1, max_num_qubits + 1):
-            time_per_hamiltonian = hamiltonian_exponentiation_times[q]
             try:
                 num_models_this_dimension = generator_max_num_models_by_shape[q]
             except BaseException:
@@ -199,20 +226,34 @@ def time_required(
             print("ES:", gen, "max num models for ", q, "qubits:",
                   num_models_this_dimension
                   )
-            time_this_dimension = (
-                num_hamiltonians_per_model *
-                time_per_hamiltonian *
-                num_models_this_dimension
+            learning_job = dict(
+                job_features,
+                job_type='learning',
+                num_qubits=q,
+                num_experiments=num_experiments,
             )
-
-            total_time_required += time_this_dimension
-
-    total_time_required = (
-        insurance_factor * np.round(total_time_required)
+            comparison_job = dict(
+                job_features,
+                job_type='comparison',
+                num_qubits=q,
+                num_experiments=2 * num_experiments,
+            )
+            instance_jobs.extend([
+                dict(learning_job, count=num_models_this_dimension),
+                dict(comparison_job, count=num_models_this_dimension),
+            ])
+            if q == max_num_qubits:
+                largest_jobs.extend([learning_job, comparison_job])
+
+    instance_time = cost_model.predict_total(instance_jobs, confidence=confidence)
+    print(
+        "Predicted time for QMLA instance: {:.0f}s ({:.0f}s - {:.0f}s)".format(
+            instance_time['median'], instance_time['lower'], instance_time['upper']
+        )
     )
     times_reqd['qmd'] = max(
         minimum_allowed_time,
-        int(total_time_required)
+        int(insurance_factor * instance_time['upper'])
     )
 
     # Get time for QHL
@@ -223,30 +264,36 @@ def time_required(
     highest_parallelisability = max(parallelisability.values())
     times_reqd['num_processes'] = highest_parallelisability
 
-    true_dimension = qmla.get_num_qubits(true_model)
-    qhl_insurance_factor = 1.5 # buffer to ensure finished in time
-    qhl_time = (
-        qhl_insurance_factor *
-        hamiltonian_exponentiation_times[true_dimension]
-        * num_particles
-        * num_experiments
+    qhl_time = cost_model.predict(
+        job_type='learning',
+        num_qubits=qmla.get_num_qubits(true_model),
+        num_experiments=num_experiments,
+        confidence=confidence,
+        **job_features
     )
     times_reqd['qhl'] = max(
         minimum_allowed_time,
-        int(qhl_time)
+        int(insurance_factor * qhl_time['upper'])
     )
 
     # For further qhl, want to account for possibility
     # that winning model is of maximum allowed dimension,
     # so need to request enough time for that case.
-    further_qhl_time = (
-        hamiltonian_exponentiation_times[max_num_qubits]
-        * num_hamiltonians_per_model
-    )
+    further_qhl_time = cost_model.predict_total(largest_jobs, confidence=confidence)
     times_reqd['fqhl'] = max(
         minimum_allowed_time,
-        int(further_qhl_time)
+        int(insurance_factor * further_qhl_time['upper'])
+    )
+
+    # No single job should take longer than the largest
+    largest_job_time = max(
+        [
+            cost_model.predict(confidence=confidence, **job)['upper']
+            for job in largest_jobs
+        ]
     )
+    times_reqd['rq_timeout'] = int(insurance_factor * largest_job_time)
+
     for k in ['qmd', 'qhl', 'fqhl']:
         times_reqd[k] *= exploration_class.timing_insurance_factor
         times_reqd[k] =  max(
@@ -254,6 +301,10 @@ def time_required(
             int(times_reqd[k])
         )
         times_reqd[k] = int(times_reqd[k])
+    # jobs can't outlast the instance
+    times_reqd['rq_timeout'] = min(
+        times_reqd['rq_timeout'], max(times_reqd['qmd'], times_reqd['fqhl'])
+    )
     print("Time to request:\n", times_reqd)
     return times_reqd
 
@@ -279,6 +330,23 @@ fqhl_time_env_var = arguments.fqhl_time_env_var
 num_processes_env_var = arguments.num_processes_env_var
 minimum_allowed_time = arguments.minimum_allowed_time
 time_insurance_factor = float(arguments.time_insurance_factor)
+results_directory = arguments.results_directory
+timings_history = arguments.timings_history
+confidence = arguments.confidence
+rq_timeout_env_var = arguments.rq_timeout_env_var
+
+# Fit cost model to the timings of jobs of previous runs (and this run, if resumed),
+# and store it with this run, for QMLA instances to set the timeouts of jobs
+timings_directories = list(timings_history)
+if results_directory is not None:
+    timings_directories.append(results_directory)
+job_timings = qmla.load_job_timings(timings_directories)
+cost_model = qmla.CostModel().fit(job_timings)
+print("Cost model fitted to {} job timings".format(len(job_timings)))
+if results_directory is not None:
+    cost_model.save(
+        os.path.join(results_directory, qmla.cost_model.cost_model_file_name)
+    )
 
 # print("all exploration strategies:", all_exploration_strategies)
 # print("alternative_exploration_strategies:", alternative_exploration_strategies)
@@ -292,6 +360,8 @@ time_reqd = time_required(
     resource_reallocation=resource_reallocation,
     # num_bayes_times=num_bayes_times,
     minimum_allowed_time=minimum_allowed_time,
+    cost_model=cost_model,
+    confidence=confidence,
 )
 
 
@@ -315,6 +385,8 @@ with open(variable_setting_script, 'a+') as script:
         fqhl_time_env_var, "=", time_reqd['fqhl'],
         "\n",
         num_processes_env_var, "=", time_reqd['num_processes'],
+        "\n",
+        rq_timeout_env_var, "=", time_reqd['rq_timeout'],
         sep='',
         file=script
     )
@@ -0,0 +1,109 @@
+import pickle
+
+import pytest
+import numpy as np
+import qmla
+
+
+def comparison_model(tmp_path, model_name, true_model_constructor, probes, experiments):
+    probes_plot_file = str(tmp_path / "plot_probes.p")
+    with open(probes_plot_file, "wb") as f:
+        pickle.dump({2: probes[(0, 2)]}, f)
+    experimental_data_index_file = str(tmp_path / "experimental_data_index.npy")
+    qmla.shared_functionality.experimental_data_processing.ExperimentalDataIndex.from_measurements(
+        {}
+    ).save(
+        experimental_data_index_file
+    )
+
+    qmla_settings = {
+        "probes_plot_file": probes_plot_file,
+        "plots_directory": str(tmp_path),
+        "debug_mode": False,
+        "plot_level": 0,
+        "figure_format": "png",
+        "num_experiments": 10,
+        "num_particles": 200,
+        "num_probes": 5,
+        "true_oplist": true_model_constructor.terms_matrices,
+        "true_model_terms_params": true_model_constructor.fixed_matrix,
+        "true_name": true_model_constructor.name,
+        "true_param_dict": {},
+        "true_model_constructor": true_model_constructor,
+        "true_hamiltonian_spectrum": None,
+        "experimental_measurements": {},
+        "experimental_measurement_times": [],
+        "experimental_data_index_file": experimental_data_index_file,
+        "results_directory": str(tmp_path),
+        "operator_cache_size": 2048,
+        "operator_cache_directory": None,
+    }
+    num_terms = len(model_name.split("+"))
+    learned_model_info = {
+        "name": model_name,
+        "times_learned_over": [],
+        "final_learned_params": np.ones((num_terms, 2)),
+        "exploration_strategy_of_this_model": "ExplorationStrategy",
+        "posterior_marginal": [],
+        "model_normalization_record": [],
+        "log_total_likelihood": 0,
+        "estimated_mean_params": np.full(num_terms, 0.5),
+        "qhl_final_param_estimates": {},
+        "qhl_final_param_uncertainties": {},
+        "covariance_mtx_final": np.eye(num_terms) * 0.05,
+        "expectation_values": {},
+        "learned_hamiltonian": None,
+        "track_experiment_parameters": experiments,
+    }
+    return qmla.ModelInstanceForComparison(
+        model_id=1,
+        qid=0,
+        opponent=2,
+        qmla_core_info_database={
+            "qmla_settings": qmla_settings,
+            "probes_system": probes,
+            "probes_simulator": probes,
+        },
+        learned_model_info=learned_model_info,
+        log_file=str(tmp_path / "qmla_log.log"),
+    )
+
+
+@pytest.mark.skipif(
+    not hasattr(np, "int"), reason="QInfer requires numpy < 1.24 (np.int)"
+)
+def test_batch_replay_matches_sequential(tmp_path):
+    exploration_strategy = qmla.get_exploration_strategy.get_exploration_class(
+        "ExplorationStrategy", log_file=str(tmp_path / "qmla_log.log")
+    )
+    exploration_strategy.generate_probes(probe_maximum_number_qubits=2)
+    true_model_constructor = qmla.shared_functionality.model_constructors.BaseModel(
+        name="pauliSet_1J2_zJz_d2+pauliSet_1_x_d2",
+        fixed_parameters=[0.3, 0.7],
+    )
+
+    rng = np.random.RandomState(1)
+    experiments = []
+    for _ in range(60):
+        experiment = np.zeros(1, dtype=[("t", "float"), ("probe_id", "int")])
+        experiment["t"] = rng.uniform(0, 10)
+        experiment["probe_id"] = rng.randint(5)
+        experiments.append(experiment)
+
+    log_likelihoods = {}
+    for batch_replay in [False, True]:
+        np.random.seed(7)
+        model = comparison_model(
+            tmp_path,
+            model_name="pauliSet_1J2_zJz_d2+pauliSet_2_x_d2",
+            true_model_constructor=true_model_constructor,
+            probes=exploration_strategy.probes_system,
+            experiments=experiments[:5],
+        )
+        log_likelihoods[batch_replay] = model.update_log_likelihood(
+            new_times=[e["t"] for e in experiments],
+            new_experimental_params=experiments,
+            batch_replay=batch_replay,
+        )
+
+    assert log_likelihoods[True] == log_likelihoods[False]
@@ -0,0 +1,22 @@
+import threading
+import time
+
+import qmla
+
+
+def test_local_completion_channel_wakes_on_publish():
+    channel = qmla.completion_events.LocalCompletionChannel()
+    assert channel.wait(timeout=0.01) == []
+
+    channel.publish(qmla.completion_events.learning_event, 1)
+    channel.publish(qmla.completion_events.comparison_event, 2)
+    assert channel.wait(timeout=1) == [("learning", 1), ("comparison", 2)]
+
+    publisher = threading.Timer(
+        0.1, channel.publish, args=(qmla.completion_events.learning_event, 3)
+    )
+    t_init = time.time()
+    publisher.start()
+    events = channel.wait(timeout=10)
+    assert events == [("learning", 3)]
+    assert time.time() - t_init < 5, "Waiting did not return on publish"
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+import qmla
+
+
+def test_cost_model_fitted_to_recorded_timings(tmp_path):
+    rng = np.random.RandomState(1)
+
+    def true_time(num_qubits, num_particles, num_experiments):
+        return 2e-4 * 2 ** num_qubits * num_particles * num_experiments
+
+    for run in ["run_1", "run_2"]:
+        for _ in range(40):
+            features = {
+                "num_qubits": int(rng.randint(1, 7)),
+                "num_terms": int(rng.randint(1, 10)),
+                "num_particles": int(rng.choice([100, 500, 1000])),
+                "num_experiments": int(rng.choice([50, 200, 500])),
+                "expectation_value_function": "default_expectation_value",
+            }
+            duration = true_time(
+                features["num_qubits"],
+                features["num_particles"],
+                features["num_experiments"],
+            ) * np.exp(rng.normal(scale=0.1))
+            qmla.record_job_timing(
+                str(tmp_path / run), job_type="learning", duration=duration, **features
+            )
+
+    job_timings = qmla.load_job_timings([str(tmp_path), str(tmp_path / "run_1")])
+    assert len(job_timings) == 80
+    cost_model = qmla.CostModel().fit(job_timings)
+
+    job = {
+        "num_qubits": 4,
+        "num_terms": 3,
+        "num_particles": 500,
+        "num_experiments": 200,
+        "expectation_value_function": "default_expectation_value",
+    }
+    prediction = cost_model.predict("learning", **job)
+    assert prediction["median"] == pytest.approx(true_time(4, 500, 200), rel=0.2)
+    assert prediction["lower"] < true_time(4, 500, 200) < prediction["upper"]
+    assert prediction["upper"] / prediction["lower"] < 2
+
+    instance = cost_model.predict_total([dict(job, job_type="learning", count=3)])
+    assert instance["median"] == pytest.approx(3 * prediction["median"])
+
+    # comparisons were not recorded: analytic estimate, with wide bounds
+    comparison = cost_model.predict("comparison", **job)
+    assert comparison["upper"] / comparison["lower"] > 10
+
+    cost_model_file = str(tmp_path / "cost_model.json")
+    cost_model.save(cost_model_file)
+    assert qmla.CostModel.load(cost_model_file).predict("learning", **job) == (
+        pytest.approx(prediction)
+    )
+
+
+def test_job_timeouts_clear_recorded_times():
+    rng = np.random.RandomState(2)
+    job = {
+        "num_qubits": 3,
+        "num_terms": 2,
+        "num_particles": 500,
+        "num_experiments": 200,
+        "expectation_value_function": "default_expectation_value",
+    }
+    durations = 30 * np.exp(rng.normal(scale=0.5, size=500))
+    cost_model = qmla.CostModel().fit(
+        [dict(job, job_type="learning", duration=d) for d in durations]
+    )
+
+    # no good job is killed, even the slowest of many
+    timeout = cost_model.job_timeout(job_type="learning", **job)
+    upper = cost_model.predict("learning", confidence=0.999, **job)["upper"]
+    assert timeout == int(np.ceil(2.5 * upper))
+    assert timeout > durations.max()
+
+    assert (
+        cost_model.job_timeout(job_type="learning", maximum_timeout=100, **job) == 100
+    )
+    assert (
+        cost_model.job_timeout(job_type="learning", insurance_factor=1e-6, **job) == 60
+    )
@@ -0,0 +1,52 @@
+import numpy as np
+import qmla
+from qmla.shared_functionality import early_stopping
+
+
+def test_early_stopping_criteria_on_recorded_epochs():
+    recorder = qmla.EpochRecorder(
+        num_epochs=5, model_terms_names=["a", "b"], true_param_dict={}
+    )
+
+    def record(volume, uncertainty, ess, just_resampled=False):
+        recorder.record(
+            param_means=np.array([1.0, 0.0]),
+            covariance_mtx=np.diag([uncertainty ** 2] * 2),
+            volume=volume,
+            effective_sample_size=ess,
+            just_resampled=just_resampled,
+        )
+
+    plateau = early_stopping.VolumePlateau(window=5, tolerance=0.1)
+    uncertainty = early_stopping.ParameterUncertaintyRatio(threshold=0.01)
+    ess_stable = early_stopping.EffectiveSampleSizeStability(window=5, tolerance=0.01)
+    stopping = early_stopping.EarlyStopping(
+        criteria=[plateau, uncertainty], minimum_experiments=12, require_all=True
+    )
+
+    # learning: volume, uncertainty and ESS decrease
+    record(volume=1.0, uncertainty=1.0, ess=1000)
+    for epoch in range(1, 11):
+        record(volume=0.5 ** epoch, uncertainty=0.5 ** epoch, ess=1000 - 50 * epoch)
+    assert not plateau(recorder)
+    assert not ess_stable(recorder)
+    assert stopping.check(recorder) is None
+
+    # converged: volume and ESS unchanged, uncertainty below 1% of 1 and 1e-3
+    for epoch in range(11, 16):
+        record(volume=0.5 ** 10, uncertainty=1e-6, ess=500)
+    assert plateau(recorder)
+    assert uncertainty(recorder)
+    assert ess_stable(recorder)
+    assert "VolumePlateau" in stopping.check(recorder)
+
+    # resampling within the window: ESS is not stable
+    record(volume=0.5 ** 10, uncertainty=1e-6, ess=500, just_resampled=True)
+    assert not ess_stable(recorder)
+
+    # guard: criteria not considered before minimum_experiments
+    stopping.minimum_experiments = 20
+    assert stopping.check(recorder) is None
+
+    # no criteria: learning never stops early
+    assert early_stopping.EarlyStopping().check(recorder) is None
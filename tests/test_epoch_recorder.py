@@ -0,0 +1,42 @@
+import pytest
+import numpy as np
+import qmla
+
+
+def test_epoch_recorder_matches_per_epoch_quantities():
+    terms = ["pauliSet_1_x_d2", "pauliSet_2_y_d2"]
+    true_params = {"pauliSet_1_x_d2": 0.3, "pauliSet_1J2_zJz_d2": 0.6}
+    # allocated for fewer epochs than recorded, so the recorder must grow
+    recorder = qmla.EpochRecorder(
+        num_epochs=3,
+        model_terms_names=terms,
+        true_param_dict=true_params,
+        track_covariance_matrices=True,
+    )
+
+    means = np.random.rand(10, 2)
+    covariances = [np.diag(np.random.rand(2)) for _ in range(10)]
+    for epoch in range(10):
+        recorder.record(
+            param_means=means[epoch],
+            covariance_mtx=covariances[epoch],
+            experiment_id=epoch,
+            volume=float(epoch),
+            probe_id=epoch % 3,
+        )
+
+    assert len(recorder) == 10
+    assert np.array_equal(recorder.param_means, means)
+    assert np.allclose(
+        recorder.param_uncertainties, [np.sqrt(np.diag(c)) for c in covariances]
+    )
+    assert np.array_equal(recorder.covariance_matrices, covariances)
+    assert np.array_equal(recorder.volumes, np.arange(10))
+    expected_losses = (means[:, 0] - 0.3) ** 2 + (means[:, 1] - 0) ** 2 + (0 - 0.6) ** 2
+    assert np.allclose(recorder.quadratic_losses, expected_losses)
+
+    progress = recorder.to_dataframe(model_id=4)
+    assert len(progress) == 10
+    assert (progress["model_id"] == 4).all()
+    assert list(progress["probe_id"]) == [e % 3 for e in range(10)]
+    assert np.isnan(progress["experiment_time"]).all()  # not recorded
@@ -0,0 +1,188 @@
+import pytest
+import numpy as np
+import qmla
+
+
+def test_batched_expectation_values_match_default():
+    model = qmla.shared_functionality.model_constructors.BaseModel(
+        name="pauliSet_1J2_xJx_d2+pauliSet_1_z_d2"
+    )
+    particles = np.random.rand(10, model.num_terms)
+    probe = qmla.shared_functionality.probe_set_generation.random_probe(2)
+    times = [0.5, 3.0]
+
+    hamiltonians = np.tensordot(particles, np.array(model.terms_matrices), axes=1)
+    batched = qmla.shared_functionality.expectation_value_functions.batched_expectation_values(
+        hamiltonians=hamiltonians, times=times, state=probe
+    )
+    looped = np.array(
+        [
+            [
+                qmla.shared_functionality.expectation_value_functions.default_expectation_value(
+                    ham=model.construct_matrix(p), t=t, state=probe
+                )
+                for t in times
+            ]
+            for p in particles
+        ]
+    )
+    assert np.allclose(batched, looped), "Batched likelihoods differ from default"
+
+
+def test_krylov_expectation_value_matches_default():
+    model = qmla.shared_functionality.model_constructors.BaseModel(
+        name="pauliSet_1J2_zJz_d3+pauliSet_2J3_zJz_d3+pauliSet_1_x_d3"
+    )
+    ham = model.construct_matrix(np.random.rand(model.num_terms))
+    probe = qmla.shared_functionality.probe_set_generation.random_probe(3)
+
+    dense = qmla.shared_functionality.expectation_value_functions.default_expectation_value(
+        ham=ham, t=2.0, state=probe
+    )
+    krylov = qmla.shared_functionality.expectation_value_functions.size_dependent_expectation_value(
+        ham=ham, t=2.0, state=probe, dimension_threshold=2
+    )
+    assert np.isclose(dense, krylov), "Krylov expectation value differs from default"
+
+
+def test_particle_spectrum_cache_reused_until_invalidated():
+    model = qmla.shared_functionality.model_constructors.BaseModel(
+        name="pauliSet_1J2_xJx_d2+pauliSet_1_z_d2"
+    )
+    particles = np.random.rand(10, model.num_terms)
+    num_constructions = []
+
+    def hamiltonians_constructor(p):
+        num_constructions.append(1)
+        return np.tensordot(p, np.array(model.terms_matrices), axes=1)
+
+    ParticleSpectrumCache = (
+        qmla.shared_functionality.qinfer_model_interface.ParticleSpectrumCache
+    )
+    cache = ParticleSpectrumCache()
+    eigenvalues, eigenvectors = cache.get(particles, hamiltonians_constructor)
+    cache.get(particles.copy(), hamiltonians_constructor)
+    assert len(num_constructions) == 1
+    assert cache.hit_rate == 0.5
+    assert (
+        cache.num_bytes == particles.nbytes + eigenvalues.nbytes + eigenvectors.nbytes
+    )
+
+    cache.get(particles + 0.1, hamiltonians_constructor)
+    cache.invalidate()
+    cache.get(particles, hamiltonians_constructor)
+    assert len(num_constructions) == 3
+    assert cache.info()["invalidations"] == 1
+
+    bounded_cache = ParticleSpectrumCache(max_bytes=eigenvectors.nbytes)
+    bounded_cache.get(particles, hamiltonians_constructor)
+    assert bounded_cache.num_bytes == 0
+
+    # diagonalised in batches of particles, bounding memory
+    batched_eigenvalues, batched_eigenvectors = ParticleSpectrumCache().get(
+        particles, hamiltonians_constructor, batch_size=3
+    )
+    assert len(num_constructions) == 8
+    assert np.allclose(batched_eigenvalues, eigenvalues)
+    reconstructed = (
+        batched_eigenvectors * batched_eigenvalues[:, np.newaxis, :]
+    ) @ batched_eigenvectors.conj().transpose(0, 2, 1)
+    assert np.allclose(reconstructed, hamiltonians_constructor(particles))
+
+
+def test_probability_sketch_quantiles_match_percentiles():
+    sketch = qmla.shared_functionality.qinfer_model_interface.ProbabilitySketch(
+        num_bins=1000
+    )
+    batches = [np.random.beta(2, 5, size=(100, 1)) for _ in range(20)]
+    for values in batches:
+        sketch.update(values)
+    values = np.concatenate(batches).ravel()
+
+    info = sketch.info()
+    assert info["count"] == values.size
+    assert abs(info["mean"] - np.mean(values)) <= 1e-3
+    assert abs(info["std"] - np.std(values)) <= 1e-3
+    for q, name in [(25, "lower_quartile"), (50, "median"), (75, "upper_quartile")]:
+        assert abs(info[name] - np.percentile(values, q)) <= 2e-3
+
+
+def test_spectral_hahn_evolution_matches_partial_trace():
+    from scipy.linalg import expm
+
+    evf = qmla.shared_functionality.expectation_value_functions
+    model = qmla.shared_functionality.model_constructors.BaseModel(
+        name="pauliSet_1J2_zJz_d3+pauliSet_1J3_zJz_d3+pauliSet_1_x_d3"
+    )
+    particles = np.random.rand(5, model.num_terms)
+    probe = qmla.shared_functionality.probe_set_generation.random_probe(3)
+    times = [0.5, 3.0]
+    inversion_gate = evf.hahn_inversion_gate(3, "y")
+
+    def hahn_likelihood(ham, t):
+        unitary = expm(-1j * ham * t)
+        evolved = unitary @ unitary @ inversion_gate @ unitary @ probe
+        reduced = evf.partial_trace(np.outer(evolved, evolved.conj()), [0, 1])
+        reduced_probe = evf.partial_trace(np.outer(probe, probe.conj()), [0, 1])
+        return 1 - np.abs(np.trace(reduced_probe @ reduced))
+
+    hamiltonians = np.tensordot(particles, np.array(model.terms_matrices), axes=1)
+    eigenvalues, eigenvectors = np.linalg.eigh(hamiltonians)
+    spectral = evf.spectral_hahn_evolution(
+        eigenvalues=eigenvalues,
+        eigenvectors=eigenvectors,
+        times=times,
+        state=probe,
+        second_time_evolution_factor=2,
+    )
+    expected = np.array([[hahn_likelihood(h, t) for t in times] for h in hamiltonians])
+    assert np.allclose(spectral, expected), "Hahn echo likelihoods differ"
+    assert np.isclose(
+        evf.n_qubit_hahn_evolution_double_time_reverse(
+            ham=hamiltonians[0], t=times[0], state=probe
+        ),
+        expected[0, 0],
+    )
+
+
+def test_hahn_inversion_gates_match_exponentiation():
+    evf = qmla.shared_functionality.expectation_value_functions
+    for num_qubits in range(1, 4):
+        assert np.allclose(
+            evf.hahn_inversion_gate(num_qubits, "y"),
+            evf.make_inversion_gate_rotate_y(num_qubits),
+        )
+        assert np.allclose(
+            evf.hahn_inversion_gate(num_qubits, "z"),
+            evf.make_inversion_gate(num_qubits),
+        )
+    assert evf.hahn_inversion_gate(9).shape == (2 ** 9, 2 ** 9)
+    with pytest.raises(ValueError):
+        evf.hahn_inversion_gate(2, "x")
+
+
+def test_liouvillian_fidelities_match_matrix_square_roots():
+    from scipy import linalg
+
+    model = qmla.shared_functionality.model_constructors.LiouvillianModel(
+        name="HamLiouvillian_lx_1J2_d2+DissLiouvillian_1A_lz_1_~_1B_ls_2_d2"
+    )
+    particles = np.random.rand(6, model.num_parameters)
+    liouvillians = model.construct_matrices(particles)
+    # mixed two qubit probe, flattened
+    probe = qmla.shared_functionality.probe_set_generation.random_probe(2)
+    rho = 0.7 * np.outer(probe, probe.conj()) + 0.3 * np.eye(4) / 4
+    times = [0.4, 2.0]
+
+    batched = qmla.shared_functionality.expectation_value_functions.liouvillian_evolve_fidelities(
+        liouvillians=liouvillians, times=times, state=rho.flatten()
+    )
+    for p, liouvillian in enumerate(liouvillians):
+        for i, t in enumerate(times):
+            evolved = np.dot(linalg.expm(liouvillian * t), rho.flatten()).reshape(4, 4)
+            sqrt_evolved = linalg.sqrtm(evolved)
+            fidelity = (
+                np.trace(linalg.sqrtm(np.dot(sqrt_evolved, np.dot(rho, sqrt_evolved))))
+                ** 2
+            )
+            assert np.isclose(batched[p, i], np.real(fidelity), atol=1e-6)
@@ -0,0 +1,31 @@
+import pytest
+import numpy as np
+import qmla
+
+
+def test_experimental_data_index_matches_nearest_time_lookup(tmp_path):
+    data_processing = qmla.shared_functionality.experimental_data_processing
+    times = sorted(np.round(np.random.uniform(0, 10, 200), 3).tolist())
+    measurements = {t: np.random.rand() for t in times}
+    index = data_processing.ExperimentalDataIndex.from_measurements(measurements)
+
+    queries = np.concatenate(
+        [np.random.uniform(-1, times[-1], 100), times[:5], [times[-1]]]
+    )
+    expected_times = [
+        data_processing.nearest_experimental_time_available(times, t) for t in queries
+    ]
+    assert np.array_equal(index.nearest_times(queries), expected_times)
+    assert np.array_equal(
+        index.nearest_expectation_values(queries),
+        [measurements[t] for t in expected_times],
+    )
+    # equally close: the smaller time is used
+    tied_index = data_processing.ExperimentalDataIndex([1.0, 2.0], [0.1, 0.2])
+    assert tied_index.nearest_times([1.5])[0] == 1.0
+
+    index_file = str(tmp_path / "experimental_data_index.npy")
+    index.save(index_file)
+    loaded = data_processing.ExperimentalDataIndex.load(index_file)
+    assert isinstance(loaded.times, np.memmap)
+    assert np.array_equal(loaded.nearest_times(queries), expected_times)
@@ -0,0 +1,41 @@
+import importlib
+import importlib.util
+import subprocess
+import sys
+
+import qmla
+
+
+def test_import_qmla_is_lazy():
+    check_imports = "\n".join(
+        [
+            "import sys",
+            "import qmla",
+            "assert 'qmla.quantum_model_learning_agent' not in sys.modules",
+            "assert 'qmla.analysis' not in sys.modules",
+            "assert 'seaborn' not in sys.modules",
+            "qmla.ModelInstanceForComparison",
+            "assert 'qmla.model_for_comparison' in sys.modules",
+            "assert 'qmla.analysis' not in sys.modules",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", check_imports], check=True)
+
+
+def test_lazy_attributes_match_submodules():
+    for package in [qmla, qmla.shared_functionality]:
+        for submodule_name, names in package._submodule_exports.items():
+            submodule = importlib.import_module(
+                "{}.{}".format(package.__name__, submodule_name)
+            )
+            if hasattr(submodule, "__all__"):
+                # only names which would shadow a submodule are omitted
+                for name in set(submodule.__all__) - set(names):
+                    assert importlib.util.find_spec(
+                        "{}.{}".format(package.__name__, name)
+                    ), name
+            for name in names:
+                assert getattr(package, name) is getattr(submodule, name)
+    assert qmla.shared_functionality.probe_set_generation.__name__ == (
+        "qmla.shared_functionality.probe_set_generation"
+    )
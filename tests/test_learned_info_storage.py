@@ -0,0 +1,37 @@
+import pytest
+import numpy as np
+import pandas as pd
+import qmla
+
+
+def test_learned_info_round_trip():
+    learned_info = {
+        "name": "pauliSet_1_x_d1",
+        "learned_hamiltonian": np.random.rand(4, 4) + 1j * np.random.rand(4, 4),
+        "track_param_means": [np.random.rand(3) for _ in range(50)],
+        "qhl_final_param_estimates": {"pauliSet_1_x_d1": 0.5},
+        "progress_tracker": pd.DataFrame({"epoch": range(500)}),
+        "times_learned_over": np.linspace(0, 10, 5000),
+    }
+    encoded = qmla.learned_info_storage.encode_learned_info(learned_info)
+    assert (
+        len(encoded["times_learned_over"]) < learned_info["times_learned_over"].nbytes
+    )
+
+    decoded = qmla.learned_info_storage.decode_learned_info(encoded)
+    assert decoded.keys() == learned_info.keys()
+    assert np.array_equal(
+        decoded["learned_hamiltonian"], learned_info["learned_hamiltonian"]
+    )
+    assert np.array_equal(
+        decoded["times_learned_over"], learned_info["times_learned_over"]
+    )
+    assert decoded["qhl_final_param_estimates"] == {"pauliSet_1_x_d1": 0.5}
+    assert decoded["progress_tracker"].equals(learned_info["progress_tracker"])
+
+    partial = qmla.learned_info_storage.decode_learned_info(encoded, fields=["name"])
+    assert partial == {"name": "pauliSet_1_x_d1"}
+
+    encoded["__version__"] = b"0"
+    with pytest.raises(ValueError):
+        qmla.learned_info_storage.decode_learned_info(encoded)
@@ -0,0 +1,92 @@
+import time
+
+import pytest
+import redis
+
+import qmla
+
+
+def increment_counter(host_name, port_number, qmla_id, branch_id):
+    redis_databases = qmla.redis_settings.get_redis_databases_by_qmla_id(
+        host_name, port_number, qmla_id
+    )
+    redis_databases["active_branches_learning_models"].incr(int(branch_id), 1)
+    qmla.completion_events.RedisCompletionChannel(
+        redis_databases["completion_events"]
+    ).publish(qmla.completion_events.learning_event, branch_id)
+
+
+def test_local_backend_runs_jobs_on_local_databases():
+    backend = qmla.local_backend.LocalParallelBackend(
+        host_name="localhost", port_number=0, qmla_id=1, num_workers=2
+    )
+    try:
+        for i in range(4):
+            backend.submit(
+                "job_{}".format(i),
+                increment_counter,
+                host_name="localhost",
+                port_number=0,
+                qmla_id=1,
+                branch_id=1,
+            )
+        channel = qmla.completion_events.RedisCompletionChannel(
+            backend.databases["completion_events"]
+        )
+        events = []
+        while len(events) < 4:
+            new_events = channel.wait(timeout=10)
+            assert new_events, "Local jobs did not announce completion"
+            events.extend(new_events)
+        assert events == [("learning", 1)] * 4
+
+        counters = backend.databases["active_branches_learning_models"]
+        assert counters.get(1) == b"4"
+        with pytest.raises(redis.exceptions.ResponseError):
+            counters.hget(1, "x")
+        backend.raise_failed_jobs()
+    finally:
+        backend.shutdown()
+
+
+def record_job(host_name, port_number, qmla_id, name, wait_for_release=False):
+    redis_databases = qmla.redis_settings.get_redis_databases_by_qmla_id(
+        host_name, port_number, qmla_id
+    )
+    database = redis_databases["any_job_failed"]
+    while wait_for_release and database.get("release") is None:
+        time.sleep(0.01)
+    database.rpush("jobs_run", name)
+
+
+def test_local_backend_starts_jobs_by_priority():
+    backend = qmla.local_backend.LocalParallelBackend(
+        host_name="localhost", port_number=0, qmla_id=2, num_workers=1
+    )
+    try:
+        settings = {"host_name": "localhost", "port_number": 0, "qmla_id": 2}
+        # occupies the only worker while the other jobs are queued
+        backend.submit(
+            "first", record_job, name="first", wait_for_release=True, **settings
+        )
+        jobs = [
+            backend.submit(job_name, record_job, name=job_name, **settings)
+            for job_name in ["learn_1", "learn_2"]
+        ]
+        jobs.append(
+            backend.submit(
+                "compare", record_job, priority=1, name="compare", **settings
+            )
+        )
+        database = backend.databases["any_job_failed"]
+        database.set("release", 1)
+        for job in jobs:
+            job.result(timeout=30)
+        assert database.lrange("jobs_run", 0, -1) == [
+            b"first",
+            b"compare",
+            b"learn_1",
+            b"learn_2",
+        ]
+    finally:
+        backend.shutdown()
@@ -0,0 +1,48 @@
+import pytest
+import qmla
+
+
+def test_buffered_log_entries_written_in_order(tmp_path):
+    log_files = [str(tmp_path / "a.log"), str(tmp_path / "b.log")]
+    for i in range(100):
+        qmla.logging.print_to_log(
+            ["entry", i], log_file=log_files[i % 2], log_identifier="test"
+        )
+
+    def expensive_message():
+        raise AssertionError("debug messages should not be formatted")
+
+    qmla.logging.print_to_log(
+        expensive_message, log_file=log_files[0], level=qmla.logging.DEBUG
+    )
+    qmla.logging.flush_logs()
+
+    for j, log_file in enumerate(log_files):
+        with open(log_file) as f:
+            lines = f.readlines()
+        assert [line.split("] ")[1] for line in lines] == [
+            "entry {}\n".format(i) for i in range(j, 100, 2)
+        ]
+        assert all(["[test]" in line for line in lines])
+
+
+def test_log_level_filters_entries(tmp_path):
+    log_file = str(tmp_path / "levels.log")
+    try:
+        for level in [qmla.logging.INFO, qmla.logging.DEBUG]:
+            qmla.logging.configure_logging(level=level)
+            qmla.logging.print_to_log(
+                ["debug at", level], log_file=log_file, level=qmla.logging.DEBUG
+            )
+            qmla.logging.print_to_log(["info at", level], log_file=log_file)
+        qmla.logging.flush_logs()
+    finally:
+        qmla.logging.configure_logging(level=qmla.logging.INFO)
+
+    with open(log_file) as f:
+        messages = [line.split("] ")[1] for line in f.readlines()]
+    assert messages == [
+        "info at {}\n".format(qmla.logging.INFO),
+        "debug at {}\n".format(qmla.logging.DEBUG),
+        "info at {}\n".format(qmla.logging.DEBUG),
+    ]
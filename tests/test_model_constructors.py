@@ -0,0 +1,46 @@
+import pytest
+import numpy as np
+import qmla
+
+
+def test_sparse_model_matches_dense():
+    name = "pauliSet_1J3_yJz_d3+pauliSet_2J3_xJy_d3+pauliSet_2_y_d3"
+    parameters = np.random.rand(3)
+    dense_model = qmla.shared_functionality.model_constructors.BaseModel(name=name)
+    sparse_model = qmla.shared_functionality.model_constructors.SparseModel(name=name)
+
+    dense = dense_model.construct_matrix(parameters)
+    sparse = sparse_model.construct_matrix(parameters)
+    assert np.allclose(sparse.toarray(), dense), "Sparse model differs from dense"
+
+
+def test_operator_cache_reuses_terms():
+    cache = qmla.operator_cache.OperatorCache(max_size=2)
+    cache.get(key="a", constructor=lambda: np.eye(2))
+    cache.get(key="a", constructor=lambda: np.eye(2))
+    cache.get(key="b", constructor=lambda: np.eye(2))
+    cache.get(key="c", constructor=lambda: np.eye(2))
+    assert cache.hits == 1 and cache.misses == 3, "Operator cache counters incorrect"
+    assert cache.info()["size"] == 2, "Operator cache exceeded max_size"
+
+
+def test_liouvillian_superoperator_basis_matches_dissipator():
+    model = qmla.shared_functionality.model_constructors.LiouvillianModel(
+        name="HamLiouvillian_ly_1_2_d2+DissLiouvillian_1A_lz_1_~_1B_lx_2_d2"
+    )
+    particles = np.random.rand(4, model.num_parameters)
+    pauli = qmla.model_building_utilities.core_operator_dict
+
+    for particle, liouvillian in zip(particles, model.construct_matrices(particles)):
+        # parameters follow the alphabetised name: dissipator, then Hamiltonian
+        jump = particle[0] * np.kron(pauli["z"], np.eye(2)) + particle[1] * np.kron(
+            np.eye(2), pauli["x"]
+        )
+        hamiltonian = particle[2] * (
+            np.kron(pauli["y"], np.eye(2)) + np.kron(np.eye(2), pauli["y"])
+        )
+        expected = model.hamiltonian_to_liouvillian(
+            hamiltonian
+        ) + model.lindblad_to_liouvillian(jump)
+        assert np.allclose(liouvillian, expected)
+        assert np.allclose(model.construct_matrix(particle), expected)
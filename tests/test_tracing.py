@@ -0,0 +1,40 @@
+import json
+import pytest
+import qmla
+
+
+def test_nested_spans_merged_into_chrome_trace(tmp_path):
+    trace_directory = str(tmp_path / "qmla_1")
+
+    @qmla.tracing.traced(category="learning")
+    def learn():
+        with qmla.tracing.span("update", category="learning", epoch=0):
+            pass
+
+    learn()  # not traced
+    qmla.tracing.configure_tracing(trace_directory, process_name="test")
+    try:
+        with qmla.tracing.span("outer", category="qmla"):
+            learn()
+        qmla.tracing.write_trace()
+    finally:
+        qmla.tracing.configure_tracing(None)
+    assert not qmla.tracing.tracing_enabled()
+
+    merged_file = str(tmp_path / "trace.json")
+    folded_file = str(tmp_path / "trace.folded")
+    assert qmla.tracing.merge_traces(trace_directory, merged_file, folded_file) == 3
+
+    with open(merged_file) as f:
+        events = json.load(f)["traceEvents"]
+    spans = {e["name"]: e for e in events if e["ph"] == "X"}
+    assert set(spans) == {"outer", learn.__qualname__, "update"}
+    outer, update = spans["outer"], spans["update"]
+    assert update["args"] == {"epoch": "0"}
+    assert outer["ts"] <= update["ts"]
+    assert update["ts"] + update["dur"] <= outer["ts"] + outer["dur"]
+    assert events[0]["ph"] == "M" and "test" in events[0]["args"]["name"]
+
+    with open(folded_file) as f:
+        stacks = [line.rsplit(" ", 1)[0] for line in f]
+    assert stacks[-1].startswith("outer;") and stacks[-1].endswith(";update")
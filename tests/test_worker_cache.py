@@ -0,0 +1,20 @@
+import os
+import pickle
+
+import numpy as np
+import qmla
+
+
+def test_plot_probes_loaded_once(tmp_path):
+    probes_plot_file = str(tmp_path / "plot_probes.p")
+    plot_probes = {1: np.array([1, 0])}
+    with open(probes_plot_file, "wb") as f:
+        pickle.dump(plot_probes, f)
+
+    first = qmla.worker_cache.get_plot_probes(probes_plot_file)
+    os.remove(probes_plot_file)
+    second = qmla.worker_cache.get_plot_probes(probes_plot_file)
+    assert second is first
+    assert np.array_equal(second[1], plot_probes[1])
+
+    qmla.worker_cache.clear_worker_cache()